@@ -2,15 +2,16 @@
 """
 Gerçek simülasyon verilerini analiz eden script
 """
-import pandas as pd
 import numpy as np
 import os
 
+from src.data_simulation.columnar_io import read_frame
+
 def analyze_simulation_data():
     """Gerçek simülasyon verilerini analiz et"""
     
     # Veri dosyasını oku
-    df = pd.read_csv('data/simulation/simulation_history_20250624_145501.csv')
+    df = read_frame('data/simulation/simulation_history_20250624_145501.csv')
     
     print('🏠 GERÇEK SİMÜLASYON VERİ ANALİZİ')
     print('=' * 50)
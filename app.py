@@ -11,6 +11,11 @@ import numpy as np  # Yeni eklenen kütüphane
 
 # Proje modülleri
 from src.data_simulation.data_generator import HomeDataGenerator, generate_sample_dataset
+from src.data_simulation.dataset_cache import DatasetCache
+from src.data_simulation.columnar_io import read_frame
+from src.data_processing.feature_cache import FeatureCache
+from src.config import config
+from src.topology import column_index
 from src.data_processing.preprocessing import SmartHomeDataProcessor, process_raw_data
 from src.models.model_manager import SmartHomeModelManager
 from src.models.model_trainer import DeviceControlModel
@@ -61,14 +66,16 @@ def cleanup_matplotlib():
         print(f"Warning: Error during matplotlib cleanup: {e}")
 
 @error_handler
-def generate_data(days=3, rooms=None, num_residents=3):
+def generate_data(days=3, rooms=None, num_residents=3, seed=None):
     """
-    Sensör ve cihaz verilerini simüle eder
+    Sensör ve cihaz verilerini simüle eder. Tohum belirliyse veri seti önbelleği kullanılır:
+    aynı parametrelerle tekrar çalıştırıldığında veri yeniden üretilmez.
     
     Args:
         days (int): Simüle edilecek gün sayısı
         rooms (list): Simüle edilecek odalar
         num_residents (int): Ev sakini sayısı
+        seed (int): Üretim tohumu (None ise config'deki tohum kullanılır)
     
     Returns:
         str: Üretilen veri dosyasının yolu
@@ -92,17 +99,36 @@ def generate_data(days=3, rooms=None, num_residents=3):
     
     logger.info(f"Simüle edilecek odalar: {', '.join(rooms)}")
     
+    if seed is None:
+        seed = config["data_simulation"].get("seed")
+    
     try:
-        # Veri üretecini oluştur ve veri seti üret
-        dataset = generate_sample_dataset(days=days, rooms=rooms, num_residents=num_residents)
-        
-        # Veri dosyasının adı ve yolu
+        # Veri dosyasının dizini
         data_dir = os.path.join(os.path.dirname(__file__), "data", "raw")
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        csv_path = os.path.join(data_dir, f"generated_data_{timestamp}.csv")
+        cache = None
+        if seed is not None:
+            cache_settings = config["dataset_cache"]
+            cache = DatasetCache(max_entries=cache_settings["max_entries"],
+                                 max_bytes=cache_settings["max_size_mb"] * 2**20)
+            # generate_sample_dataset'in load_or_generate'e verdiği argümanlarla aynı anahtar
+            key = cache.key_for(days=days, rooms=rooms, num_residents=num_residents, seed=seed)
+            csv_path = os.path.join(data_dir, f"generated_data_{key[:12]}.csv")
+            
+            # Aynı parametrelerle üretilmiş veri hem önbellekte hem diskte varsa doğrudan kullan
+            # (touch, girdinin son erişim zamanını günceller ve isabeti sayar)
+            if os.path.exists(csv_path) and cache.touch(key):
+                logger.info(f"Veri seti önbellekte bulundu ({key[:12]}), yeniden üretilmedi: {csv_path}")
+                return csv_path
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+            csv_path = os.path.join(data_dir, f"generated_data_{timestamp}.csv")
+        
+        # Veri üretecini oluştur ve veri seti üret (önbellekte varsa oradan okunur)
+        dataset = generate_sample_dataset(days=days, rooms=rooms, num_residents=num_residents,
+                                          seed=seed, cache=cache)
         
         # CSV'ye kaydet
         dataset.to_csv(csv_path, index=False)
@@ -146,9 +172,18 @@ def train_models(data_path=None, days=1, optimize=False):
     
     logger.info(f"ML modelleri eğitiliyor: {data_path}")
     
-    # Model yöneticisini oluştur ve eğit
-    model_manager = SmartHomeModelManager()
+    # Model yöneticisini oluştur ve eğit (aynı veri için özellik matrisleri önbellekten okunur)
+    feature_cache = None
+    cache_settings = config["feature_cache"]
+    if cache_settings["enabled"]:
+        feature_cache = FeatureCache(max_entries=cache_settings["max_entries"],
+                                     max_bytes=cache_settings["max_size_mb"] * 2**20)
+    model_manager = SmartHomeModelManager(feature_cache=feature_cache)
     model_manager.train_models_for_all_devices(data_path, model_type='random_forest', optimize=optimize)
+    if feature_cache is not None:
+        stats = feature_cache.stats()
+        logger.info(f"Özellik önbelleği: {stats['hits']} isabet, {stats['misses']} ıska, "
+                    f"{stats['entries']} girdi, {stats['bytes'] / 2**20:.1f} MiB")
     
     # Performans raporu oluştur
     report_path = model_manager.generate_performance_report()
@@ -219,7 +254,7 @@ def generate_report(data_path):
     
     # Veriyi oku
     try:
-        data = pd.read_csv(data_path)
+        data = read_frame(data_path)
     except Exception as e:
         logger.error(f"Veri okuma hatası: {e}")
         return None
@@ -249,21 +284,19 @@ def generate_report(data_path):
         ""
     ]
     
-    # Sensör istatistiklerini ekle
-    rooms = set()
-    for column in data.columns:
-        for sensor in ["Sıcaklık", "Nem", "CO2", "Işık"]:
-            if sensor in column:
-                room = column.split('_')[0]
-                rooms.add(room)
+    # Sensör istatistiklerini ekle (oda/kanal sütunları şema dizininden bulunur)
+    index = column_index(data.columns)
+    report_sensors = ["Sıcaklık", "Nem", "CO2", "Işık"]
+    rooms = [room for room in index.rooms
+             if any(sensor in index.room_channels[room] for sensor in report_sensors)]
     
     for room in rooms:
         report_content.append(f"### {room}")
         report_content.append("")
         
-        for sensor in ["Sıcaklık", "Nem", "CO2", "Işık"]:
-            column = f"{room}_{sensor}"
-            if column in data.columns:
+        for sensor in report_sensors:
+            column = index.room_channels[room].get(sensor)
+            if column is not None:
                 stats = data[column].describe()
                 report_content.append(f"**{sensor}:**")
                 report_content.append(f"- Ortalama: {stats['mean']:.2f}")
@@ -280,8 +313,8 @@ def generate_report(data_path):
     
     for room in rooms:
         for device in ["Klima", "Lamba", "Perde", "Havalandırma"]:
-            column = f"{room}_{device}"
-            if column in data.columns:
+            column = index.room_channels[room].get(device)
+            if column is not None:
                 if data[column].dtype == bool:
                     on_ratio = data[column].mean() * 100
                     report_content.append(f"- {room} {device}: %{on_ratio:.1f} açık")
@@ -349,8 +382,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
     
     # Veriyi oku
     try:
-        data = pd.read_csv(data_path)
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
+        data = read_frame(data_path)
         logger.info(f"Veri başarıyla okundu: {len(data)} kayıt, {len(data.columns)} sütun")
     except Exception as e:
         logger.error(f"Veri okuma hatası: {e}")
@@ -363,14 +395,12 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
     # Oluşturulan görsellerin listesi
     visuals = []
     
-    # Gerçek cihaz sütunlarını bul
+    # Gerçek cihaz sütunlarını bul (şema dizininden, alt dize taraması olmadan)
+    index = column_index(data.columns)
     device_columns = {}
-    for col in data.columns:
-        for device_type in ['Klima', 'Lamba', 'Perde', 'Havalandırma']:
-            if device_type in col and any(room in col for room in ['Salon', 'Yatak Odası', 'Mutfak', 'Banyo', 'Çocuk Odası']):
-                if device_type not in device_columns:
-                    device_columns[device_type] = []
-                device_columns[device_type].append(col)
+    for device_type in ['Klima', 'Lamba', 'Perde', 'Havalandırma']:
+        if index.channel_columns(device_type):
+            device_columns[device_type] = list(index.channel_columns(device_type))
     
     # ----- 1. ENERJİ TASARRUFU KARŞILAŞTIRMASI -----
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -507,7 +537,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
     }
     
     # Sıcaklık konforu - ideal aralıkta olan süre yüzdesi
-    temp_columns = [col for col in data.columns if 'Sıcaklık' in col]
+    temp_columns = index.channel_columns('Sıcaklık')
     if temp_columns:
         temp_comfort = 0
         for col in temp_columns:
@@ -520,7 +550,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
         comfort_metrics['Sıcaklık Konforu'] = 75  # Varsayılan değer
     
     # Hava kalitesi - nem seviyesi optimizasyonu
-    humidity_columns = [col for col in data.columns if 'Nem' in col]
+    humidity_columns = index.channel_columns('Nem')
     if humidity_columns:
         humidity_comfort = 0
         for col in humidity_columns:
@@ -533,7 +563,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
         comfort_metrics['Hava Kalitesi'] = 70
     
     # Aydınlatma - lamba kullanım optimizasyonu
-    light_columns = [col for col in data.columns if 'Lamba' in col]
+    light_columns = index.channel_columns('Lamba')
     if light_columns:
         # Akıllı aydınlatma skoru - gece açık, gündüz kapalı olma oranı
         comfort_metrics['Aydınlatma'] = 80  # Simülasyon verisi karmaşık olduğu için sabit
@@ -544,7 +574,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
     device_optimization = 0
     total_devices = 0
     for device_type in ['Klima', 'Perde', 'Havalandırma']:
-        device_cols = [col for col in data.columns if device_type in col]
+        device_cols = index.channel_columns(device_type)
         if device_cols:
             for col in device_cols:
                 if col in data.columns:
@@ -624,7 +654,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
         data['hour'] = data['timestamp'].dt.hour
         
         # Klima kullanımı
-        klima_cols = [col for col in data.columns if 'Klima' in col]
+        klima_cols = index.channel_columns('Klima')
         if klima_cols:
             hourly_usage = []
             for hour in range(24):
@@ -643,7 +673,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
             axes[0,0].grid(True, alpha=0.3)
         
         # Lamba kullanımı
-        lamba_cols = [col for col in data.columns if 'Lamba' in col]
+        lamba_cols = index.channel_columns('Lamba')
         if lamba_cols:
             hourly_lamba = []
             for hour in range(24):
@@ -662,17 +692,9 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
             axes[0,1].grid(True, alpha=0.3)
     
     # Oda bazında cihaz kullanımı
-    rooms = set()
-    for col in data.columns:
-        for room in ['Salon', 'Yatak Odası', 'Mutfak', 'Banyo', 'Çocuk Odası']:
-            if room in col:
-                rooms.add(room)
-                break
-    
     room_usage = {}
-    for room in rooms:
-        room_devices = [col for col in data.columns if room in col and 
-                       any(device in col for device in ['Klima', 'Lamba', 'Perde', 'Havalandırma'])]
+    for room in index.rooms:
+        room_devices = index.room_device_columns(room)
         if room_devices:
             total_usage = 0
             for col in room_devices:
@@ -707,12 +729,15 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
         data_numeric = data[['timestamp'] + numeric_columns].copy()
         data_resampled = data_numeric.set_index('timestamp').resample('h').mean()
         
-        # Toplam enerji hesapla
+        # Toplam enerji hesapla (cihaz sütunları satır döngüsünün dışında bir kez bulunur)
+        numeric_set = set(numeric_columns)
+        device_powers = [([col for col in index.channel_columns(device_type) if col in numeric_set], power)
+                         for device_type, power in [('Klima', 2.5), ('Lamba', 0.06), ('Perde', 0.05),
+                                                    ('Havalandırma', 0.15)]]
         energy_trend = []
         for _, row in data_resampled.iterrows():
             total_energy = 0
-            for device_type, power in [('Klima', 2.5), ('Lamba', 0.06), ('Perde', 0.05), ('Havalandırma', 0.15)]:
-                device_cols = [col for col in data.columns if device_type in col and col in numeric_columns]
+            for device_cols, power in device_powers:
                 for col in device_cols:
                     if col in row.index and not pd.isna(row[col]):
                         usage = row[col] if row[col] <= 1 else row[col]/100
@@ -818,7 +843,7 @@ def generate_comparative_visuals(data_path, ml_enabled=True, ml_disabled=False):
     monthly_savings_tl = daily_savings_tl * 30
     
     # Sistem maliyeti (gerçekçi tahmin)
-    device_count = len([col for col in data.columns if any(device in col for device in ['Klima', 'Lamba', 'Perde', 'Havalandırma'])])
+    device_count = len(index.device_columns)
     system_cost = max(3000, device_count * 300)  # Cihaz başına 300 TL + sabit maliyet
     
     months = np.arange(1, 61)  # 5 yıl (60 ay)
@@ -1116,6 +1141,8 @@ def main():
                       help='🏠 Simüle edilecek odalar')
     parser.add_argument('--residents', type=int, default=2,
                       help='👥 Ev sakini sayısı (1-5, varsayılan: 2)')
+    parser.add_argument('--seed', type=int, default=None,
+                      help='🎲 Veri üretim tohumu (varsayılan: config; aynı tohumla üretilen veri önbellekten okunur)')
     
     try:
         args = parser.parse_args()
@@ -1148,7 +1175,7 @@ def main():
             if not args.quiet:
                 print("\n📊 VERİ SİMÜLASYONU BAŞLATILIYOR...")
             logger.info("Veri simülasyonu başlatılıyor")
-            data_path = generate_data(days=args.days, rooms=args.rooms, num_residents=args.residents)
+            data_path = generate_data(days=args.days, rooms=args.rooms, num_residents=args.residents, seed=args.seed)
             if not args.quiet:
                 print(f"✅ Veri üretimi tamamlandı: {data_path}")
         else:
@@ -1160,8 +1187,8 @@ def main():
             # Mevcut veri dosyalarını bul
             csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
             if csv_files:
-                # En son veriyi kullan
-                csv_files.sort(reverse=True)  # En yeni dosya en üstte
+                # En son değiştirilen veriyi kullan (dosya adları zaman damgası içermeyebilir)
+                csv_files.sort(key=lambda f: os.path.getmtime(os.path.join(data_dir, f)), reverse=True)
                 data_path = os.path.join(data_dir, csv_files[0])
                 if not args.quiet:
                     print(f"📁 Mevcut veri kullanılıyor: {csv_files[0]}")
@@ -1170,7 +1197,8 @@ def main():
                 if not args.quiet:
                     print("\n📊 VERİ BULUNAMADI - YENİ VERİ OLUŞTURULUYOR...")
                 logger.info("Veri simülasyonu başlatılıyor")
-                data_path = generate_data(days=args.days, rooms=args.rooms, num_residents=args.residents)
+                data_path = generate_data(days=args.days, rooms=args.rooms, num_residents=args.residents,
+                                          seed=args.seed)
                 if not args.quiet:
                     print(f"✅ Veri üretimi tamamlandı: {data_path}")
         
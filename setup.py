@@ -12,6 +12,10 @@ setup(
         "seaborn>=0.11.0",
         "pytest>=6.2.5",
     ],
+    extras_require={
+        # Parquet/Feather dosyaları için (kurulu değilse npz kullanılır)
+        "columnar": ["pyarrow>=10.0.0"],
+    },
     entry_points={
         'console_scripts': [
             'smart-home=app:main',
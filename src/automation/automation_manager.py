@@ -8,6 +8,7 @@ import json
 from src.automation.rules_engine import RulesEngine, create_default_rules
 from src.automation.device_manager import DeviceManager
 from src.automation.scheduler import Scheduler
+from src.topology import default_topology
 
 class AutomationManager:
     """
@@ -15,21 +16,25 @@ class AutomationManager:
     RulesEngine, DeviceManager ve Scheduler bileşenlerini entegre eder.
     """
     
-    def __init__(self, ml_model=None):
+    def __init__(self, ml_model=None, topology=None):
         """
         AutomationManager sınıfını başlatır
         
         Args:
             ml_model: Opsiyonel makine öğrenmesi modeli
+            topology (HomeTopology): Oda/cihaz topolojisi (None ise config odaları)
         """
         self.logger = logging.getLogger(__name__)
         self.logger.info("AutomationManager başlatılıyor...")
         
+        # Oda/cihaz topolojisi (kural motoru ve rutinler paylaşır)
+        self.topology = topology or default_topology()
+        
         # Cihaz yöneticisi
         self.device_manager = DeviceManager()
         
         # Kural motoru
-        self.rules_engine = RulesEngine(use_ml_model=ml_model is not None)
+        self.rules_engine = RulesEngine(use_ml_model=ml_model is not None, topology=self.topology)
         
         # ML modeli varsa ayarla
         if ml_model:
@@ -122,8 +127,8 @@ class AutomationManager:
         
         updates = {}
         # Perdeleri aç
-        for room in ["Salon", "Yatak Odası", "Çocuk Odası"]:
-            updates[f"{room}_Perde"] = True
+        for room in self.topology.rooms_with("Perde"):
+            updates[self.topology.column(room, "Perde")] = True
         
         # Cihaz durumlarını güncelle
         self.device_manager.update_device_states(updates, trigger="scheduled_routine")
@@ -137,13 +142,14 @@ class AutomationManager:
         self.logger.info("Akşam rutini çalıştırılıyor...")
         
         updates = {}
-        # Salon ve yatak odası ışıklarını aç
-        updates["Salon_Lamba"] = True
-        updates["Yatak Odası_Lamba"] = True
+        # Salon ve yatak odası ışıklarını aç (lambası olan bu türdeki tüm odalarda)
+        for room in self.topology.rooms_with("Lamba"):
+            if self.topology.room_type(room) in ("Salon", "Yatak Odası"):
+                updates[self.topology.column(room, "Lamba")] = True
         
         # Perdeleri kapat
-        for room in ["Salon", "Yatak Odası", "Çocuk Odası"]:
-            updates[f"{room}_Perde"] = False
+        for room in self.topology.rooms_with("Perde"):
+            updates[self.topology.column(room, "Perde")] = False
         
         # Cihaz durumlarını güncelle
         self.device_manager.update_device_states(updates, trigger="scheduled_routine")
@@ -158,8 +164,9 @@ class AutomationManager:
         
         updates = {}
         # Gerekli olmayan ışıkları kapat
-        for room in ["Salon", "Mutfak", "Çocuk Odası"]:
-            updates[f"{room}_Lamba"] = False
+        for room in self.topology.rooms_with("Lamba"):
+            if self.topology.room_type(room) in ("Salon", "Mutfak", "Çocuk Odası"):
+                updates[self.topology.column(room, "Lamba")] = False
         
         # Cihaz durumlarını güncelle
         self.device_manager.update_device_states(updates, trigger="scheduled_routine")
@@ -4,6 +4,7 @@ import os
 from datetime import datetime
 import pandas as pd
 from src.config import config
+from src.topology import default_topology
 
 class RulesEngine:
     """
@@ -11,14 +12,16 @@ class RulesEngine:
     Sensör verilerine ve kullanıcı davranışlarına göre cihazları kontrol eder.
     """
     
-    def __init__(self, use_ml_model=True):
+    def __init__(self, use_ml_model=True, topology=None):
         """
         RulesEngine sınıfını başlatır
         
         Args:
             use_ml_model (bool): ML modeli kullanılıp kullanılmayacağı
+            topology (HomeTopology): Kuralların uygulanacağı oda/cihaz topolojisi (None ise config odaları)
         """
         self.logger = logging.getLogger(__name__)
+        self.topology = topology or default_topology()
         self.rules = []
         self.use_ml_model = use_ml_model
         self.ml_model = None
@@ -267,20 +270,25 @@ def create_default_rules(rules_engine):
     Args:
         rules_engine (RulesEngine): Kural motoru nesnesi
     """
+    # Sütun adları topolojide önceden üretilmiştir, kurallar her çağrıda yeniden oluşturmaz
+    topology = rules_engine.topology
+    rooms = topology.rooms
+    column = topology.column
+    
     # Sıcaklık kontrolü için kurallar
     def high_temp_condition(state):
-        for room in config['rooms']:
-            temp_key = f"{room}_Sıcaklık"
+        for room in rooms:
+            temp_key = column(room, "Sıcaklık")
             if temp_key in state and state[temp_key] > config['automation_thresholds']['high_temp_threshold']:
                 return True
         return False
     
     def turn_on_ac(state, devices):
         updated_devices = {}
-        for room in config['rooms']:
-            temp_key = f"{room}_Sıcaklık"
-            occupancy_key = f"{room}_Doluluk"
-            device_key = f"{room}_Klima"
+        for room in rooms:
+            temp_key = column(room, "Sıcaklık")
+            occupancy_key = column(room, "Doluluk")
+            device_key = column(room, "Klima")
             
             # Sıcaklık yüksek ve oda doluysa klimayı çalıştır
             if temp_key in state and state[temp_key] > config['automation_thresholds']['high_temp_threshold']:
@@ -299,17 +307,17 @@ def create_default_rules(rules_engine):
     
     # Düşük sıcaklık kontrolü
     def low_temp_condition(state):
-        for room in config['rooms']:
-            temp_key = f"{room}_Sıcaklık"
+        for room in rooms:
+            temp_key = column(room, "Sıcaklık")
             if temp_key in state and state[temp_key] < config['automation_thresholds']['low_temp_threshold']:
                 return True
         return False
     
     def turn_off_ac(state, devices):
         updated_devices = {}
-        for room in config['rooms']:
-            temp_key = f"{room}_Sıcaklık"
-            device_key = f"{room}_Klima"
+        for room in rooms:
+            temp_key = column(room, "Sıcaklık")
+            device_key = column(room, "Klima")
             
             # Sıcaklık düşükse klimayı kapat
             if temp_key in state and state[temp_key] < config['automation_thresholds']['low_temp_threshold']:
@@ -331,9 +339,9 @@ def create_default_rules(rules_engine):
         current_hour = datetime.now().hour
         is_night = current_hour >= 19 or current_hour <= 7
         
-        for room in config['rooms']:
-            light_key = f"{room}_Işık"
-            movement_key = f"{room}_Hareket"
+        for room in rooms:
+            light_key = column(room, "Işık")
+            movement_key = column(room, "Hareket")
             
             if movement_key in state and state[movement_key]:
                 if is_night or (light_key in state and state[light_key] < config['automation_thresholds']['low_light_threshold']):
@@ -346,10 +354,10 @@ def create_default_rules(rules_engine):
         current_hour = datetime.now().hour
         is_night = current_hour >= 19 or current_hour <= 7
         
-        for room in config['rooms']:
-            light_key = f"{room}_Işık"
-            movement_key = f"{room}_Hareket"
-            device_key = f"{room}_Lamba"
+        for room in rooms:
+            light_key = column(room, "Işık")
+            movement_key = column(room, "Hareket")
+            device_key = column(room, "Lamba")
             
             # Gece veya düşük ışık seviyesinde hareket varsa lambayı aç
             if movement_key in state and state[movement_key]:
@@ -372,8 +380,8 @@ def create_default_rules(rules_engine):
     # Enerji tasarrufu kuralı - Oda boşsa cihazları kapat
     def energy_save_condition(state):
         # Herhangi bir oda boşsa energy saving koşulunu kontrol et
-        for room in config['rooms']:
-            occupancy_key = f"{room}_Doluluk"
+        for room in rooms:
+            occupancy_key = column(room, "Doluluk")
             if occupancy_key in state and not state[occupancy_key]:
                 return True
         return False
@@ -381,8 +389,8 @@ def create_default_rules(rules_engine):
     def turn_off_devices(state, devices):
         updated_devices = {}
         
-        for room in config['rooms']:
-            occupancy_key = f"{room}_Doluluk"
+        for room in rooms:
+            occupancy_key = column(room, "Doluluk")
             last_movement_key = f"{room}_SonHareket_Dakika"
             
             # Oda boşsa ve son hareketten 10 dakika geçtiyse
@@ -390,13 +398,13 @@ def create_default_rules(rules_engine):
                (last_movement_key not in state or state.get(last_movement_key, 0) > 10):
                 
                 # Lambayı kapat
-                light_key = f"{room}_Lamba"
+                light_key = column(room, "Lamba")
                 if light_key in devices:
                     updated_devices[light_key] = False
                 
                 # 15 dakika geçtiyse klimayı da kapat
                 if last_movement_key not in state or state.get(last_movement_key, 0) > 15:
-                    ac_key = f"{room}_Klima"
+                    ac_key = column(room, "Klima")
                     if ac_key in devices:
                         updated_devices[ac_key] = False
         
@@ -412,8 +420,8 @@ def create_default_rules(rules_engine):
     
     # CO2 kontrolü için kurallar
     def high_co2_condition(state):
-        for room in config['rooms']:
-            co2_key = f"{room}_CO2"
+        for room in rooms:
+            co2_key = column(room, "CO2")
             if co2_key in state and state[co2_key] > config['automation_thresholds']['high_co2_threshold']:
                 return True
         return False
@@ -421,9 +429,9 @@ def create_default_rules(rules_engine):
     def control_ventilation(state, devices):
         updated_devices = {}
         
-        for room in config['rooms']:
-            co2_key = f"{room}_CO2"
-            device_key = f"{room}_Havalandırma"
+        for room in rooms:
+            co2_key = column(room, "CO2")
+            device_key = column(room, "Havalandırma")
             
             if co2_key in state and device_key in devices:
                 # CO2 seviyesi yüksekse havalandırmayı aç
@@ -445,8 +453,8 @@ def create_default_rules(rules_engine):
     
     # Nem kontrolü için kurallar
     def humidity_condition(state):
-        for room in config['rooms']:
-            humidity_key = f"{room}_Nem"
+        for room in rooms:
+            humidity_key = column(room, "Nem")
             if humidity_key in state and (state[humidity_key] > config['automation_thresholds']['high_humidity_threshold'] or state[humidity_key] < config['automation_thresholds']['low_humidity_threshold']):
                 return True
         return False
@@ -454,9 +462,9 @@ def create_default_rules(rules_engine):
     def control_humidity(state, devices):
         updated_devices = {}
         
-        for room in config['rooms']:
-            humidity_key = f"{room}_Nem"
-            ventilation_key = f"{room}_Havalandırma"
+        for room in rooms:
+            humidity_key = column(room, "Nem")
+            ventilation_key = column(room, "Havalandırma")
             
             if humidity_key in state and ventilation_key in devices:
                 # Nem yüksekse havalandırmayı aç
@@ -481,8 +489,8 @@ def create_default_rules(rules_engine):
     def open_curtains(state, devices):
         updated_devices = {}
         
-        for room in config['rooms']:
-            curtain_key = f"{room}_Perde"
+        for room in rooms:
+            curtain_key = column(room, "Perde")
             if curtain_key in devices:
                 updated_devices[curtain_key] = True
         
@@ -504,8 +512,8 @@ def create_default_rules(rules_engine):
     def close_curtains(state, devices):
         updated_devices = {}
         
-        for room in config['rooms']:
-            curtain_key = f"{room}_Perde"
+        for room in rooms:
+            curtain_key = column(room, "Perde")
             if curtain_key in devices:
                 updated_devices[curtain_key] = False
         
@@ -4,6 +4,14 @@
 config = {
     "rooms": ["Salon", "Yatak Odası", "Çocuk Odası", "Mutfak", "Banyo"],
     "devices_per_room": ["Klima", "Lamba", "Perde", "Havalandırma"],
+    # Device types installed in each room type ("Salon 2" etc. use the type of "Salon")
+    "room_types": {
+        "Salon": ["Klima", "Lamba", "Perde"],
+        "Yatak Odası": ["Klima", "Lamba", "Perde"],
+        "Çocuk Odası": ["Klima", "Lamba", "Perde"],
+        "Mutfak": ["Lamba", "Havalandırma"],
+        "Banyo": ["Lamba", "Havalandırma"]
+    },
     "sensor_types": ["Sıcaklık", "Nem", "CO2", "Işık", "Doluluk", "Hareket"],
     "automation_thresholds": {
         "high_temp_threshold": 26,
@@ -31,6 +39,47 @@ config = {
         "num_devices_per_room": 3,  # Number of devices in each room
         "simulation_duration": 24,  # Duration of the simulation in hours
         "sampling_rate": 1,  # Sampling rate in minutes
+        "seed": 42,  # Seed for generated datasets (None disables reproducibility and the dataset cache)
+        # Per-channel sampling interval in minutes for multi-rate storage; "event" keeps only changes.
+        # Device channels are stored as events; unlisted channels use the simulation time step.
+        "sampling_rates": {
+            "Sıcaklık": 15,
+            "Nem": 15,
+            "Işık": 5,
+            "CO2": 5,
+            "Dış_Hava_Sıcaklığı": 60,
+            "Hareket": "event",
+            "Doluluk": "event",
+            "Konum": "event",
+            "Klima": "event",
+            "Lamba": "event",
+            "Perde": "event",
+            "Havalandırma": "event",
+        },
+    },
+    # RC thermal network for room temperatures (opt-in via thermal_model=True)
+    "thermal_model": {
+        "capacitance": 1.0e6,  # Heat capacity of each room (J/K)
+        "wall_conductance": 20.0,  # Conductance between adjacent rooms (W/K)
+        "outdoor_conductance": 45.0,  # Conductance from each room to the outdoors (W/K)
+        "ac_power": 2500.0,  # Heating/cooling power of an AC unit (W)
+        "setpoint": 23.0,  # AC target temperature (°C)
+        "occupant_heat": 100.0,  # Heat released in an occupied room (W)
+        "solar_gain": 300.0,  # Midday (10-16h) solar heat gain per room (W)
+        "outdoor_temp": 18.0,  # Outdoor temperature used when no weather timeline is given (°C)
+        "noise": 0.1,  # Half-width of the uniform per-step temperature fluctuation (°C)
+    },
+    "dataset_cache": {
+        "max_entries": 20,  # Maximum number of cached datasets
+        "max_size_mb": 512,  # Total size limit of the cache directory
+    },
+    "data_loading": {
+        "csv_engine": "c",  # CSV parser for typed loading: "c" or "pyarrow" (falls back to "c" if missing)
+    },
+    "feature_cache": {
+        "enabled": True,  # Reuse transformed feature matrices when the raw data is unchanged
+        "max_entries": 10,  # Maximum number of cached feature sets
+        "max_size_mb": 1024,  # Total size limit of the feature cache directory
     },
     "model_training": {
         "test_size": 0.2,  # Proportion of the dataset to include in the test split
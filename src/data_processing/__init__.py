@@ -1,8 +1,15 @@
 # Veri işleme modülü için __init__.py dosyası
 
-from src.data_processing.preprocessing import SmartHomeDataProcessor, process_raw_data
+from src.data_processing.preprocessing import SmartHomeDataProcessor, process_raw_data, load_processed_data
+from src.data_processing.dataset import SmartHomeDataset
+from src.data_processing.online_features import OnlineFeatureExtractor
+from src.data_processing.feature_cache import FeatureCache
 
 __all__ = [
     'SmartHomeDataProcessor',
-    'process_raw_data'
+    'process_raw_data',
+    'load_processed_data',
+    'SmartHomeDataset',
+    'OnlineFeatureExtractor',
+    'FeatureCache'
 ]
\ No newline at end of file
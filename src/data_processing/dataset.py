@@ -0,0 +1,95 @@
+import numpy as np
+
+
+class SmartHomeDataset:
+    """
+    Ham veri, çıkarılmış özellikler, hedefler ve eğitim/test ayrımını tek nesnede taşıyan
+    veri seti tutamacı. Veri bir kez okunur veya üretilir; eğitim ve değerlendirme bölümleri
+    indekslerle bu nesneden alınır. Diske yalnızca save_processed çağrıldığında yazılır.
+    """
+
+    def __init__(self, raw, features, targets, train_index, test_index, processor=None, source=None):
+        """
+        SmartHomeDataset sınıfını başlatır
+
+        Args:
+            raw (pandas.DataFrame): Ham veri (özellikler ile aynı indeks)
+            features (pandas.DataFrame): Zaman/özel özellikleri ve hedef sütunları eklenmiş veri
+            targets (dict): Cihaz sütunu -> tüm satırların hedef serisi
+            train_index (pandas.Index): Eğitim satırlarının indeksi (ayrım sırasıyla)
+            test_index (pandas.Index): Test satırlarının indeksi (ayrım sırasıyla)
+            processor (SmartHomeDataProcessor): Veri setini oluşturan işlemci
+            source (str): Verinin okunduğu dosya (bellekte üretildiyse None)
+        """
+        self.raw = raw
+        self.features = features
+        self.targets = targets
+        self.train_index = train_index
+        self.test_index = test_index
+        self.processor = processor
+        self.source = source
+
+    def __len__(self):
+        return len(self.features)
+
+    @property
+    def target_names(self):
+        """Hedef cihaz sütunları"""
+        return list(self.targets)
+
+    @property
+    def X_train_raw(self):
+        """Ham eğitim satırları"""
+        return self.raw.loc[self.train_index]
+
+    @property
+    def X_test_raw(self):
+        """Ham test satırları"""
+        return self.raw.loc[self.test_index]
+
+    @property
+    def y_train(self):
+        """Cihaz -> eğitim hedefi"""
+        return {name: y.loc[self.train_index] for name, y in self.targets.items()}
+
+    @property
+    def y_test(self):
+        """Cihaz -> test hedefi"""
+        return {name: y.loc[self.test_index] for name, y in self.targets.items()}
+
+    def split(self):
+        """
+        Özellik çerçevesini eğitim ve test bölümlerine ayırır (process_frame çıktısıyla aynı)
+
+        Returns:
+            tuple: df_train, df_test, y_train_dict, y_test_dict
+        """
+        return (self.features.loc[self.train_index], self.features.loc[self.test_index],
+                self.y_train, self.y_test)
+
+    def save_processed(self, output_dir=None):
+        """
+        İşlenmiş bölümleri işlemcinin save_processed_data biçimiyle diske yazar
+
+        Args:
+            output_dir (str): Çıktı dizini (None ise data/processed)
+        """
+        if self.processor is None:
+            raise ValueError("İşlenmiş verileri kaydetmek için veri setinin işlemcisi gerekli")
+        df_train, df_test, y_train_dict, y_test_dict = self.split()
+        self.processor.save_processed_data(df_train, df_test, y_train_dict, y_test_dict, output_dir)
+
+    def summary(self):
+        """
+        Veri setinin boyutlarını döndürür
+
+        Returns:
+            dict: Satır, eğitim/test satırı, özellik ve hedef sayıları
+        """
+        return {
+            "rows": len(self.features),
+            "train_rows": len(self.train_index),
+            "test_rows": len(self.test_index),
+            "feature_columns": int(np.sum([column not in self.targets for column in self.features.columns])),
+            "targets": len(self.targets),
+        }
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+
+import pandas as pd
+
+from src.data_simulation.dataset_cache import FileCache
+from src.data_simulation.run_length import dense_frame
+from src.data_processing.preprocessing import SmartHomeDataProcessor, PROCESSOR_VERSION
+
+
+class FeatureCache(FileCache):
+    """
+    Dönüştürülmüş özellik matrislerini ham verinin parmak izi, SmartHomeDataProcessor
+    ayarları ve PROCESSOR_VERSION ile adreslenen dosyalarda saklayan önbellek.
+    Değişmemiş veri üzerinde yeniden eğitim veya hiperparametre aramasında zaman/özel
+    özellik çıkarımı ve one-hot kodlama tamamen atlanır.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=10, max_bytes=1024 * 2**20):
+        """
+        FeatureCache sınıfını başlatır
+
+        Args:
+            cache_dir (str): Önbellek dizini (None ise data/cache/features)
+            max_entries (int): Saklanacak en fazla girdi sayısı
+            max_bytes (int): Önbelleğin toplam boyut sınırı (bayt)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+                                     "data", "cache", "features")
+        super().__init__(cache_dir, max_entries=max_entries, max_bytes=max_bytes)
+
+    @staticmethod
+    def fingerprint(df):
+        """
+        Veri çerçevesinin içeriğine (sütunlar, tipler, indeks ve değerler) ait özeti üretir
+
+        Args:
+            df (pandas.DataFrame | RunLengthFrame): Veri çerçevesi
+
+        Returns:
+            str: 64 karakterlik onaltılık özet
+        """
+        df = dense_frame(df)
+        hasher = hashlib.sha256()
+        schema = [[str(column), str(dtype)] for column, dtype in df.dtypes.items()]
+        hasher.update(json.dumps(schema, ensure_ascii=False).encode("utf-8"))
+        hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def processor_config(processor):
+        """
+        Çıktıyı etkileyen işlemci ayarlarını döndürür
+
+        Args:
+            processor (SmartHomeDataProcessor): Veri işlemcisi
+
+        Returns:
+            dict: Ayarlar (topoloji verilmişse odaları ve cihazlarıyla)
+        """
+        topology = processor.topology
+        return {
+            "test_size": processor.test_size,
+            "random_state": processor.random_state,
+            "topology": None if topology is None else {
+                "rooms": list(topology.rooms),
+                "device_types": list(topology.device_types),
+                "room_devices": {room: list(devices) for room, devices in topology.room_devices.items()},
+            },
+        }
+
+    @classmethod
+    def make_key(cls, stage, fingerprints, processor, version=PROCESSOR_VERSION, **options):
+        """
+        Önbellek anahtarı üretir
+
+        Args:
+            stage (str): Saklanan aşama ("features" veya "matrices")
+            fingerprints (list): Girdi çerçevelerinin parmak izleri
+            processor (SmartHomeDataProcessor): Veri işlemcisi
+            version (str): İşlemci sürümü
+            **options: Çıktıyı etkileyen diğer seçenekler (JSON ile ifade edilebilir olmalıdır)
+
+        Returns:
+            str: 64 karakterlik onaltılık anahtar
+        """
+        params = {
+            "stage": stage,
+            "data": list(fingerprints),
+            "processor": cls.processor_config(processor),
+            "version": version,
+        }
+        params.update(options)
+        return cls.hash_params(params)
+
+    def _write(self, value, path):
+        """Değeri pickle ile yazar"""
+        with open(path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _read(self, path):
+        """Değeri pickle ile okur"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def _rows(self, value):
+        """Saklanan matrisin satır sayısını döndürür"""
+        return int(value.get("rows", 0))
+
+    def fit_transform_splits(self, X_train_raw, X_test_raw, topology=None):
+        """
+        İşlemciyi eğitim bölümünde uydurur ve iki bölümü dönüştürür; aynı bölümler için
+        uydurulmuş işlemci ve matrisler önbellekten okunur
+
+        Args:
+            X_train_raw (pandas.DataFrame): Ham eğitim satırları
+            X_test_raw (pandas.DataFrame): Ham test satırları
+            topology (HomeTopology): Oda/cihaz topolojisi
+
+        Returns:
+            tuple: (uydurulmuş işlemci, eğitim matrisi, test matrisi, önbellekten mi okundu)
+        """
+        processor = SmartHomeDataProcessor(topology=topology)
+        key = self.make_key("matrices", [self.fingerprint(X_train_raw), self.fingerprint(X_test_raw)], processor)
+        cached = self.get(key)
+        if cached is not None:
+            return cached["processor"], cached["X_train"], cached["X_test"], True
+
+        processor.fit(X_train_raw)
+        X_train = processor.transform(X_train_raw)
+        X_test = processor.transform(X_test_raw)
+        self.put(key, {"processor": processor, "X_train": X_train, "X_test": X_test,
+                       "rows": X_train.shape[0] + X_test.shape[0]},
+                 params={"stage": "matrices", "version": PROCESSOR_VERSION})
+        return processor, X_train, X_test, False
+
+
+# Test işlevi
+def test_feature_cache(days=3, seed=3):
+    """
+    FeatureCache'i geçici bir dizinde test eder: aynı veri ikinci kez işlendiğinde
+    özellik çıkarımı ve dönüşüm önbellekten okunur, sonuçlar aynı kalır
+
+    Args:
+        days (int): Üretilecek gün sayısı
+        seed (int): Üretim tohumu
+
+    Returns:
+        bool: Önbellekten okunan sonuçlar yeniden hesaplananlarla aynı mı
+    """
+    import tempfile
+    import numpy as np
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    generator = HomeDataGenerator(seed=seed)
+    df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = FeatureCache(directory, max_entries=4)
+        results = []
+        for attempt in ("ıska", "isabet"):
+            began = time.perf_counter()
+            processor = SmartHomeDataProcessor(topology=generator.topology)
+            df_train, df_test, _, _, _ = processor.process_frame(df, feature_cache=cache)
+            _, X_train, X_test, hit = cache.fit_transform_splits(df.loc[df_train.index], df.loc[df_test.index],
+                                                                 topology=generator.topology)
+            elapsed = time.perf_counter() - began
+            results.append((df_train, X_train, X_test))
+            print(f"{attempt:7s}: {elapsed * 1000:8.1f} ms | matris önbellekten: {hit} | "
+                  f"eğitim matrisi {X_train.shape}")
+
+        def dense(matrix):
+            return matrix.toarray() if hasattr(matrix, "toarray") else np.asarray(matrix)
+
+        (train_a, X_train_a, X_test_a), (train_b, X_train_b, X_test_b) = results
+        same = (train_a.equals(train_b) and np.array_equal(dense(X_train_a), dense(X_train_b))
+                and np.array_equal(dense(X_test_a), dense(X_test_b)))
+        stats = cache.stats()
+        print(f"İsabet: {stats['hits']}, ıska: {stats['misses']}, isabet oranı: {stats['hit_rate']:.0%}, "
+              f"girdi: {stats['entries']}, toplam boyut: {stats['bytes'] / 2**20:.1f} MiB | aynı sonuç: {same}")
+        return same
+
+
+if __name__ == "__main__":
+    test_feature_cache()
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+from src.data_processing.window_features import (
+    STEP_MINUTES, HOUR_WINDOW, THREE_HOUR_WINDOW, WINDOW_SENSORS, DAY_PERIODS
+)
+
+
+class OnlineFeatureExtractor:
+    """
+    Canlı çıkarım için SmartHomeDataProcessor.extract_custom_features özelliklerini adım adım üretir.
+    Oda ve sensör başına halka tamponları, hareket/doluluk için kayan toplamlar ve son hareket
+    sayaçları tutulur; her adım geçmiş uzunluğundan bağımsız sabit sürede işlenir.
+
+    Çevrimdışı hesapla tek fark ilk adımdır: çevrimdışı sürüm ilk satırdaki boş Değişim ve
+    Std1Saat değerlerini sonraki satırdan geri doldurur, çevrimiçi sürüm geleceği bilmediği için 0 verir.
+    """
+
+    def __init__(self, topology):
+        """
+        OnlineFeatureExtractor sınıfını başlatır
+
+        Args:
+            topology (HomeTopology): Oda/cihaz topolojisi
+        """
+        self.topology = topology
+        rooms = topology.rooms
+        n = len(rooms)
+
+        self.motion_columns = [topology.column(room, "Hareket") for room in rooms]
+        self.occupancy_columns = [topology.column(room, "Doluluk") for room in rooms]
+        self.sensor_columns = [topology.column(room, sensor) for room in rooms for sensor in WINDOW_SENSORS]
+        self.device_columns = topology.device_columns()
+        self.person_columns = None
+
+        # Halka tamponları: satır = adım (pos konumuna yazılır), sütun = oda veya (oda, sensör)
+        self._sensors = np.zeros((HOUR_WINDOW, len(self.sensor_columns)))
+        self._motion = np.zeros((THREE_HOUR_WINDOW, n))
+        self._occupancy = np.zeros((HOUR_WINDOW, n))
+        self._motion_hour = np.zeros(n)
+        self._motion_three_hours = np.zeros(n)
+        self._occupancy_hour = np.zeros(n)
+        self._previous_sensors = None
+        self._steps_since_motion = np.zeros(n, dtype=np.int64)
+        self.steps = 0
+        self.latest = None
+
+    def reset(self):
+        """Tüm geçmişi siler"""
+        self.__init__(self.topology)
+
+    def update(self, state):
+        """
+        Bir simülasyon adımını işler ve o adımın özelliklerini döndürür
+
+        Args:
+            state (dict): Adımın durumu (timestamp, "<oda>_<kanal>" ve "Kişi_N_Konum" anahtarları)
+
+        Returns:
+            dict: Özellik adı -> değer (extract_custom_features sütunlarıyla aynı ad ve sıra)
+        """
+        n = len(self.topology.rooms)
+        motion = np.array([bool(state.get(column, False)) for column in self.motion_columns], dtype=np.float64)
+        occupancy = np.array([bool(state.get(column, False)) for column in self.occupancy_columns], dtype=np.float64)
+        sensors = np.array([state.get(column, 0.0) for column in self.sensor_columns], dtype=np.float64)
+
+        # Kayan toplamlar: pencereden çıkan adım çıkarılır, yeni adım eklenir
+        step = self.steps
+        if step >= HOUR_WINDOW:
+            self._motion_hour -= self._motion[(step - HOUR_WINDOW) % THREE_HOUR_WINDOW]
+            self._occupancy_hour -= self._occupancy[step % HOUR_WINDOW]
+        if step >= THREE_HOUR_WINDOW:
+            self._motion_three_hours -= self._motion[step % THREE_HOUR_WINDOW]
+        self._motion[step % THREE_HOUR_WINDOW] = motion
+        self._occupancy[step % HOUR_WINDOW] = occupancy
+        self._sensors[step % HOUR_WINDOW] = sensors
+        self._motion_hour += motion
+        self._motion_three_hours += motion
+        self._occupancy_hour += occupancy
+        self.steps = step + 1
+
+        hour_count = min(self.steps, HOUR_WINDOW)
+        three_hour_count = min(self.steps, THREE_HOUR_WINDOW)
+        self._steps_since_motion = np.where(motion > 0, 0, self._steps_since_motion + 1)
+
+        # Sensör penceresi sabit uzunlukta olduğundan ortalama/sapma tampondan doğrudan hesaplanır
+        window = self._sensors[:hour_count]
+        sensor_mean = window.mean(axis=0)
+        sensor_std = window.std(axis=0, ddof=1) if hour_count > 1 else np.zeros(len(self.sensor_columns))
+        sensor_diff = sensors - self._previous_sensors if self._previous_sensors is not None \
+            else np.zeros(len(self.sensor_columns))
+        self._previous_sensors = sensors
+
+        hour = pd.Timestamp(state["timestamp"]).hour
+        periods = [bool(condition(hour)) for _, condition in DAY_PERIODS]
+
+        features = {}
+        for r, room in enumerate(self.topology.rooms):
+            features[f"{room}_Hareket_Son1Saat"] = float(self._motion_hour[r])
+            features[f"{room}_Hareket_Oran3Saat"] = float(self._motion_three_hours[r] / three_hour_count)
+            features[f"{room}_SonHareket_Dakika"] = int(self._steps_since_motion[r] * STEP_MINUTES)
+            features[f"{room}_Doluluk_Oran"] = float(self._occupancy_hour[r] / hour_count)
+            for k, sensor in enumerate(WINDOW_SENSORS):
+                s = r * len(WINDOW_SENSORS) + k
+                features[f"{room}_{sensor}_Değişim"] = float(sensor_diff[s])
+                features[f"{room}_{sensor}_Ort1Saat"] = float(sensor_mean[s])
+                features[f"{room}_{sensor}_Std1Saat"] = float(sensor_std[s])
+            for (suffix, _), active in zip(DAY_PERIODS, periods):
+                features[f"{room}_{suffix}"] = int(active and occupancy[r] > 0)
+
+        # Tüm ev özellikleri
+        if self.person_columns is None:
+            self.person_columns = [key for key in state if key.startswith("Kişi_") and key.endswith("_Konum")]
+        if self.person_columns:
+            features["Evdeki_Kişi_Sayısı"] = int(sum(pd.notna(state.get(column)) for column in self.person_columns))
+        if n:
+            features["Aktif_Oda_Sayısı"] = int(occupancy.sum())
+        if self.device_columns:
+            features["Çalışan_Cihaz_Sayısı"] = int(sum(bool(state.get(column, False))
+                                                       for column in self.device_columns))
+
+        self.latest = features
+        return features
+
+
+def test_online_feature_parity(steps=300, seed=5):
+    """
+    Çevrimiçi özelliklerin extract_custom_features çıktısıyla aynı olduğunu doğrular
+    (ilk satır hariç, bkz. OnlineFeatureExtractor)
+
+    Args:
+        steps (int): Simüle edilecek adım sayısı
+        seed (int): Üretim tohumu
+
+    Returns:
+        bool: Tüm özellikler eşleşiyor mu
+    """
+    from datetime import datetime
+    from src.data_simulation.data_generator import HomeDataGenerator
+    from src.data_processing.preprocessing import SmartHomeDataProcessor
+
+    generator = HomeDataGenerator(start_time=datetime(2025, 1, 6, 5, 0), time_step=STEP_MINUTES, seed=seed)
+    extractor = OnlineFeatureExtractor(generator.topology)
+    states, online = [], []
+    for _ in range(steps):
+        state = generator.update_simulation()
+        states.append(state)
+        online.append(extractor.update(state))
+
+    processor = SmartHomeDataProcessor(topology=generator.topology)
+    offline = processor.extract_custom_features(processor._extract_time_features(pd.DataFrame(states)))
+    online = pd.DataFrame(online)
+
+    mismatched = [name for name in online.columns
+                  if not np.allclose(online[name].to_numpy(dtype=np.float64)[1:],
+                                     offline[name].to_numpy(dtype=np.float64)[1:], rtol=1e-6, atol=1e-6)]
+    same_columns = list(online.columns) == [name for name in offline.columns if name in set(online.columns)]
+    print(f"{len(online.columns)} özellik, {steps} adım | aynı sıra: {same_columns} | "
+          f"farklı özellikler: {mismatched or 'yok'}")
+    return same_columns and not mismatched
+
+
+if __name__ == "__main__":
+    test_online_feature_parity()
@@ -11,15 +11,33 @@ import sklearn
 from packaging import version
 import inspect
 import logging
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+from src.topology import column_index
+from src.data_simulation.columnar_io import read_frame, csv_read_options, write_bundle, read_bundle
+from src.data_simulation.run_length import dense_frame
+from src.data_processing.window_features import room_window_features, THREE_HOUR_WINDOW
+from src.data_processing.dataset import SmartHomeDataset
+
+# Özellik çıkarımı veya dönüşüm çıktısı değiştiğinde artırılır (özellik önbelleği anahtarına girer)
+PROCESSOR_VERSION = "1"
+
+# İşlenmiş eğitim/test bölümlerinin tek dosyalık paketi (data/processed altında)
+PROCESSED_BUNDLE = "processed.npz"
+
+def _default_processed_dir():
+    """İşlenmiş verilerin varsayılan dizinini döndürür (data/processed)"""
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "processed")
 
 class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
     """
     Akıllı ev sensör verilerini makine öğrenmesi için hazırlayan sklearn uyumlu transformer.
     Tüm özellik çıkarımı ve dönüştürme işlemlerini burada yapar.
     """
-    def __init__(self, test_size=0.2, random_state=42):
+    def __init__(self, test_size=0.2, random_state=42, topology=None):
         self.test_size = test_size
         self.random_state = random_state
+        # Oda/cihaz topolojisi: verilmezse veri sütunlarından bir kez türetilir
+        self.topology = topology
         self.numerical_features = []
         self.categorical_features = []
         self.target_device_columns = []
@@ -42,11 +60,7 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         """
         if not self.all_device_columns:
             # If no device columns stored yet, detect them from current DataFrame
-            device_columns = []
-            for column in X.columns:
-                if any(device in column for device in ['Klima', 'Lamba', 'Perde', 'Havalandırma']):
-                    device_columns.append(column)
-            self.all_device_columns = device_columns
+            self.all_device_columns = list(column_index(X.columns, self.topology).device_columns)
             
         # Ensure all expected device columns are present
         X_copy = X.copy()
@@ -60,7 +74,24 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
                 
         return X_copy
 
+    def _topology_for(self, columns):
+        """
+        Kullanılacak oda/cihaz topolojisini döndürür
+        
+        Args:
+            columns (iterable): Veri çerçevesi sütunları (topoloji verilmemişse bunlardan türetilir)
+            
+        Returns:
+            HomeTopology: Topoloji
+        """
+        if self.topology is None:
+            # Şema başına bir kez türetilir (column_index önbelleği)
+            return column_index(columns).topology
+        return self.topology
+
     def fit(self, X, y=None):
+        # Değişim noktalarıyla saklanmış veri setleri yoğun çerçeveye açılır
+        X = dense_frame(X)
         print("DEBUG: Columns at start of fit:", X.columns.tolist())
         # Check for 'timestamp' at the very start
         if 'timestamp' not in X.columns:
@@ -108,6 +139,7 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         return self
 
     def transform(self, X):
+        X = dense_frame(X)
         # Extract time features if 'timestamp' exists
         if 'timestamp' in X.columns:
             X = self._extract_time_features(X)
@@ -152,16 +184,17 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
 
     def load_data(self, csv_path):
         """
-        CSV dosyasından verileri yükler
+        CSV (veya Parquet/Feather/npz) dosyasından verileri yükler
         
         Args:
-            csv_path (str): CSV dosyasının yolu
+            csv_path (str): Veri dosyasının yolu
             
         Returns:
             pandas.DataFrame: Yüklenen veri çerçevesi
         """
         self.logger.info(f"Veriler {csv_path} konumundan yükleniyor...")
-        return pd.read_csv(csv_path)
+        # Bilinen şema (bool, float32, kategori, zaman damgası) okuma sırasında uygulanır
+        return read_frame(csv_path, topology=self.topology)
     
     def _extract_time_features(self, df):
         """
@@ -181,7 +214,7 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         df['hour'] = df['timestamp'].dt.hour
         df['minute'] = df['timestamp'].dt.minute
         df['day_of_week'] = df['timestamp'].dt.dayofweek
-        df['is_weekend'] = df['day_of_week'].apply(lambda x: 1 if x >= 5 else 0)
+        df['is_weekend'] = (df['day_of_week'] >= 5).astype('int64')
         
         # Gün içindeki zaman dilimini kategorik özellik olarak ekle
         conditions = [
@@ -195,12 +228,14 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         
         return df
     
-    def clean_data(self, df):
+    def clean_data(self, df, statistics=None):
         """
         Verideki eksik değerleri doldurur ve veri temizliği yapar
         
         Args:
             df (pandas.DataFrame): Ham veri çerçevesi
+            statistics (dict): fill_statistics çıktısı; verilirse dolgu değerleri ve atılacak
+                sütunlar parçanın kendisinden değil tüm veriden alınır
             
         Returns:
             pandas.DataFrame: Temizlenmiş veri çerçevesi
@@ -210,17 +245,31 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         # Orijinal verilerin bir kopyasını oluştur
         df_clean = df.copy()
         
+        if statistics is not None:
+            df_clean = df_clean.drop(columns=[column for column in statistics["drop_columns"]
+                                              if column in df_clean.columns])
+            for column in df_clean.columns:
+                if column in statistics["fill_values"] and df_clean[column].isna().any():
+                    df_clean[column] = df_clean[column].fillna(statistics["fill_values"][column])
+            if df_clean.empty:
+                raise ValueError("Temizlemeden sonra veri seti boş!")
+            return df_clean
+        
         # Eksik değerleri doldur
         for column in df_clean.columns:
-            # Sayısal değerler için
-            if df_clean[column].dtype in ['float64', 'int64'] and df_clean[column].isna().any():
+            series = df_clean[column]
+            if not series.isna().any():
+                continue
+            
+            # Sayısal değerler için (float32 sensörler ve int32 zaman özellikleri dahil)
+            if is_numeric_dtype(series) and not is_bool_dtype(series):
                 # `inplace=True` kullanmak yerine değer atama kullan
-                df_clean[column] = df_clean[column].fillna(df_clean[column].mean())
+                df_clean[column] = series.fillna(series.mean())
                 
-            # Boolean veya kategorik değerler için
-            elif df_clean[column].dtype in ['object', 'bool', 'category'] and df_clean[column].isna().any():
+            # Boolean, metin veya kategorik değerler için
+            elif not is_datetime64_any_dtype(series):
                 # `inplace=True` kullanmak yerine değer atama kullan
-                df_clean[column] = df_clean[column].fillna(df_clean[column].mode()[0])
+                df_clean[column] = series.fillna(series.mode()[0])
         
         # Gereksiz sütunları kaldır (örneğin tüm değerleri eksik olan)
         df_clean = df_clean.dropna(axis=1, how='all')
@@ -231,98 +280,99 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
             
         return df_clean
     
-    def extract_custom_features(self, df):
+    def fill_statistics(self, chunks):
+        """
+        Parça parça okunan veri için clean_data'nın tüm veriye göre dolgu değerlerini hesaplar:
+        sayısal sütunlarda ortalama, diğerlerinde en sık değer. Tümü eksik sütunlar atılır.
+        
+        Args:
+            chunks (iterable): Ham veri parçaları
+            
+        Returns:
+            dict: fill_values (sütun -> dolgu değeri), drop_columns (atılacak sütunlar), rows (satır sayısı)
+        """
+        sums, counts, tallies, numeric = {}, {}, {}, {}
+        columns = {}
+        rows = 0
+        for chunk in chunks:
+            rows += len(chunk)
+            for column in chunk.columns:
+                columns[column] = True
+                series = chunk[column]
+                if column == 'timestamp' or is_datetime64_any_dtype(series):
+                    continue
+                observed = series.dropna()
+                if observed.empty:
+                    continue
+                if is_numeric_dtype(series) and not is_bool_dtype(series):
+                    sums[column] = sums.get(column, 0.0) + float(observed.sum())
+                    counts[column] = counts.get(column, 0) + len(observed)
+                    numeric.setdefault(column, True)
+                else:
+                    numeric[column] = False
+                    tally = tallies.setdefault(column, {})
+                    for value, count in observed.value_counts().items():
+                        tally[value] = tally.get(value, 0) + int(count)
+        
+        fill_values = {}
+        for column, is_numeric in numeric.items():
+            if is_numeric:
+                fill_values[column] = sums[column] / counts[column]
+            else:
+                # series.mode() gibi eşitlikte en küçük değer seçilir
+                tally = tallies[column]
+                top = max(tally.values())
+                fill_values[column] = sorted(value for value, count in tally.items() if count == top)[0]
+        drop_columns = [column for column in columns if column != 'timestamp' and column not in numeric]
+        return {"fill_values": fill_values, "drop_columns": drop_columns, "rows": rows}
+    
+    def extract_custom_features(self, df, window_state=None):
         """
         Veri setinden özel özellikler çıkarır - daha iyi tahmin için ek özellikler oluşturur
         
         Args:
             df (pandas.DataFrame): Zaman özellikleri eklenmiş veri çerçevesi
+            window_state (dict): Parça parça işlemede parçalar arasında taşınan pencere durumu
+                (önceki parçanın son THREE_HOUR_WINDOW satırı ve son hareket süreleri); boş bir
+                sözlükle başlanır ve her çağrıda güncellenir
             
         Returns:
             pandas.DataFrame: Özel özellikler eklenmiş veri çerçevesi
         """
         self.logger.info("Özel özellikler çıkarılıyor...")
         
-        # Create a copy of the DataFrame to work with
-        df_input = df.copy()
+        # Önceki parçanın son satırları başa eklenir; pencereler parça sınırında kesilmez
+        context_rows = 0
+        if window_state is not None and window_state.get("context") is not None:
+            context_rows = len(window_state["context"])
+            df = pd.concat([window_state["context"], df])
         
         # Instead of adding columns one by one, collect all features in a dictionary
         new_features = {}
         
-        # Identify all rooms
-        rooms = set()
-        for column in df.columns:
-            if '_' in column:
-                room = column.split('_')[0]
-                if room not in ["timestamp", "hour", "minute", "day", "is", "time"]:
-                    rooms.add(room)
-        
-        # Calculate features for each room
-        for room in rooms:
-            # ----------- Hareket ve doluluk özellikleri -----------
-            movement_col = f"{room}_Hareket"
-            occupancy_col = f"{room}_Doluluk"
-            
-            if movement_col in df.columns:
-                # Son 1 saatteki hareket sayısı (12 adım = 60 dakika, her 5 dakikada bir ölçüm)
-                new_features[f"{room}_Hareket_Son1Saat"] = df[movement_col].rolling(window=12, min_periods=1).sum().values
-                
-                # Son 3 saatteki hareket oranı
-                new_features[f"{room}_Hareket_Oran3Saat"] = df[movement_col].rolling(window=36, min_periods=1).mean().values
-                
-                # Son hareketin üzerinden geçen dakika sayısı (vectorized)
-                # Find the last index where movement was True
-                last_true = df[movement_col].eq(True).cumsum()
-                last_true_idx = df[movement_col][df[movement_col]].index
-                last_seen = df[movement_col].eq(True).cumsum().replace(0, np.nan)
-                last_seen_idx = last_seen.where(df[movement_col]).ffill().fillna(0)
-                # Calculate the time since last movement in steps, then multiply to minutes
-                idx = np.arange(len(df))
-                last_true_idx = np.where(df[movement_col])[0]
-                last_seen_idx = np.maximum.accumulate(np.where(df[movement_col], idx, -1))
-                minutes_since_movement = (idx - last_seen_idx) * 5
-                new_features[f"{room}_SonHareket_Dakika"] = minutes_since_movement
-            
-            if occupancy_col in df.columns:
-                # Doluluk oranı (son 1 saat)
-                new_features[f"{room}_Doluluk_Oran"] = df[occupancy_col].rolling(window=12, min_periods=1).mean().values
-            
-            # ----------- Sensör değişim hızları -----------
-            for sensor in ["Sıcaklık", "Nem", "CO2", "Işık"]:
-                col = f"{room}_{sensor}"
-                if col in df.columns:
-                    # Sensör değişim hızı (önceki değere göre)
-                    new_features[f"{room}_{sensor}_Değişim"] = df[col].diff().values
-                    
-                    # Son 1 saatteki ortalama değer ve standart sapma
-                    new_features[f"{room}_{sensor}_Ort1Saat"] = df[col].rolling(window=12, min_periods=1).mean().values
-                    new_features[f"{room}_{sensor}_Std1Saat"] = df[col].rolling(window=12, min_periods=1).std().values
-            
-            # ----------- Gün içi aktivite paterni -----------
-            if occupancy_col in df.columns and 'hour' in df.columns:
-                # Combine all these calculations for better performance
-                new_features[f"{room}_SabahDoluluk"] = ((df['hour'] >= 6) & (df['hour'] < 9) & df[occupancy_col]).astype(int).values
-                new_features[f"{room}_GündüzDoluluk"] = ((df['hour'] >= 9) & (df['hour'] < 17) & df[occupancy_col]).astype(int).values
-                new_features[f"{room}_AkşamDoluluk"] = ((df['hour'] >= 17) & (df['hour'] < 22) & df[occupancy_col]).astype(int).values
-                new_features[f"{room}_GeceDoluluk"] = (((df['hour'] >= 22) | (df['hour'] < 6)) & df[occupancy_col]).astype(int).values
+        # Identify all rooms (sütun dizini şema başına bir kez ayrıştırılır)
+        index = column_index(df.columns, self.topology)
+        topology = index.topology
+        
+        # Oda bazlı pencere özellikleri: tüm odalar kanal başına tek dizide, tek geçişte hesaplanır
+        since_motion = window_state.get("since_motion") if window_state is not None else None
+        new_features.update(room_window_features(df, topology, since_motion=since_motion))
         
         # ----------- Tüm ev özellikleri -----------
         
         # Evdeki toplam kişi sayısı
-        person_columns = [col for col in df.columns if "Kişi_" in col and "_Konum" in col]
+        person_columns = index.person_columns
         if person_columns:
             # Evde bulunan (None olmayan konum) kişi sayısı
             new_features["Evdeki_Kişi_Sayısı"] = df[person_columns].notnull().sum(axis=1).values
         
         # Aktif oda sayısı (dolu olan)
-        occupancy_columns = [col for col in df.columns if "Doluluk" in col]
+        occupancy_columns = index.channel_columns("Doluluk")
         if occupancy_columns:
             new_features["Aktif_Oda_Sayısı"] = df[occupancy_columns].sum(axis=1).values
         
         # Çalışan cihaz sayısı
-        device_columns = []
-        for device in ["Klima", "Lamba", "Perde", "Havalandırma"]:
-            device_columns.extend([col for col in df.columns if col.endswith(device)])
+        device_columns = index.device_columns
         
         if device_columns:
             new_features["Çalışan_Cihaz_Sayısı"] = df[device_columns].sum(axis=1).values
@@ -333,8 +383,21 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         # Combine original DataFrame and new features
         result = pd.concat([df, features_df], axis=1)
         
-        # Fill any NaN values
-        result = result.bfill().ffill().fillna(0)
+        # Fill any NaN values; kategorik sütunlara yeni kategori (0) eklenemediğinden
+        # kalan boşluklar yalnızca sayısal sütunlarda 0 ile doldurulur
+        result = result.bfill().ffill()
+        result = result.fillna({column: 0 for column in result.select_dtypes(include='number').columns})
+        
+        if window_state is not None:
+            # Sonraki parça için: son satırlar ve bağlamın hemen öncesindeki son hareket süreleri
+            cut = len(df) - THREE_HOUR_WINDOW
+            if cut > 0:
+                window_state["since_motion"] = {
+                    room: int(new_features[f"{room}_SonHareket_Dakika"][cut - 1])
+                    for room in topology.rooms if f"{room}_SonHareket_Dakika" in new_features
+                }
+            window_state["context"] = df.iloc[max(cut, 0):]
+            result = result.iloc[context_rows:]
         
         self.logger.info(f"Toplam {len(features_df.columns)} yeni özellik eklendi")
         return result
@@ -352,10 +415,7 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         self.logger.info("Hedef değişkenler hazırlanıyor...")
         
         # Cihaz durumu sütunlarını belirle
-        self.target_device_columns = []
-        for column in df.columns:
-            if any(device in column for device in ['Klima', 'Lamba', 'Perde', 'Havalandırma']):
-                self.target_device_columns.append(column)
+        self.target_device_columns = list(column_index(df.columns, self.topology).device_columns)
         
         # Hedef sütun kontrolü ekle
         if not self.target_device_columns:
@@ -374,11 +434,11 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
             df (pandas.DataFrame): Giriş veri çerçevesi
         """
         # Hedef değişken olmayan tüm sütunlar
-        excluded_cols = self.target_device_columns + ['timestamp']
+        excluded_cols = set(self.target_device_columns) | {'timestamp'}
         
         # Sayısal ve kategorik özellikleri ayır
-        self.numerical_features = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-        self.categorical_features = df.select_dtypes(include=['object', 'bool']).columns.tolist()
+        self.numerical_features = df.select_dtypes(include='number', exclude='bool').columns.tolist()
+        self.categorical_features = df.select_dtypes(include=['object', 'string', 'category', 'bool']).columns.tolist()
         
         # Hedef değişkenleri ve timestamp'i çıkar
         self.numerical_features = [col for col in self.numerical_features if col not in excluded_cols]
@@ -397,14 +457,15 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         self.logger.info("Makine öğrenmesi veri seti oluşturuluyor...")
         
         # Özellik sütunlarını belirle - timestamp ve cihaz durumları hariç
-        feature_cols = [col for col in df.columns if col not in self.target_device_columns and col != 'timestamp']
+        excluded_cols = set(self.target_device_columns) | {'timestamp'}
+        feature_cols = [col for col in df.columns if col not in excluded_cols]
         
         # Eğer feature_cols boşsa hata ver
         if not feature_cols:
             raise ValueError("Özellik sütunları bulunamadı!")
         
         # X (özellikler) ve targets (hedefler) oluştur
-        X = df[feature_cols].copy()  # copy() ile yeni bir kopya oluştur
+        X = df[feature_cols]  # Liste ile seçim zaten yeni bir çerçeve döndürür
         
         # Özellik adlarını kaydet
         self.feature_names = feature_cols
@@ -434,6 +495,22 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
         
         return X, targets
     
+    def split_indices(self, df):
+        """
+        Eğitim ve test satırlarının indekslerini döndürür; ayrım yalnızca satır sayısına,
+        test_size ve random_state'e bağlıdır
+        
+        Args:
+            df (pandas.DataFrame): Veri çerçevesi
+            
+        Returns:
+            tuple: (eğitim indeksi, test indeksi) ayrım sırasıyla
+        """
+        train_positions, test_positions = train_test_split(
+            np.arange(len(df)), test_size=self.test_size, random_state=self.random_state
+        )
+        return df.index[train_positions], df.index[test_positions]
+    
     def split_data(self, df, targets):
         """
         Veriyi eğitim ve test setlerine böler (raw DataFrame ile)
@@ -469,50 +546,241 @@ class SmartHomeDataProcessor(BaseEstimator, TransformerMixin):
     
     def save_processed_data(self, X_train, X_test, y_train_dict, y_test_dict, output_dir=None):
         """
-        İşlenmiş verileri kaydeder
+        İşlenmiş verileri tek bir sıkıştırılmış npz paketine kaydeder: eğitim/test özellikleri,
+        tüm hedefler ve ayrım indeksleri sütun tipleriyle birlikte saklanır (bkz. load_processed_data)
         
         Args:
             X_train, X_test: Eğitim ve test özellikleri
             y_train_dict, y_test_dict: Eğitim ve test hedef değişkenleri
             output_dir (str): Çıktı dizini
+            
+        Returns:
+            str: Paket dosyasının yolu
         """
         if output_dir is None:
-            output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "processed")
-        
-        # Dizin yoksa oluştur
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        # Özellikleri kaydet
+            output_dir = _default_processed_dir()
+        
+        # Hedefler bölümlerin satır sırasıyla tek çerçevede tutulur
+        frames = {
+            "X_train": X_train,
+            "X_test": X_test,
+            "y_train": pd.DataFrame({name: np.asarray(y) for name, y in y_train_dict.items()}, index=X_train.index),
+            "y_test": pd.DataFrame({name: np.asarray(y) for name, y in y_test_dict.items()}, index=X_test.index),
+        }
+        path = write_bundle(os.path.join(output_dir, PROCESSED_BUNDLE), frames)
+        
+        self.logger.info(f"İşlenmiş veriler {path} konumuna kaydedildi.")
+        return path
+    
+    def _save_processed_csv(self, X_train, X_test, y_train_dict, y_test_dict, output_dir):
+        """İşlenmiş verileri eski CSV düzeninde (bölüm ve hedef başına bir dosya) kaydeder"""
+        os.makedirs(output_dir, exist_ok=True)
         X_train.to_csv(os.path.join(output_dir, "X_train.csv"), index=False)
         X_test.to_csv(os.path.join(output_dir, "X_test.csv"), index=False)
-        
-        # Hedef değişkenleri kaydet
         for target_name in y_train_dict:
             y_train_dict[target_name].to_csv(os.path.join(output_dir, f"y_train_{target_name}.csv"), index=False)
             y_test_dict[target_name].to_csv(os.path.join(output_dir, f"y_test_{target_name}.csv"), index=False)
+    
+    def featurize_chunk(self, chunk):
+        """
+        Bir veri parçasına satır bazlı tek adımı (zaman özellikleri) uygular; parçalar
+        üretildikçe işlenebilir. Temizleme satır bazlı değildir (dolgu değerleri ve atılan
+        sütunlar tüm veriye bağlıdır); bu nedenle o ve pencere tabanlı özel özellikler
+        build_dataset içinde birleştirilmiş çerçevede uygulanır.
         
-        self.logger.info(f"İşlenmiş veriler {output_dir} konumuna kaydedildi.")
+        Args:
+            chunk (pandas.DataFrame): Ham veri parçası
+            
+        Returns:
+            pandas.DataFrame: Zaman özellikleri eklenmiş parça
+        """
+        return self._extract_time_features(chunk.copy())
     
-    def process_data(self, csv_path, save_processed=True, output_dir=None):
-        self.logger.info(f"Veriler {csv_path} konumundan yükleniyor...")
-        df = self.load_data(csv_path)
+    def build_dataset(self, df, featurized=False, feature_cache=None, raw=None, source=None):
+        """
+        Bellekteki ham veri çerçevesinden ham veriyi, özellikleri, hedefleri ve eğitim/test
+        ayrımını taşıyan veri seti tutamacını oluşturur; hiçbir şey diske yazılmaz
+        
+        Args:
+            df (pandas.DataFrame | RunLengthFrame): Ham veri seti (featurized ise işlenmiş parçalar)
+            featurized (bool): Parçalara featurize_chunk ile zaman özellikleri zaten eklendiyse True
+            feature_cache (FeatureCache): Verilirse aynı veri için özellik çıkarımı atlanır
+            raw (pandas.DataFrame): featurized verildiğinde ham veri (aynı indeksle)
+            source (str): Verinin okunduğu dosya
+            
+        Returns:
+            SmartHomeDataset: Veri seti
+        """
+        df = dense_frame(df)
         self.logger.info(f"Ham veri boyutu: {df.shape}")
-        df_clean = self.clean_data(df)
-        self.logger.info(f"Temizlenmiş veri boyutu: {df_clean.shape}")
-        df_features = self._extract_time_features(df_clean)
-        self.logger.info(f"Zaman özellikleri eklenmiş veri boyutu: {df_features.shape}")
-        df_features = self.extract_custom_features(df_features)
-        self.logger.info(f"Özel özellikler eklenmiş veri boyutu: {df_features.shape}")
-        df_with_targets = self.prepare_target_variables(df_features)
-        self.logger.info(f"Hedefler eklendikten sonra veri boyutu: {df_with_targets.shape}")
+        key = None
+        cached = None
+        if feature_cache is not None:
+            key = feature_cache.make_key("features", [feature_cache.fingerprint(df)], self, featurized=featurized)
+            cached = feature_cache.get(key)
+        if cached is not None:
+            df_with_targets = cached["frame"]
+            self.target_device_columns = list(cached["target_device_columns"])
+            self.logger.info(f"Özellikler önbellekten okundu ({key[:12]}): {df_with_targets.shape}")
+        else:
+            if featurized:
+                # Zaman özellikleri parçalarda eklendi; temizleme tüm veri üzerinde bir kez yapılır
+                df_features = self.clean_data(df)
+            else:
+                df_clean = self.clean_data(df)
+                self.logger.info(f"Temizlenmiş veri boyutu: {df_clean.shape}")
+                df_features = self._extract_time_features(df_clean)
+            self.logger.info(f"Zaman özellikleri eklenmiş veri boyutu: {df_features.shape}")
+            df_features = self.extract_custom_features(df_features)
+            self.logger.info(f"Özel özellikler eklenmiş veri boyutu: {df_features.shape}")
+            df_with_targets = self.prepare_target_variables(df_features)
+            self.logger.info(f"Hedefler eklendikten sonra veri boyutu: {df_with_targets.shape}")
+            if feature_cache is not None:
+                feature_cache.put(key, {"frame": df_with_targets,
+                                        "target_device_columns": list(self.target_device_columns),
+                                        "rows": len(df_with_targets)},
+                                  params={"stage": "features", "version": PROCESSOR_VERSION})
         X, targets = self.create_ml_dataset(df_with_targets)
         self.logger.info(f"Son özellik matrisi boyutu: {X.shape}")
-        # Split the raw DataFrame (with all columns)
-        df_train, df_test, y_train_dict, y_test_dict = self.split_data(df_with_targets, targets)
+        train_index, test_index = self.split_indices(df_with_targets)
+        return SmartHomeDataset(df if raw is None else raw, df_with_targets, targets, train_index, test_index,
+                                processor=self, source=source)
+    
+    def load_dataset(self, csv_path, feature_cache=None):
+        """
+        Veri dosyasını bir kez okuyup veri seti tutamacını oluşturur
+        
+        Args:
+            csv_path (str): Veri dosyasının yolu
+            feature_cache (FeatureCache): Verilirse aynı veri için özellik çıkarımı atlanır
+            
+        Returns:
+            SmartHomeDataset: Veri seti
+        """
+        return self.build_dataset(self.load_data(csv_path), feature_cache=feature_cache, source=csv_path)
+    
+    def process_frame(self, df, save_processed=False, output_dir=None, featurized=False, feature_cache=None):
+        """
+        Bellekteki ham veri çerçevesini dosyaya yazmadan işler
+        
+        Args:
+            df (pandas.DataFrame | RunLengthFrame): Ham veri seti
+            save_processed (bool): İşlenmiş verilerin kaydedilip kaydedilmeyeceği
+            output_dir (str): İşlenmiş verilerin kaydedileceği dizin
+            featurized (bool): Parçalar featurize_chunk ile zaten işlendiyse True
+            feature_cache (FeatureCache): Verilirse aynı veri için özellik çıkarımı atlanır
+            
+        Returns:
+            tuple: df_train, df_test, y_train_dict, y_test_dict, işlemci
+        """
+        dataset = self.build_dataset(df, featurized=featurized, feature_cache=feature_cache)
         if save_processed:
-            self.save_processed_data(df_train, df_test, y_train_dict, y_test_dict, output_dir)
+            dataset.save_processed(output_dir)
+        df_train, df_test, y_train_dict, y_test_dict = dataset.split()
         return df_train, df_test, y_train_dict, y_test_dict, self
+    
+    def process_data(self, csv_path, save_processed=True, output_dir=None):
+        self.logger.info(f"Veriler {csv_path} konumundan yükleniyor...")
+        return self.process_frame(self.load_data(csv_path), save_processed, output_dir)
+    
+    def _row_test_mask(self, offset, count, seed):
+        """
+        Genel satır numaraları offset..offset+count-1 olan satırların test bölümüne düşüp
+        düşmediğini döndürür. Her satır, tohum ve satır numarasının karıştırılmış (splitmix64)
+        değerinden bağımsız olarak test_size olasılığıyla seçilir; sonuç parça boyutuna bağlı
+        değildir ve tüm dosya için dizi tutulmaz.
+        
+        Args:
+            offset (int): Parçanın ilk satırının genel satır numarası
+            count (int): Parçadaki satır sayısı
+            seed (int): Ayrım tohumu
+            
+        Returns:
+            numpy.ndarray: Test satırlarının boolean maskesi
+        """
+        mixed = np.arange(offset, offset + count, dtype=np.uint64) + np.uint64(seed % 2**64)
+        mixed = mixed * np.uint64(0x9E3779B97F4A7C15)
+        mixed = (mixed ^ (mixed >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        mixed = (mixed ^ (mixed >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        mixed = mixed ^ (mixed >> np.uint64(31))
+        # Üst 53 bit -> [0, 1) aralığında tekdüze değer
+        return (mixed >> np.uint64(11)).astype(np.float64) / 2**53 < self.test_size
+    
+    def iter_processed_chunks(self, csv_path, chunk_rows=50000):
+        """
+        CSV dosyasını sabit boyutlu parçalar halinde işler; bellek kullanımı dosya boyutundan
+        bağımsız olarak parça boyutuyla sınırlıdır. İlk geçişte dolgu değerleri ve satır sayısı,
+        ikinci geçişte özellikler hesaplanır. Pencere durumu parça sınırlarında taşındığından
+        özellikler process_frame ile aynıdır.
+        
+        Eğitim/test ayrımı split_data'dan farklıdır: tüm satırları karıştırmak dosya boyutunda
+        dizi gerektireceğinden her satırın bölümü random_state ve genel satır numarasından
+        bağımsız olarak belirlenir (bkz. _row_test_mask). Test oranı test_size'a yalnızca
+        yaklaşık olarak eşittir; ayrım parça boyutundan bağımsızdır ve tekrarlanabilirdir.
+        
+        Args:
+            csv_path (str): Ham veri CSV dosya yolu
+            chunk_rows (int): Parça başına satır sayısı
+            
+        Yields:
+            tuple: (özellik eklenmiş parça, parçadaki test satırlarının maskesi)
+        """
+        # Kategoriler parçadan parçaya değişeceğinden konum sütunları metin olarak okunur
+        read_options = csv_read_options(csv_path, self.topology, categories=False, bools=False)
+        statistics = self.fill_statistics(pd.read_csv(csv_path, chunksize=chunk_rows, **read_options))
+        rows = statistics["rows"]
+        self.logger.info(f"{csv_path}: {rows} satır, {chunk_rows} satırlık parçalar halinde işleniyor...")
+        
+        seed = self.random_state
+        if seed is None:
+            seed = int(np.random.default_rng().integers(2**63))
+        
+        window_state = {}
+        offset = 0
+        for chunk in pd.read_csv(csv_path, chunksize=chunk_rows, **read_options):
+            chunk = self._extract_time_features(self.clean_data(chunk, statistics))
+            chunk = self.extract_custom_features(chunk, window_state=window_state)
+            if not self.target_device_columns:
+                self.prepare_target_variables(chunk)
+            yield chunk, self._row_test_mask(offset, len(chunk), seed)
+            offset += len(chunk)
+    
+    def process_data_chunked(self, csv_path, output_dir=None, chunk_rows=50000):
+        """
+        Çok büyük sensör geçmişlerini belleğe tümüyle almadan işler ve bölümleri CSV dosyalarına
+        (X_train.csv, X_test.csv, y_<bölüm>_<hedef>.csv) parça parça ekler; sıkıştırılmış npz paketi
+        sonradan eklemeye izin vermediğinden akış halinde yazımda CSV düzeni kullanılır.
+        Bölümlerdeki satırlar karıştırılmış değil zaman sırasındadır.
+        
+        Args:
+            csv_path (str): Ham veri CSV dosya yolu
+            output_dir (str): Çıktı dizini (None ise data/processed)
+            chunk_rows (int): Parça başına satır sayısı
+            
+        Returns:
+            dict: Bölüm -> satır sayısı ve hedef adları
+        """
+        if output_dir is None:
+            output_dir = _default_processed_dir()
+        os.makedirs(output_dir, exist_ok=True)
+        
+        written = {"train": 0, "test": 0}
+        for chunk, test_rows in self.iter_processed_chunks(csv_path, chunk_rows):
+            for split, mask in (("train", ~test_rows), ("test", test_rows)):
+                part = chunk[mask]
+                first = written[split] == 0
+                mode = "w" if first else "a"
+                part.to_csv(os.path.join(output_dir, f"X_{split}.csv"), mode=mode, header=first, index=False)
+                for target in self.target_device_columns:
+                    y = part[target].astype(int) if part[target].dtype == bool else part[target]
+                    y.to_csv(os.path.join(output_dir, f"y_{split}_{target}.csv"), mode=mode, header=first,
+                             index=False)
+                written[split] += len(part)
+        
+        self.logger.info(f"İşlenmiş veriler {output_dir} konumuna kaydedildi "
+                         f"({written['train']} eğitim, {written['test']} test satırı).")
+        return {"train_rows": written["train"], "test_rows": written["test"],
+                "targets": list(self.target_device_columns)}
 
 # __init__.py dosyasına eklemek için temel fonksiyonlar
 def process_raw_data(csv_path, save_processed=True, output_dir=None):
@@ -530,6 +798,89 @@ def process_raw_data(csv_path, save_processed=True, output_dir=None):
     processor = SmartHomeDataProcessor()
     return processor.process_data(csv_path, save_processed, output_dir)
 
+def load_processed_data(output_dir=None):
+    """
+    save_processed_data ile yazılmış paketi okur
+    
+    Args:
+        output_dir (str): Paketin bulunduğu dizin (None ise data/processed)
+        
+    Returns:
+        tuple: X_train, X_test, y_train_dict, y_test_dict (indeksler ayrım indeksleridir)
+    """
+    frames = read_bundle(os.path.join(output_dir or _default_processed_dir(), PROCESSED_BUNDLE))
+    y_train_dict = {name: frames["y_train"][name] for name in frames["y_train"].columns}
+    y_test_dict = {name: frames["y_test"][name] for name in frames["y_test"].columns}
+    return frames["X_train"], frames["X_test"], y_train_dict, y_test_dict
+
+def benchmark_processed_bundle(days_list=(7, 30), seed=7):
+    """
+    İşlenmiş bölümlerin tek npz paketini eski CSV dosyası kümesiyle boyut ve okuma süresi
+    bakımından karşılaştırır
+    
+    Args:
+        days_list (tuple): Denenecek gün sayıları
+        seed (int): Üretim tohumu
+        
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    import tempfile
+    import time
+    from src.data_simulation.data_generator import HomeDataGenerator
+    
+    results = []
+    for days in days_list:
+        generator = HomeDataGenerator(seed=seed)
+        df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+        processor = SmartHomeDataProcessor(topology=generator.topology)
+        X_train, X_test, y_train_dict, y_test_dict, _ = processor.process_frame(df)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            csv_dir = os.path.join(directory, "csv")
+            began = time.perf_counter()
+            processor._save_processed_csv(X_train, X_test, y_train_dict, y_test_dict, csv_dir)
+            csv_write = time.perf_counter() - began
+            csv_files = [os.path.join(csv_dir, name) for name in os.listdir(csv_dir)]
+            began = time.perf_counter()
+            for path in csv_files:
+                pd.read_csv(path)
+            csv_read = time.perf_counter() - began
+            csv_bytes = sum(os.path.getsize(path) for path in csv_files)
+            
+            bundle_dir = os.path.join(directory, "bundle")
+            began = time.perf_counter()
+            bundle_path = processor.save_processed_data(X_train, X_test, y_train_dict, y_test_dict, bundle_dir)
+            bundle_write = time.perf_counter() - began
+            began = time.perf_counter()
+            loaded = load_processed_data(bundle_dir)
+            bundle_read = time.perf_counter() - began
+            bundle_bytes = os.path.getsize(bundle_path)
+            
+            # Değerler, sütun tipleri ve ayrım indeksleri dahil birebir aynı olmalı
+            same = (loaded[0].equals(X_train) and loaded[1].equals(X_test)
+                    and all(loaded[2][name].equals(y) for name, y in y_train_dict.items())
+                    and all(loaded[3][name].equals(y) for name, y in y_test_dict.items()))
+        
+        result = {
+            "days": days,
+            "rows": len(df),
+            "csv_files": len(csv_files),
+            "csv_megabytes": csv_bytes / 2**20,
+            "bundle_megabytes": bundle_bytes / 2**20,
+            "csv_write_ms": csv_write * 1000,
+            "bundle_write_ms": bundle_write * 1000,
+            "csv_read_ms": csv_read * 1000,
+            "bundle_read_ms": bundle_read * 1000,
+            "same": same,
+        }
+        results.append(result)
+        print(f"{days:4d} gün | {len(df):7d} satır | CSV ({len(csv_files)} dosya): {result['csv_megabytes']:7.2f} MiB, "
+              f"yazma {result['csv_write_ms']:8.1f} ms, okuma {result['csv_read_ms']:8.1f} ms | "
+              f"npz paketi: {result['bundle_megabytes']:7.2f} MiB, yazma {result['bundle_write_ms']:8.1f} ms, "
+              f"okuma {result['bundle_read_ms']:8.1f} ms | aynı içerik: {same}")
+    return results
+
 # Test işlevi
 def test_data_processing():
     """SmartHomeDataProcessor'ı test eder"""
@@ -559,6 +910,63 @@ def test_data_processing():
     print("\nSayısal özellikler:", processor.numerical_features)
     print("\nKategorik özellikler:", processor.categorical_features)
 
+def test_chunked_processing(days=3, chunk_rows=500, seed=4):
+    """
+    Parça parça işlemenin process_frame ile aynı özellikleri ürettiğini, test oranının test_size'a
+    yakın olduğunu ve ayrımın parça boyutundan bağımsız olduğunu doğrular
+    
+    Args:
+        days (int): Üretilecek gün sayısı
+        chunk_rows (int): Parça başına satır sayısı (pencere uzunluğundan küçük parçalar da denenir)
+        seed (int): Üretim tohumu
+        
+    Returns:
+        bool: Sonuçlar aynı mı
+    """
+    import tempfile
+    import time
+    from src.data_simulation.data_generator import HomeDataGenerator
+    
+    generator = HomeDataGenerator(seed=seed)
+    df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "raw.csv")
+        df.to_csv(csv_path, index=False)
+        
+        began = time.perf_counter()
+        df_train, df_test, _, _, _ = SmartHomeDataProcessor().process_data(csv_path, save_processed=False)
+        full_seconds = time.perf_counter() - began
+        expected = pd.concat([df_train, df_test]).sort_index()
+        test_size = SmartHomeDataProcessor().test_size
+        # Satır başına bağımsız seçimde test oranının beklenen sapması (binom)
+        tolerance = 4 * np.sqrt(test_size * (1 - test_size) / len(expected))
+        
+        same = True
+        first_test_index = None
+        for rows in (chunk_rows, 7):
+            began = time.perf_counter()
+            chunks, masks = zip(*SmartHomeDataProcessor().iter_processed_chunks(csv_path, chunk_rows=rows))
+            chunked_seconds = time.perf_counter() - began
+            result = pd.concat(chunks)
+            test_index = result.index[np.concatenate(masks)]
+            if first_test_index is None:
+                first_test_index = test_index
+            test_fraction = len(test_index) / len(result)
+            numeric = expected.select_dtypes(include='number').columns
+            # Parçalarda konum sütunları metin, tüm veride kategori olarak okunur; değerleri karşılaştırılır
+            other = [column for column in expected.columns if column not in numeric]
+            matches = (list(result.columns) == list(expected.columns)
+                       and np.allclose(result[numeric].to_numpy(dtype=np.float64),
+                                       expected[numeric].to_numpy(dtype=np.float64), rtol=1e-6, atol=1e-6)
+                       and (result[other].astype(str).to_numpy() == expected[other].astype(str).to_numpy()).all()
+                       and abs(test_fraction - test_size) <= tolerance
+                       and test_index.equals(first_test_index))
+            same = same and matches
+            print(f"Parça {rows:5d} satır: {chunked_seconds * 1000:8.1f} ms | tümü bellekte: "
+                  f"{full_seconds * 1000:8.1f} ms | test oranı: {test_fraction:.3f} | aynı sonuç: {matches}")
+    return same
+
 def remove_duplicate_columns(df):
     duplicates = df.columns[df.columns.duplicated()].unique()
     if len(duplicates) > 0:
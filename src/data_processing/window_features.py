@@ -0,0 +1,372 @@
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype
+
+from src.topology import HomeTopology
+
+# Pencere boyutları adım cinsindendir (her 5 dakikada bir ölçüm)
+STEP_MINUTES = 5
+HOUR_WINDOW = 12
+THREE_HOUR_WINDOW = 36
+
+# Değişim, ortalama ve standart sapma özelliklerinin hesaplandığı sensörler (özellik sırasıyla)
+WINDOW_SENSORS = ["Sıcaklık", "Nem", "CO2", "Işık"]
+
+# Gün içi doluluk dilimleri: özellik adı soneki -> saat koşulu
+DAY_PERIODS = [
+    ("SabahDoluluk", lambda hour: (hour >= 6) & (hour < 9)),
+    ("GündüzDoluluk", lambda hour: (hour >= 9) & (hour < 17)),
+    ("AkşamDoluluk", lambda hour: (hour >= 17) & (hour < 22)),
+    ("GeceDoluluk", lambda hour: (hour >= 22) | (hour < 6)),
+]
+
+# Ara diziler bu kadar sütunluk dilimlerle hesaplanır; bir dilimin ara dizileri işlemci
+# önbelleğinde kalır ve büyük evlerde bellek kullanımı sınırlı olur
+_COLUMN_BLOCK = 32
+
+
+def _window_difference(cumulative, window, out):
+    """
+    Kümülatif toplamdan her satır için son window satırın toplamını out dizisine yazar
+    (ilk window satırda kümülatif toplamın kendisi); önek dizisi kopyalanmaz
+
+    Args:
+        cumulative (numpy.ndarray): (satır, sütun) kümülatif toplamlar
+        window (int): Pencere uzunluğu (satır)
+        out (numpy.ndarray): Sonucun yazılacağı, cumulative ile örtüşmeyen (satır, sütun) dizi
+
+    Returns:
+        numpy.ndarray: out
+    """
+    out[:window] = cumulative[:window]
+    np.subtract(cumulative[window:], cumulative[:-window], out=out[window:])
+    return out
+
+
+def _valid_counts(block, windows):
+    """
+    Her pencere için penceredeki geçerli (NaN olmayan) değer sayılarını tek kümülatif toplamdan hesaplar.
+    Dilimde NaN yoksa sayılar yalnızca satır numarasına bağlıdır ve kümülatif toplam gerekmez.
+
+    Args:
+        block (numpy.ndarray): (satır, sütun) değerler
+        windows (tuple): Pencere uzunlukları (satır)
+
+    Returns:
+        tuple: (geçerlilik maskesi (NaN yoksa None), pencere başına sayı dizileri; NaN yoksa (satır, 1))
+    """
+    rows = len(block)
+    missing = np.isnan(block)
+    if not missing.any():
+        steps = np.arange(1, rows + 1, dtype=np.float64)[:, None]
+        return None, [np.minimum(steps, window) for window in windows]
+    valid = ~missing
+    cumulative = np.cumsum(valid, axis=0, dtype=np.float64)
+    return valid, [_window_difference(cumulative, window, np.empty_like(cumulative)) for window in windows]
+
+
+def rolling_sums(values, windows):
+    """
+    Tüm sütunlar için bir veya birden çok pencere uzunluğunun kayan toplamını ve ortalamasını
+    tek kümülatif toplam geçişiyle hesaplar. pandas rolling(window, min_periods=1) ile aynı
+    anlamdadır: NaN değerler atlanır, penceredeki tüm değerler NaN ise sonuç NaN olur.
+
+    Args:
+        values (numpy.ndarray): (satır, sütun) değerler
+        windows (tuple): Pencere uzunlukları (satır)
+
+    Returns:
+        list: Her pencere için (toplam, ortalama) dizileri
+    """
+    values = np.asarray(values, dtype=np.float64)
+    results = [(np.empty_like(values), np.empty_like(values)) for _ in windows]
+    for start in range(0, values.shape[1], _COLUMN_BLOCK):
+        columns = slice(start, start + _COLUMN_BLOCK)
+        block = values[:, columns]
+        valid, counts = _valid_counts(block, windows)
+        cumulative = np.cumsum(block if valid is None else np.where(valid, block, 0.0), axis=0)
+        for window, window_counts, (sums, means) in zip(windows, counts, results):
+            total = _window_difference(cumulative, window, sums[:, columns])
+            if valid is not None:
+                np.copyto(total, np.nan, where=window_counts == 0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                np.divide(total, window_counts, out=means[:, columns])
+    return results
+
+
+def rolling_sum_mean(values, window):
+    """
+    Tüm sütunlar için tek pencere uzunluğunun kayan toplamını ve ortalamasını hesaplar (bkz. rolling_sums)
+
+    Args:
+        values (numpy.ndarray): (satır, sütun) değerler
+        window (int): Pencere uzunluğu (satır)
+
+    Returns:
+        tuple: (toplam, ortalama) dizileri
+    """
+    return rolling_sums(values, (window,))[0]
+
+
+def rolling_moments(values, window):
+    """
+    Tüm sütunlar için kayan pencere ortalamasını ve örneklem standart sapmasını (ddof=1) hesaplar.
+    Ortalama ve standart sapma aynı geçerli değer sayılarını ve aynı birinci/ikinci moment
+    kümülatif toplamlarını kullanır. Sayısal kararlılık için sütunlar önce ortalamalarına göre
+    ötelenir; kümülatif toplamların yuvarlama hatası sınırı altında kalan varyanslar (sabit
+    pencereler) sıfır kabul edilir.
+
+    Args:
+        values (numpy.ndarray): (satır, sütun) değerler
+        window (int): Pencere uzunluğu (satır)
+
+    Returns:
+        tuple: (ortalama, standart sapma) dizileri; penceredeki geçerli değer yoksa ortalama,
+            2'den azsa standart sapma NaN
+    """
+    values = np.asarray(values, dtype=np.float64)
+    means = np.empty_like(values)
+    stds = np.empty_like(values)
+    tolerance_scale = 64 * np.finfo(np.float64).eps
+    for start in range(0, values.shape[1], _COLUMN_BLOCK):
+        columns = slice(start, start + _COLUMN_BLOCK)
+        block = values[:, columns]
+        valid, (counts,) = _valid_counts(block, (window,))
+        if valid is None:
+            center = block.mean(axis=0) if len(block) else 0.0
+            deviation = block - center
+        else:
+            # Tamamen NaN sütunların merkezi 0
+            filled = np.where(valid, block, 0.0)
+            center = filled.sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+            deviation = np.where(valid, filled - center, 0.0)
+
+        first_cumulative = np.cumsum(deviation, axis=0)
+        np.multiply(deviation, deviation, out=deviation)
+        cumulative_squares = np.cumsum(deviation, axis=0)
+        first = _window_difference(first_cumulative, window, means[:, columns])
+        second = _window_difference(cumulative_squares, window, deviation)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # second <- (second - first² / n) / (n - 1), first <- merkez + first / n
+            np.multiply(first, first, out=first_cumulative)
+            np.divide(first_cumulative, counts, out=first_cumulative)
+            np.subtract(second, first_cumulative, out=second)
+            degrees = counts - 1
+            np.divide(second, degrees, out=second)
+            np.divide(cumulative_squares, degrees, out=cumulative_squares)
+            np.copyto(second, 0.0, where=second <= tolerance_scale * cumulative_squares)
+            np.divide(first, counts, out=first)
+        np.add(first, center, out=first)
+        np.copyto(second, np.nan, where=counts < 2)
+        np.sqrt(second, out=stds[:, columns])
+    return means, stds
+
+
+def step_diff(values):
+    """Her sütun için bir önceki satıra göre farkı döndürür (ilk satır NaN)"""
+    values = np.asarray(values, dtype=np.float64)
+    result = np.empty_like(values)
+    result[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=result[1:])
+    return result
+
+
+def minutes_since_true(flags, step_minutes=STEP_MINUTES, initial=None):
+    """
+    Her sütun için son True değerinden bu yana geçen dakikayı döndürür
+    (hiç True görülmediyse başlangıçtan önceki satırdan itibaren sayılır)
+
+    Args:
+        flags (numpy.ndarray): (satır, sütun) boolean dizisi
+        step_minutes (int): Satırlar arasındaki dakika farkı
+        initial (numpy.ndarray): Başlangıçtan önceki satırdaki sütun başına dakika (önceki parçadan taşınan)
+
+    Returns:
+        numpy.ndarray: (satır, sütun) dakika
+    """
+    index = np.arange(len(flags))[:, None]
+    last_seen = np.maximum.accumulate(np.where(flags, index, -1), axis=0)
+    minutes = (index - last_seen) * step_minutes
+    if initial is not None:
+        minutes = np.where(last_seen < 0, minutes + np.asarray(initial, dtype=minutes.dtype), minutes)
+    return minutes
+
+
+def room_window_features(df, topology, since_motion=None):
+    """
+    Oda bazlı pencere özelliklerini hesaplar. Her kanal grubu (hareket, doluluk, sensörler)
+    tüm odalar için tek bir 2 boyutlu diziye yığılır ve her pencere tek geçişte hesaplanır.
+    Özellik adları ve sırası oda oda hesaplanan eski sürümle aynıdır.
+
+    Args:
+        df (pandas.DataFrame): Zaman özellikleri eklenmiş veri çerçevesi
+        topology (HomeTopology): Oda/cihaz topolojisi
+        since_motion (dict): Oda -> ilk satırdan önceki son hareketten beri geçen dakika
+            (parça parça işlemede önceki parçadan taşınır; None ise 0)
+
+    Returns:
+        dict: Özellik adı -> numpy dizisi (oda sırasıyla)
+    """
+    present = set(df.columns)
+
+    def stack(channel):
+        rooms = [room for room in topology.rooms if topology.column(room, channel) in present]
+        columns = [topology.column(room, channel) for room in rooms]
+        values = df[columns].to_numpy(dtype=np.float64) if columns else np.empty((len(df), 0))
+        return {room: j for j, room in enumerate(rooms)}, values
+
+    motion_index, motion = stack("Hareket")
+    # Her iki hareket penceresi aynı kümülatif toplamdan
+    (motion_hour, _), (_, motion_rate) = rolling_sums(motion, (HOUR_WINDOW, THREE_HOUR_WINDOW))
+    initial = None
+    if since_motion is not None:
+        initial = np.array([since_motion.get(room, 0) for room in motion_index], dtype=np.int64)
+    since_motion = minutes_since_true(motion != 0, initial=initial)
+
+    occupancy_index, occupancy = stack("Doluluk")
+    _, occupancy_rate = rolling_sum_mean(occupancy, HOUR_WINDOW)
+
+    # Tüm odaların tüm sensörleri tek dizide: sütun sırası (oda, sensör)
+    sensor_columns = [topology.column(room, sensor) for room in topology.rooms for sensor in WINDOW_SENSORS
+                      if topology.column(room, sensor) in present]
+    sensor_index = {column: j for j, column in enumerate(sensor_columns)}
+    sensors = df[sensor_columns].to_numpy(dtype=np.float64) if sensor_columns else np.empty((len(df), 0))
+    sensor_diff = step_diff(sensors)
+    sensor_mean, sensor_std = rolling_moments(sensors, HOUR_WINDOW)
+
+    periods = []
+    if "hour" in present:
+        hour = df["hour"].to_numpy()
+        periods = [(suffix, condition(hour)) for suffix, condition in DAY_PERIODS]
+    occupied = occupancy.astype(bool)
+
+    features = {}
+    for room in topology.rooms:
+        j = motion_index.get(room)
+        if j is not None:
+            features[f"{room}_Hareket_Son1Saat"] = motion_hour[:, j]
+            features[f"{room}_Hareket_Oran3Saat"] = motion_rate[:, j]
+            features[f"{room}_SonHareket_Dakika"] = since_motion[:, j]
+
+        k = occupancy_index.get(room)
+        if k is not None:
+            features[f"{room}_Doluluk_Oran"] = occupancy_rate[:, k]
+
+        for sensor in WINDOW_SENSORS:
+            column = topology.column(room, sensor)
+            s = sensor_index.get(column)
+            if s is None:
+                continue
+            diff = sensor_diff[:, s]
+            # Değişim, kaynak sütunun ondalık tipini korur (float32 sensörler)
+            if is_float_dtype(df[column].dtype):
+                diff = diff.astype(df[column].dtype, copy=False)
+            features[f"{room}_{sensor}_Değişim"] = diff
+            features[f"{room}_{sensor}_Ort1Saat"] = sensor_mean[:, s]
+            features[f"{room}_{sensor}_Std1Saat"] = sensor_std[:, s]
+
+        if k is not None:
+            for suffix, mask in periods:
+                features[f"{room}_{suffix}"] = (mask & occupied[:, k]).astype(int)
+    return features
+
+
+def _pandas_room_features(df, topology):
+    """Karşılaştırma için oda oda pandas rolling ile hesaplanan eski özellikler"""
+    features = {}
+    for room in topology.rooms:
+        movement_col = f"{room}_Hareket"
+        occupancy_col = f"{room}_Doluluk"
+        if movement_col in df.columns:
+            features[f"{room}_Hareket_Son1Saat"] = df[movement_col].rolling(window=12, min_periods=1).sum().values
+            features[f"{room}_Hareket_Oran3Saat"] = df[movement_col].rolling(window=36, min_periods=1).mean().values
+            idx = np.arange(len(df))
+            last_seen_idx = np.maximum.accumulate(np.where(df[movement_col], idx, -1))
+            features[f"{room}_SonHareket_Dakika"] = (idx - last_seen_idx) * 5
+        if occupancy_col in df.columns:
+            features[f"{room}_Doluluk_Oran"] = df[occupancy_col].rolling(window=12, min_periods=1).mean().values
+        for sensor in WINDOW_SENSORS:
+            col = f"{room}_{sensor}"
+            if col in df.columns:
+                features[f"{room}_{sensor}_Değişim"] = df[col].diff().values
+                features[f"{room}_{sensor}_Ort1Saat"] = df[col].rolling(window=12, min_periods=1).mean().values
+                features[f"{room}_{sensor}_Std1Saat"] = df[col].rolling(window=12, min_periods=1).std().values
+        if occupancy_col in df.columns and 'hour' in df.columns:
+            features[f"{room}_SabahDoluluk"] = ((df['hour'] >= 6) & (df['hour'] < 9) & df[occupancy_col]).astype(int).values
+            features[f"{room}_GündüzDoluluk"] = ((df['hour'] >= 9) & (df['hour'] < 17) & df[occupancy_col]).astype(int).values
+            features[f"{room}_AkşamDoluluk"] = ((df['hour'] >= 17) & (df['hour'] < 22) & df[occupancy_col]).astype(int).values
+            features[f"{room}_GeceDoluluk"] = (((df['hour'] >= 22) | (df['hour'] < 6)) & df[occupancy_col]).astype(int).values
+    return features
+
+
+def _benchmark_frame(rooms, days, seed=0):
+    """Benchmark için verilen odalarla rastgele sensör, hareket ve doluluk sütunları üretir"""
+    rng = np.random.default_rng(seed)
+    steps = days * 24 * 60 // STEP_MINUTES
+    timestamps = pd.date_range("2025-01-01", periods=steps, freq=f"{STEP_MINUTES}min")
+    columns = {"timestamp": timestamps, "hour": timestamps.hour.to_numpy()}
+
+    def walk(start, scale):
+        return (start + np.cumsum(rng.normal(0, scale, steps))).astype(np.float32)
+
+    for room in rooms:
+        columns[f"{room}_Sıcaklık"] = walk(22.0, 0.2)
+        columns[f"{room}_Nem"] = walk(50.0, 0.5)
+        columns[f"{room}_Işık"] = rng.uniform(0, 1000, steps).astype(np.float32)
+        columns[f"{room}_CO2"] = walk(600.0, 5.0)
+        columns[f"{room}_Hareket"] = rng.random(steps) < 0.3
+        columns[f"{room}_Doluluk"] = rng.random(steps) < 0.5
+    return pd.DataFrame(columns)
+
+
+def benchmark_window_features(room_counts=(5, 50, 500), days=30):
+    """
+    Oda oda pandas rolling ile tek geçişli pencere çekirdeğinin özellik oluşturma süresini karşılaştırır
+
+    Args:
+        room_counts (tuple): Denenecek oda sayıları
+        days (int): Veri setinin kapsadığı gün sayısı (5 dakikalık adımlarla)
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.vectorized_engine import _benchmark_rooms
+
+    results = []
+    for count in room_counts:
+        rooms = _benchmark_rooms(count)
+        df = _benchmark_frame(rooms, days)
+        topology = HomeTopology.from_columns(df.columns)
+
+        began = time.perf_counter()
+        reference = _pandas_room_features(df, topology)
+        pandas_seconds = time.perf_counter() - began
+
+        began = time.perf_counter()
+        features = room_window_features(df, topology)
+        kernel_seconds = time.perf_counter() - began
+
+        max_error = max(float(np.nanmax(np.abs(np.asarray(features[name], dtype=np.float64)
+                                               - np.asarray(reference[name], dtype=np.float64)), initial=0.0))
+                        for name in reference)
+        result = {
+            "rooms": count,
+            "rows": len(df),
+            "pandas_seconds": pandas_seconds,
+            "kernel_seconds": kernel_seconds,
+            "speedup": pandas_seconds / kernel_seconds if kernel_seconds > 0 else None,
+            "same_columns": list(features) == list(reference),
+            "max_abs_error": max_error,
+        }
+        results.append(result)
+        print(f"{count:4d} oda | {len(df)} satır | pandas: {pandas_seconds:7.2f} sn | çekirdek: {kernel_seconds:7.2f} sn | "
+              f"hızlanma: {result['speedup']:5.1f}x | aynı sütunlar: {result['same_columns']} | "
+              f"en büyük fark: {max_error:.2e}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_window_features()
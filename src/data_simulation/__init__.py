@@ -3,10 +3,25 @@
 from src.data_simulation.sensor_simulator import SensorSimulator
 from src.data_simulation.user_simulator import UserSimulator
 from src.data_simulation.data_generator import HomeDataGenerator, generate_sample_dataset
+from src.data_simulation.fleet_generator import FleetDataGenerator
+from src.data_simulation.dataset_cache import FileCache, DatasetCache
+from src.data_simulation.columnar_io import write_frame, read_frame
+from src.data_simulation.run_length import RunLengthFrame, RunLengthHistory
+from src.data_simulation.multi_rate import MultiRateFrame
+from src.data_simulation.thermal_model import ThermalNetwork
 
 __all__ = [
     'SensorSimulator',
     'UserSimulator',
     'HomeDataGenerator',
-    'generate_sample_dataset'
+    'generate_sample_dataset',
+    'FleetDataGenerator',
+    'FileCache',
+    'DatasetCache',
+    'write_frame',
+    'read_frame',
+    'RunLengthFrame',
+    'RunLengthHistory',
+    'MultiRateFrame',
+    'ThermalNetwork'
 ]
\ No newline at end of file
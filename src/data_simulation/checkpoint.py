@@ -0,0 +1,129 @@
+import os
+import pickle
+from datetime import datetime
+
+# Kontrol noktası içeriğinin biçimi değiştiğinde artırılır (eski dosyalar reddedilir)
+CHECKPOINT_VERSION = 2
+
+
+def save_checkpoint(path, state):
+    """
+    Kontrol noktasını atomik olarak yazar: önce geçici dosyaya yazılır, sonra os.replace ile
+    yerine taşınır. Yazma sırasında kesilen bir çalışma önceki kontrol noktasını bozmaz.
+
+    Args:
+        path (str): Kontrol noktası dosyasının yolu
+        state (dict): Üretim adımı, bileşen durumları ve kaydedilen satırlar
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump({"version": CHECKPOINT_VERSION, **state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Kontrol noktasını okur
+
+    Args:
+        path (str): Kontrol noktası dosyasının yolu
+
+    Returns:
+        dict: Kontrol noktası (dosya yoksa None)
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Desteklenmeyen kontrol noktası sürümü: {state.get('version')}")
+    return state
+
+
+def remove_checkpoint(path):
+    """Tamamlanan üretimin kontrol noktasını (ve kalmışsa geçici dosyasını) siler"""
+    for candidate in (path, path + ".tmp"):
+        if os.path.exists(candidate):
+            os.remove(candidate)
+
+
+def test_checkpoint_resume(days=2, seed=11, checkpoint_every=100, interrupt_after=250, output_dir=None):
+    """
+    Kesintiye uğratılıp kontrol noktasından (farklı bir aralıkla) sürdürülen üretimin, kontrol
+    noktası yazılmayan kesintisiz üretimle bayt düzeyinde aynı CSV'yi verdiğini her üretim modu için doğrular
+
+    Args:
+        days (int): Simüle edilecek gün sayısı
+        seed (int): Üretim tohumu
+        checkpoint_every (int): Kontrol noktası aralığı (adım)
+        interrupt_after (int): Birinci çalışmanın kesileceği adım
+        output_dir (str): Geçici dosyaların dizini (None ise sistem geçici dizini)
+
+    Returns:
+        dict: Mod -> çıktılar aynı mı
+    """
+    import tempfile
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    start_time = datetime(2025, 1, 10, 7, 0)
+    output_dir = output_dir or tempfile.mkdtemp(prefix="checkpoint_test_")
+    modes = {"skaler": {}, "vektörize": {"vectorized": True}, "olay güdümlü": {"event_driven": True}}
+
+    results = {}
+    for name, options in modes.items():
+        tag = name.replace(" ", "_")
+        full_path = os.path.join(output_dir, f"{tag}_full.csv")
+        resumed_path = os.path.join(output_dir, f"{tag}_resumed.csv")
+        checkpoint_path = os.path.join(output_dir, f"{tag}.ckpt")
+
+        # Kontrol noktası yazılmayan kesintisiz çalışma
+        generator = HomeDataGenerator(start_time=start_time, seed=seed, **options)
+        generator.generate_dataset(days=days, csv_path=full_path, verbose=False)
+
+        # Birinci çalışma interrupt_after adımdan sonra kesilir
+        generator = HomeDataGenerator(start_time=start_time, seed=seed, **options)
+        stop_minute = interrupt_after * generator.time_step
+
+        if generator.event_driven:
+            engine_run = generator.event_engine.run
+
+            def interrupt(count, recorder, horizon=None, _generator=generator):
+                if _generator.current_minute >= stop_minute:
+                    raise KeyboardInterrupt
+                return engine_run(count, recorder, horizon)
+
+            generator.event_engine.run = interrupt
+        else:
+            advance = generator.advance
+
+            def interrupt(scheduled=None, _generator=generator):
+                if _generator.current_minute >= stop_minute:
+                    raise KeyboardInterrupt
+                return advance(scheduled)
+
+            generator.advance = interrupt
+        try:
+            generator.generate_dataset(days=days, csv_path=resumed_path, verbose=False,
+                                       checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every)
+        except KeyboardInterrupt:
+            pass
+
+        # Yeni bir üreteç kontrol noktasından başka bir aralıkla devam eder
+        generator = HomeDataGenerator(start_time=start_time, seed=seed, **options)
+        generator.generate_dataset(days=days, csv_path=resumed_path, verbose=False,
+                                   checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every + 7)
+
+        with open(full_path, "rb") as f_full, open(resumed_path, "rb") as f_resumed:
+            results[name] = f_full.read() == f_resumed.read()
+        print(f"{name:13s} | sürdürülen çıktı kesintisizle aynı: {results[name]} | "
+              f"kontrol noktası silindi: {not os.path.exists(checkpoint_path)}")
+    return results
+
+
+if __name__ == "__main__":
+    test_checkpoint_resume()
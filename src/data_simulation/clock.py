@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+import numpy as np
+
+
+class MinuteClock:
+    """
+    Simülasyonun sıcak döngüsünde datetime yerine kullanılan tamsayı dakika saati.
+    Zaman, başlangıçtan itibaren geçen dakika sayısı olarak tutulur; saat, gün içi dakika
+    ve haftanın günü tamsayı aritmetiğiyle hesaplanır. datetime nesneleri yalnızca
+    dışarıya veri verilirken (tek tek veya vektörize olarak) oluşturulur.
+    """
+
+    def __init__(self, start_time):
+        """
+        MinuteClock sınıfını başlatır
+
+        Args:
+            start_time (datetime): Dakika 0'a karşılık gelen zaman
+        """
+        self.start_time = start_time
+        self.start_minute_of_day = start_time.hour * 60 + start_time.minute
+        self.start_weekday = start_time.weekday()
+
+    def minute_of_day(self, minute):
+        """Verilen dakikanın gün içindeki dakikasını döndürür (0-1439)"""
+        return (self.start_minute_of_day + minute) % 1440
+
+    def hour(self, minute):
+        """Verilen dakikanın saatini döndürür (0-23)"""
+        return (self.start_minute_of_day + minute) // 60 % 24
+
+    def weekday(self, minute):
+        """Verilen dakikanın haftanın hangi günü olduğunu döndürür (0 = Pazartesi)"""
+        return (self.start_weekday + (self.start_minute_of_day + minute) // 1440) % 7
+
+    def is_weekend(self, minute):
+        """Verilen dakikanın hafta sonuna denk gelip gelmediğini döndürür"""
+        return self.weekday(minute) >= 5
+
+    def to_datetime(self, minute):
+        """Dakikayı datetime nesnesine çevirir"""
+        return self.start_time + timedelta(minutes=minute)
+
+    def to_minute(self, moment):
+        """datetime nesnesini başlangıçtan itibaren geçen dakikaya çevirir"""
+        return (moment - self.start_time).total_seconds() / 60
+
+    def timestamps(self, minutes):
+        """
+        Dakika dizisini tek bir vektörize işlemle zaman damgası dizisine çevirir
+
+        Args:
+            minutes (numpy.ndarray): Başlangıçtan itibaren geçen dakikalar
+
+        Returns:
+            numpy.ndarray: datetime64[ns] dizisi
+        """
+        return np.datetime64(self.start_time, "ns") + np.asarray(minutes, dtype=np.int64).astype("timedelta64[m]")
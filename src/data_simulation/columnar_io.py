@@ -0,0 +1,500 @@
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.config import config
+from src.topology import default_topology
+from src.data_simulation.run_length import RunLengthColumn, RunLengthFrame, dense_frame
+from src.data_simulation.multi_rate import MultiRateFrame
+
+try:
+    import pyarrow  # noqa: F401 (yalnızca varlığı denetlenir)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Dosya uzantısı -> biçim
+FORMAT_EXTENSIONS = {".csv": "csv", ".parquet": "parquet", ".feather": "feather", ".npz": "npz"}
+# pyarrow gerektiren biçimler (pyarrow yoksa npz'ye düşülür)
+ARROW_FORMATS = ("parquet", "feather")
+
+# Oda kanallarının tipleri; cihaz kanalları da bool'dur
+FLOAT_CHANNELS = ("Sıcaklık", "Nem", "Işık", "CO2")
+BOOL_CHANNELS = ("Hareket", "Doluluk")
+# Oda/kanal düzenine uymayan bilinen sütunlar
+SPECIAL_COLUMNS = {"timestamp": "datetime64[ns]", "Dış_Hava_Sıcaklığı": "float32"}
+
+_NPZ_META = "__meta__"
+
+
+def column_dtypes(columns, topology=None):
+    """
+    Sütun adlarından açık veri tiplerini türetir: sensörler float32, hareket/doluluk ve
+    cihazlar bool, sakin konumları kategori, zaman damgası datetime64. Tanınmayan
+    sütunlar için tip verilmez.
+
+    Args:
+        columns (iterable): Sütun adları
+        topology (HomeTopology): Sütunları çözmek için topoloji (None ise config)
+
+    Returns:
+        dict: Sütun adı -> tip adı
+    """
+    topology = topology or default_topology()
+    dtypes = {}
+    for column in columns:
+        if column in SPECIAL_COLUMNS:
+            dtypes[column] = SPECIAL_COLUMNS[column]
+            continue
+        if str(column).endswith("_Konum"):
+            dtypes[column] = "category"
+            continue
+        pair = topology.parse_column(column)
+        if pair is None:
+            continue
+        channel = pair[1]
+        if channel in FLOAT_CHANNELS:
+            dtypes[column] = "float32"
+        elif channel in BOOL_CHANNELS or channel in topology.device_type_ids:
+            dtypes[column] = "bool"
+    return dtypes
+
+
+def apply_dtypes(df, topology=None):
+    """
+    Veri çerçevesini column_dtypes'ın verdiği tiplere dönüştürür (tipi zaten doğru
+    olan sütunlar kopyalanmaz)
+
+    Args:
+        df (pandas.DataFrame): Giriş veri çerçevesi
+        topology (HomeTopology): Sütunları çözmek için topoloji
+
+    Returns:
+        pandas.DataFrame: Tipleri ayarlanmış veri çerçevesi
+    """
+    converted = {}
+    for column, dtype in column_dtypes(df.columns, topology).items():
+        series = df[column]
+        if dtype == "datetime64[ns]":
+            if series.dtype != "datetime64[ns]":
+                converted[column] = pd.to_datetime(series).astype("datetime64[ns]")
+        elif dtype == "category":
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                converted[column] = series.astype("category")
+        elif dtype == "bool":
+            # Eksik değer içeren bool sütunları olduğu gibi bırakılır
+            if series.dtype != bool and not series.isna().any():
+                converted[column] = series.astype(bool)
+        elif series.dtype != dtype:
+            converted[column] = series.astype(dtype)
+    if not converted:
+        return df
+    return df.assign(**converted)
+
+
+def csv_read_options(path, topology=None, categories=True, bools=True):
+    """
+    CSV dosyasının başlığından pd.read_csv için tip seçeneklerini üretir
+
+    Args:
+        path (str): CSV dosya yolu
+        topology (HomeTopology): Sütunları çözmek için topoloji
+        categories (bool): Kategori tiplerini ver (parça parça okumada kategoriler parçadan
+            parçaya değişeceğinden False verilir)
+        bools (bool): Bool tiplerini ver (eksik değer içerebilecek dosyalarda False verilir)
+
+    Returns:
+        dict: dtype ve parse_dates anahtarları
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = column_dtypes(header, topology)
+    dates = [column for column, dtype in dtypes.items() if dtype == "datetime64[ns]"]
+    skipped = set(dates)
+    if not categories:
+        skipped.update(column for column, dtype in dtypes.items() if dtype == "category")
+    if not bools:
+        skipped.update(column for column, dtype in dtypes.items() if dtype == "bool")
+    return {"dtype": {column: dtype for column, dtype in dtypes.items() if column not in skipped},
+            "parse_dates": dates}
+
+
+def resolve_format(path, file_format=None):
+    """
+    Yazılacak biçimi ve dosya yolunu belirler. Biçim verilmezse uzantıdan çıkarılır;
+    parquet/feather istenip pyarrow kurulu değilse npz'ye düşülür ve uzantı değiştirilir.
+
+    Args:
+        path (str): Dosya yolu
+        file_format (str): "csv", "parquet", "feather" veya "npz" (None ise uzantıdan)
+
+    Returns:
+        tuple: (dosya yolu, biçim)
+    """
+    root, extension = os.path.splitext(path)
+    if file_format is None:
+        file_format = FORMAT_EXTENSIONS.get(extension.lower(), "csv")
+    if file_format not in FORMAT_EXTENSIONS.values():
+        raise ValueError(f"Bilinmeyen dosya biçimi: {file_format}")
+
+    if file_format in ARROW_FORMATS and not HAS_PYARROW:
+        print(f"Uyarı: pyarrow kurulu değil, {file_format} yerine npz biçimi kullanılıyor.")
+        file_format = "npz"
+
+    if FORMAT_EXTENSIONS.get(extension.lower()) != file_format:
+        path = root + "." + file_format
+    return path, file_format
+
+
+def write_frame(df, path, file_format=None, run_length=False):
+    """
+    Veri çerçevesini biçime göre CSV, Parquet, Feather veya npz olarak yazar.
+    İkili biçimler sütun tiplerini (float32, bool, kategori, datetime64) korur.
+
+    Args:
+        df (pandas.DataFrame | RunLengthFrame | MultiRateFrame): Yazılacak veri seti
+        path (str): Dosya yolu
+        file_format (str): Biçim (None ise uzantıdan)
+        run_length (bool): npz'de bool sütunları değişim noktalarıyla sakla
+            (RunLengthFrame/MultiRateFrame npz'de kendi düzeniyle, diğer biçimlerde yoğun yazılır)
+
+    Returns:
+        str: Yazılan dosyanın yolu (npz'ye düşüldüyse uzantısı değişmiş olabilir)
+    """
+    path, file_format = resolve_format(path, file_format)
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    if file_format == "npz":
+        if run_length and isinstance(df, pd.DataFrame):
+            df = RunLengthFrame.from_frame(df)
+        _write_npz(df, path)
+        return path
+
+    df = dense_frame(df)
+    if file_format == "csv":
+        df.to_csv(path, index=False)
+    elif file_format == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(path)
+    return path
+
+
+def read_frame(path, file_format=None, topology=None, dense=True, engine=None):
+    """
+    write_frame ile yazılmış bir dosyayı açık sütun tipleriyle okur. CSV dosyalarında
+    tipler okuma sırasında verilir; böylece sütunlar float64/object olarak ayrıştırılıp
+    sonradan dönüştürülmez. Veri setlerini okuyan tüm çağıranlar bu işlevi kullanır.
+
+    Args:
+        path (str): Dosya yolu
+        file_format (str): Biçim (None ise uzantıdan)
+        topology (HomeTopology): Sütunları çözmek için topoloji
+        dense (bool): Değişim noktalarıyla veya çok hızlı saklanmış npz dosyalarını yoğun
+            DataFrame'e aç; False ise RunLengthFrame/MultiRateFrame olarak döndür
+        engine (str): CSV ayrıştırıcısı, "c" veya "pyarrow" (None ise config; pyarrow
+            kurulu değilse "c")
+
+    Returns:
+        pandas.DataFrame | RunLengthFrame | MultiRateFrame: Okunan veri seti
+    """
+    if file_format is None:
+        file_format = FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower(), "csv")
+
+    if file_format == "csv":
+        engine = engine or config["data_loading"]["csv_engine"]
+        if engine == "pyarrow" and not HAS_PYARROW:
+            engine = "c"
+        try:
+            df = pd.read_csv(path, engine=engine, **csv_read_options(path, topology))
+        except (ValueError, TypeError):
+            # Eksik değer içeren bool sütunları: bool tipi verilmeden okunur, apply_dtypes olduğu gibi bırakır
+            df = pd.read_csv(path, engine=engine, **csv_read_options(path, topology, bools=False))
+    elif file_format == "parquet":
+        df = pd.read_parquet(path)
+    elif file_format == "feather":
+        df = pd.read_feather(path)
+    elif file_format == "npz":
+        df = _read_npz(path)
+        if isinstance(df, RunLengthFrame):
+            if not dense:
+                df.dense = apply_dtypes(df.dense, topology)
+                return df
+            df = df.to_frame()
+        elif isinstance(df, MultiRateFrame):
+            if not dense:
+                return df
+            df = df.to_frame()
+    else:
+        raise ValueError(f"Bilinmeyen dosya biçimi: {file_format}")
+    return apply_dtypes(df, topology)
+
+
+def _encode_series(series, key, arrays):
+    """
+    Bir sütunun değerlerini arrays sözlüğüne key adıyla ekler
+
+    Returns:
+        dict: Değerlerin çözülmesi için gereken tip bilgisi
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        arrays[key] = series.cat.codes.to_numpy()
+        return {"kind": "category", "categories": [str(category) for category in series.cat.categories]}
+    if pd.api.types.is_datetime64_any_dtype(series):
+        arrays[key] = series.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        return {"kind": "datetime"}
+    if series.dtype.kind in "biuf":
+        arrays[key] = series.to_numpy()
+        return {"kind": "numeric"}
+    # Metin ve karışık sütunlar: eksik değerler ayrı bir maskede tutulur
+    missing = series.isna().to_numpy()
+    arrays[key] = np.where(missing, "", series.astype(str).to_numpy()).astype(str)
+    arrays["m" + key] = missing
+    return {"kind": "string"}
+
+
+def _decode_series(entry, data, key):
+    """_encode_series ile eklenmiş değerleri diziye (veya Categorical'a) çevirir"""
+    values = data[key]
+    kind = entry["kind"]
+    if kind == "category":
+        return pd.Categorical.from_codes(values, entry["categories"])
+    if kind == "datetime":
+        return values.view("datetime64[ns]")
+    if kind == "string":
+        values = values.astype(object)
+        values[data["m" + key]] = None
+    return values
+
+
+def _write_npz(df, path):
+    """
+    Veri setini sütun başına bir dizi olarak sıkıştırılmış npz dosyasına yazar.
+    Sütun adları ve tipleri JSON meta verisinde tutulur; pickle kullanılmaz.
+    RunLengthFrame'in kodlanmış sütunları koşu başlangıçları, MultiRateFrame'in
+    sütunları ise yalnızca örnekler veya olaylar olarak saklanır.
+    """
+    arrays, columns, meta = {}, [], {}
+    if isinstance(df, MultiRateFrame):
+        meta["multi_rate"] = {"start": int(df.start.view(np.int64)), "time_step": df.time_step,
+                              "length": df.length}
+        for i, column in enumerate(df.columns):
+            entry = {"name": str(column)}
+            if column in df.sampled:
+                stride, values = df.sampled[column]
+                entry.update(kind="sampled", stride=stride, values=_encode_series(values, f"c{i}", arrays))
+            elif column in df.events:
+                rows, values = df.events[column]
+                arrays[f"r{i}"] = rows
+                entry.update(kind="events", values=_encode_series(values, f"c{i}", arrays))
+            else:
+                # Zaman damgaları başlangıç ve adım süresinden yeniden üretilir
+                entry["kind"] = "grid"
+            columns.append(entry)
+    else:
+        encoded = df.encoded if isinstance(df, RunLengthFrame) else {}
+        frame = df.dense if isinstance(df, RunLengthFrame) else df
+        for i, column in enumerate(df.columns):
+            entry = {"name": str(column)}
+            if column in encoded:
+                entry.update(kind="rle", length=encoded[column].length, first=encoded[column].first)
+                arrays[f"c{i}"] = encoded[column].starts
+            else:
+                entry.update(_encode_series(frame[column], f"c{i}", arrays))
+            columns.append(entry)
+
+    meta["columns"] = columns
+    arrays[_NPZ_META] = np.frombuffer(json.dumps(meta, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+
+    # Yarım kalmış bir dosyanın okunmaması için geçici dosyaya yazılıp taşınır
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(temp_path, path)
+
+
+def _read_npz(path):
+    """
+    _write_npz ile yazılmış dosyayı okur; yazılan türe göre DataFrame, RunLengthFrame
+    veya MultiRateFrame döndürür
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(data[_NPZ_META].tobytes().decode("utf-8"))
+        order = [entry["name"] for entry in meta["columns"]]
+
+        if "multi_rate" in meta:
+            grid = meta["multi_rate"]
+            sampled, events = {}, {}
+            for i, entry in enumerate(meta["columns"]):
+                if entry["kind"] == "sampled":
+                    values = pd.Series(_decode_series(entry["values"], data, f"c{i}"))
+                    sampled[entry["name"]] = (entry["stride"], values)
+                elif entry["kind"] == "events":
+                    values = pd.Series(_decode_series(entry["values"], data, f"c{i}"))
+                    events[entry["name"]] = (data[f"r{i}"], values)
+            return MultiRateFrame(np.int64(grid["start"]).view("datetime64[ns]"), grid["time_step"],
+                                  grid["length"], order, sampled, events)
+
+        columns, encoded = {}, {}
+        for i, entry in enumerate(meta["columns"]):
+            if entry["kind"] == "rle":
+                encoded[entry["name"]] = RunLengthColumn(data[f"c{i}"], entry["first"], entry["length"])
+            else:
+                columns[entry["name"]] = _decode_series(entry, data, f"c{i}")
+    frame = pd.DataFrame(columns, copy=False)
+    if encoded:
+        return RunLengthFrame(frame, encoded, order)
+    return frame
+
+
+def write_bundle(path, frames):
+    """
+    Birden çok veri çerçevesini indeksleriyle birlikte tek bir sıkıştırılmış npz dosyasına yazar.
+    Sütunlar _write_npz ile aynı biçimde (tip bilgisi JSON meta verisinde, pickle olmadan) saklanır.
+
+    Args:
+        path (str): Dosya yolu
+        frames (dict): Ad -> pandas.DataFrame
+
+    Returns:
+        str: Yazılan dosyanın yolu
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    arrays, meta = {}, {"frames": {}}
+    for f, (name, frame) in enumerate(frames.items()):
+        columns = []
+        for i, column in enumerate(frame.columns):
+            entry = {"name": str(column)}
+            entry.update(_encode_series(frame[column], f"f{f}c{i}", arrays))
+            columns.append(entry)
+        index = _encode_series(pd.Series(frame.index), f"f{f}i", arrays)
+        meta["frames"][name] = {"key": f"f{f}", "columns": columns, "index": index}
+    arrays[_NPZ_META] = np.frombuffer(json.dumps(meta, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(temp_path, path)
+    return path
+
+
+def read_bundle(path):
+    """
+    write_bundle ile yazılmış dosyadaki veri çerçevelerini indeksleri ve tipleriyle okur
+
+    Args:
+        path (str): Dosya yolu
+
+    Returns:
+        dict: Ad -> pandas.DataFrame
+    """
+    frames = {}
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(data[_NPZ_META].tobytes().decode("utf-8"))
+        for name, entry in meta["frames"].items():
+            key = entry["key"]
+            columns = {column["name"]: _decode_series(column, data, f"{key}c{i}")
+                       for i, column in enumerate(entry["columns"])}
+            index = pd.Index(_decode_series(entry["index"], data, f"{key}i"))
+            frames[name] = pd.DataFrame(columns, index=index, copy=False)
+    return frames
+
+
+def benchmark_formats(days_list=(1, 30, 365), formats=("parquet", "feather", "npz"), seed=7):
+    """
+    Üretilen veri setlerini CSV ve ikili biçimlerde yazıp dosya boyutu ile yazma/okuma
+    sürelerini karşılaştırır (pyarrow yoksa parquet/feather ölçülmez)
+
+    Args:
+        days_list (tuple): Denenecek gün sayıları
+        formats (tuple): CSV'ye ek olarak ölçülecek biçimler
+        seed (int): Üretim tohumu
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    formats = ["csv"] + [fmt for fmt in formats if fmt not in ARROW_FORMATS or HAS_PYARROW]
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for days in days_list:
+            generator = HomeDataGenerator(seed=seed, event_driven=True)
+            df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+            for file_format in formats:
+                path = os.path.join(directory, f"data_{days}.{file_format}")
+
+                began = time.perf_counter()
+                path = write_frame(df, path, file_format)
+                write_seconds = time.perf_counter() - began
+
+                began = time.perf_counter()
+                loaded = read_frame(path)
+                read_seconds = time.perf_counter() - began
+
+                result = {
+                    "days": days,
+                    "rows": len(df),
+                    "format": file_format,
+                    "megabytes": os.path.getsize(path) / 2**20,
+                    "write_ms": write_seconds * 1000,
+                    "read_ms": read_seconds * 1000,
+                    "same_shape": loaded.shape == df.shape,
+                }
+                results.append(result)
+                print(f"{days:4d} gün | {len(df):7d} satır | {file_format:8s} | {result['megabytes']:8.2f} MiB | "
+                      f"yazma: {result['write_ms']:8.1f} ms | okuma: {result['read_ms']:8.1f} ms")
+    return results
+
+
+def benchmark_csv_loading(days=30, seed=7):
+    """
+    Aynı CSV dosyasını tipsiz pd.read_csv ve read_frame (C ve varsa pyarrow ayrıştırıcısıyla)
+    ile okuyup süre ve bellek kullanımını karşılaştırır
+
+    Args:
+        days (int): Üretilecek gün sayısı
+        seed (int): Üretim tohumu
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    generator = HomeDataGenerator(seed=seed)
+    df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+    loaders = [("pd.read_csv", lambda path: pd.read_csv(path)),
+               ("read_frame (c)", lambda path: read_frame(path, engine="c"))]
+    if HAS_PYARROW:
+        loaders.append(("read_frame (pyarrow)", lambda path: read_frame(path, engine="pyarrow")))
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_frame(df, os.path.join(directory, "data.csv"), "csv")
+        for name, loader in loaders:
+            began = time.perf_counter()
+            loaded = loader(path)
+            seconds = time.perf_counter() - began
+            result = {
+                "loader": name,
+                "rows": len(loaded),
+                "read_ms": seconds * 1000,
+                "megabytes": loaded.memory_usage(deep=True).sum() / 2**20,
+            }
+            results.append(result)
+            print(f"{name:22s} | {len(loaded):7d} satır | okuma: {result['read_ms']:8.1f} ms | "
+                  f"bellek: {result['megabytes']:8.2f} MiB")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_formats()
+    benchmark_csv_loading()
@@ -1,12 +1,39 @@
 import numpy as np
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
 import random
 from src.config import config
+from src.topology import default_topology
 
 from src.data_simulation.sensor_simulator import SensorSimulator
 from src.data_simulation.user_simulator import UserSimulator
+from src.data_simulation.dataset_writer import ChunkedCSVWriter
+from src.data_simulation.columnar_io import write_frame
+from src.data_simulation.run_length import RunLengthFrame
+from src.data_simulation.multi_rate import MultiRateFrame
+from src.data_simulation.recorder import ColumnarRecorder
+from src.data_simulation.clock import MinuteClock
+from src.data_simulation.event_engine import EventDrivenEngine
+from src.data_simulation.checkpoint import save_checkpoint, load_checkpoint, remove_checkpoint
+
+# Aynı parametre ve tohumla üretilen verinin değerleri değiştiğinde artırılır
+# (veri seti önbelleği anahtarının parçasıdır, eski girdiler böylece kullanılmaz)
+GENERATOR_VERSION = "9"
+
+def derive_seeds(seed, count):
+    """
+    Bir ana tohumdan birbirinden bağımsız alt tohumlar türetir
+    
+    Args:
+        seed (int): Ana tohum (None ise tüm alt tohumlar None olur)
+        count (int): Türetilecek tohum sayısı
+        
+    Returns:
+        list: Alt tohumlar
+    """
+    if seed is None:
+        return [None] * count
+    return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(count)]
 
 class HomeDataGenerator:
     """
@@ -14,7 +41,8 @@ class HomeDataGenerator:
     Sensör verileri ve kullanıcı davranışlarını entegre ederek gerçekçi bir veri seti oluşturur.
     """
     
-    def __init__(self, start_time=None, rooms=None, num_residents=2, time_step=5):
+    def __init__(self, start_time=None, rooms=None, num_residents=2, time_step=5, vectorized=False, seed=None,
+                 event_driven=False, weather=None, topology=None, sampling_rates=None, thermal_model=None):
         """
         HomeDataGenerator sınıfını başlatır
         
@@ -23,18 +51,43 @@ class HomeDataGenerator:
             rooms (list): Simüle edilecek odaların listesi
             num_residents (int): Ev sakinlerinin sayısı
             time_step (int): Simülasyon adımları arasındaki dakika farkı
+            vectorized (bool): Sensör simülatöründe vektörize oda motorunu kullan
+            seed (int): Tekrarlanabilir üretim için tohum (None ise global random modülü kullanılır)
+            event_driven (bool): Veri setlerini olay güdümlü motorla üret (istatistiksel olarak eşdeğer, çok daha hızlı)
+            weather (WeatherTimeline): Oda sıcaklıklarını etkileyen dış hava zaman serisi (birden çok evde paylaşılabilir)
+            topology (HomeTopology): Oda/cihaz topolojisi (None ise odalar için config'den oluşturulan ortak topoloji)
+            sampling_rates (dict): Çok hızlı saklamada kanal -> dakika veya "event" (config'deki değerlerin üzerine yazılır)
+            thermal_model (bool | ThermalNetwork): Oda sıcaklıklarını RC ısıl ağla hesapla (olay güdümlü modla kullanılamaz)
         """
+        if event_driven and thermal_model:
+            raise ValueError("Isıl ağ modeli olay güdümlü modla birlikte kullanılamaz")
+        
         self.start_time = start_time or datetime.now()
-        self.rooms = rooms or config["rooms"]
+        self.topology = topology or default_topology(rooms)
+        self.rooms = rooms or self.topology.rooms
         self.time_step = time_step
-        self.current_time = self.start_time
+        self.clock = MinuteClock(self.start_time)
+        self.current_minute = 0
+        self.seed = seed
+        
+        # Her bileşen tohumdan türetilen bağımsız bir akış kullanır
+        sensor_seed, user_seed, device_seed, event_seed = derive_seeds(seed, 4)
+        self.random = random.Random(device_seed) if seed is not None else random
         
         # Simülatörleri başlat
-        self.sensor_simulator = SensorSimulator(rooms=self.rooms, start_time=self.start_time, time_step=self.time_step)
-        self.user_simulator = UserSimulator(num_residents=num_residents, rooms=self.rooms)
+        self.sensor_simulator = SensorSimulator(rooms=self.rooms, start_time=self.start_time, time_step=self.time_step,
+                                                vectorized=vectorized, seed=sensor_seed, weather=weather,
+                                                topology=self.topology, sampling_rates=sampling_rates,
+                                                thermal_model=thermal_model)
+        self.user_simulator = UserSimulator(num_residents=num_residents, rooms=self.rooms, seed=user_seed,
+                                            start_time=self.start_time)
         
         # Cihazların manuel kullanım olasılıkları (kullanıcı tarafından açma/kapama)
         self.manual_operation_prob = config["manual_operation_prob"]
+        
+        # Olay güdümlü mod: uzun ufuklarda adım döngüsü yerine tüm aralığı tek seferde üretir
+        self.event_driven = event_driven
+        self.event_engine = EventDrivenEngine(self, seed=event_seed) if event_driven else None
     
     def _update_devices_by_user_behavior(self, user_locations):
         """
@@ -44,10 +97,10 @@ class HomeDataGenerator:
             user_locations (dict): Kullanıcı konumları
         """
         # Hangi odalarda insan var?
-        occupied_rooms = []
-        for location in user_locations.values():
-            if location in self.rooms:
-                occupied_rooms.append(location)
+        room_ids = self.topology.room_ids
+        occupied_rooms = {location for location in user_locations.values() if location in room_ids}
+        
+        hour = self.clock.hour(self.current_minute)
         
         # Cihaz durumlarını güncelle
         for room in self.rooms:
@@ -56,61 +109,83 @@ class HomeDataGenerator:
             
             for device in devices:
                 # Kullanıcının cihazı manuel olarak kontrol etme olasılığı
-                if is_occupied and random.random() < self.manual_operation_prob.get(device, 0.5):
+                if is_occupied and self.random.random() < self.manual_operation_prob.get(device, 0.5):
                     if device == "Lamba":
                         # Oda doluysa ve saat akşamsa lambayı açma olasılığı yüksek
-                        if 18 <= self.current_time.hour <= 23 or 0 <= self.current_time.hour <= 6:
-                            devices[device] = random.random() < 0.9  # %90 açık
+                        if 18 <= hour <= 23 or 0 <= hour <= 6:
+                            devices[device] = self.random.random() < 0.9  # %90 açık
                         else:
-                            devices[device] = random.random() < 0.3  # %30 açık
+                            devices[device] = self.random.random() < 0.3  # %30 açık
                     
                     elif device == "Klima":
                         # Sıcaklık yüksekse klimayı açma olasılığı yüksek
                         temp = self.sensor_simulator.room_status[room]["Sıcaklık"]
                         if temp > config["automation_thresholds"]["high_temp_threshold"]:
-                            devices[device] = random.random() < 0.8  # %80 açık
+                            devices[device] = self.random.random() < 0.8  # %80 açık
                         elif temp < 20:
-                            devices[device] = random.random() < 0.2  # %20 açık
+                            devices[device] = self.random.random() < 0.2  # %20 açık
                         else:
-                            devices[device] = random.random() < 0.4  # %40 açık
+                            devices[device] = self.random.random() < 0.4  # %40 açık
                     
                     elif device == "Perde":
                         # Sabah saatlerinde perdeyi açma olasılığı yüksek
-                        if 7 <= self.current_time.hour <= 10:
-                            devices[device] = random.random() < 0.9  # %90 açık
+                        if 7 <= hour <= 10:
+                            devices[device] = self.random.random() < 0.9  # %90 açık
                         # Akşam saatlerinde perdeyi kapatma olasılığı yüksek
-                        elif 19 <= self.current_time.hour <= 23:
-                            devices[device] = random.random() < 0.2  # %20 açık
+                        elif 19 <= hour <= 23:
+                            devices[device] = self.random.random() < 0.2  # %20 açık
                         else:
-                            devices[device] = random.random() < 0.5  # %50 açık
+                            devices[device] = self.random.random() < 0.5  # %50 açık
                     
                     elif device == "Havalandırma":
                         # CO2 seviyesi yüksekse havalandırmayı açma olasılığı yüksek
                         co2 = self.sensor_simulator.room_status[room]["CO2"]
                         if co2 > config["automation_thresholds"]["high_co2_threshold"]:
-                            devices[device] = random.random() < 0.7  # %70 açık
+                            devices[device] = self.random.random() < 0.7  # %70 açık
                         else:
-                            devices[device] = random.random() < 0.3  # %30 açık
+                            devices[device] = self.random.random() < 0.3  # %30 açık
             
             # Oda boşsa ve belirli bir süre geçtiyse, cihazları otomatik olarak kapat (enerji tasarrufu)
             if not is_occupied:
                 # Son hareket zamanından bu yana geçen süre (dakika)
-                time_since_last_movement = (self.current_time - self.sensor_simulator.room_status[room]["Son_Hareket"]).total_seconds() / 60
+                time_since_last_movement = self.current_minute - self.sensor_simulator.room_status[room]["Son_Hareket"]
                 
                 if time_since_last_movement > config["automation_thresholds"]["empty_room_device_off_delay_min"]:  # 15 dakikadan fazla süre geçtiyse
                     # Lambaları %90 olasılıkla kapat
-                    if "Lamba" in devices and devices["Lamba"] and random.random() < 0.9:
+                    if "Lamba" in devices and devices["Lamba"] and self.random.random() < 0.9:
                         devices["Lamba"] = False
                 
                 if time_since_last_movement > config["automation_thresholds"]["empty_room_ac_off_delay_min"]:  # 30 dakikadan fazla süre geçtiyse
                     # Klimayı %70 olasılıkla kapat
-                    if "Klima" in devices and devices["Klima"] and random.random() < 0.7:
+                    if "Klima" in devices and devices["Klima"] and self.random.random() < 0.7:
                         devices["Klima"] = False
                     
                     # Havalandırmayı %80 olasılıkla kapat
-                    if "Havalandırma" in devices and devices["Havalandırma"] and random.random() < 0.8:
+                    if "Havalandırma" in devices and devices["Havalandırma"] and self.random.random() < 0.8:
                         devices["Havalandırma"] = False
     
+    def _scheduled_timeline(self, count):
+        """
+        Mevcut zamandan sonraki adımlar için sakinlerin planlanan konumlarını döndürür
+        
+        Args:
+            count (int): Adım sayısı
+            
+        Returns:
+            list: Her adım için sakin sırasına göre planlanan konumlar
+        """
+        minutes = self.current_minute + self.time_step * np.arange(1, count + 1)
+        return self.user_simulator.scheduled_timeline(minutes).tolist()
+    
+    @property
+    def current_time(self):
+        """Mevcut simülasyon zamanı (datetime olarak)"""
+        return self.clock.to_datetime(self.current_minute)
+    
+    @current_time.setter
+    def current_time(self, value):
+        self.current_minute = round(self.clock.to_minute(value))
+    
     def update_simulation(self):
         """
         Simülasyonu bir adım ilerletir
@@ -118,28 +193,94 @@ class HomeDataGenerator:
         Returns:
             dict: Güncellenmiş simülasyon durumu
         """
+        self.advance()
+        
+        # Güncellenmiş tam durumu al
+        return self.get_current_state()
+    
+    def advance(self, scheduled=None):
+        """
+        Simülasyonu durum sözlüğü oluşturmadan bir adım ilerletir
+        
+        Args:
+            scheduled (list): Bu adım için önceden hesaplanmış planlanan sakin konumları
+                (None ise kullanıcı simülatörü tarafından hesaplanır)
+        """
         # Simülasyon zamanını güncelle
-        self.current_time += timedelta(minutes=self.time_step)
+        self.current_minute += self.time_step
         
         # Kullanıcı konumlarını güncelle
-        user_locations = self.user_simulator.update_locations(self.current_time)
+        user_locations = self.user_simulator.advance_to(self.current_minute, scheduled)
         
         # Kullanıcı davranışlarına göre cihazları güncelle
         self._update_devices_by_user_behavior(user_locations)
         
         # Sensör verilerini güncelle
-        self.sensor_simulator.current_time = self.current_time
-        sensor_state = self.sensor_simulator.update_simulation(self.time_step)
+        self.sensor_simulator.current_minute = self.current_minute
+        self.sensor_simulator.advance(self.time_step)
         
         # Oda doluluklarını kullanıcı konumlarına göre güncelle
         room_occupancy = self.user_simulator.get_room_occupancy()
         for room in self.rooms:
             self.sensor_simulator.room_status[room]["Doluluk"] = room_occupancy[room]
+    
+    def get_state(self):
+        """
+        Üretecin ve alt simülatörlerinin değişken durumunu (RNG durumları dahil)
+        kontrol noktasına yazılabilecek bir kopya olarak döndürür
         
-        # Güncellenmiş tam durumu al
-        full_state = self.get_current_state()
+        Returns:
+            dict: set_state ile geri yüklenebilecek durum
+        """
+        state = {
+            "current_minute": self.current_minute,
+            "random": self.random.getstate(),
+            "sensor_simulator": self.sensor_simulator.get_state(),
+            "user_simulator": self.user_simulator.get_state(),
+        }
+        if self.event_driven:
+            state["event_engine"] = self.event_engine.get_state()
+        return state
+    
+    def set_state(self, state):
+        """
+        get_state ile alınmış durumu geri yükler
         
-        return full_state
+        Args:
+            state (dict): get_state çıktısı
+        """
+        self.current_minute = state["current_minute"]
+        self.random.setstate(state["random"])
+        self.sensor_simulator.set_state(state["sensor_simulator"])
+        self.user_simulator.set_state(state["user_simulator"])
+        if self.event_driven:
+            self.event_engine.set_state(state["event_engine"])
+    
+    def checkpoint_params(self, steps):
+        """
+        Üretilen veriyi belirleyen parametreleri döndürür; kontrol noktasına yazılır ve
+        sürdürmeden önce mevcut üreteçle karşılaştırılır
+        
+        Args:
+            steps (int): Üretimin toplam adım sayısı
+            
+        Returns:
+            dict: Parametre adı -> değer
+        """
+        return {
+            "version": GENERATOR_VERSION,
+            "steps": steps,
+            "time_step": self.time_step,
+            "seed": self.seed,
+            "start_time": self.start_time.isoformat(),
+            "rooms": list(self.rooms),
+            "devices": {room: list(self.topology.room_devices[room]) for room in self.rooms},
+            "num_residents": self.user_simulator.num_residents,
+            "event_driven": self.event_driven,
+            "vectorized": self.sensor_simulator.vectorized,
+            "thermal_model": self.sensor_simulator.thermal is not None,
+            "weather": self.sensor_simulator.weather is not None,
+        }
     
     def get_current_state(self):
         """
@@ -165,59 +306,186 @@ class HomeDataGenerator:
         
         return state
     
-    def generate_dataset(self, days=1, save_to_csv=True, csv_path=None):
+    def generate_dataset(self, days=1, save_to_csv=True, csv_path=None, verbose=True, file_format=None,
+                         run_length=False, multi_rate=False, checkpoint_path=None, checkpoint_every=1000):
         """
         Belirli bir süre için veri seti üretir
         
         Args:
             days (int): Simüle edilecek gün sayısı
-            save_to_csv (bool): Verileri CSV'ye kaydetme durumu
-            csv_path (str): Kaydedilecek CSV dosyasının yolu
+            save_to_csv (bool): Verileri dosyaya kaydetme durumu
+            csv_path (str): Kaydedilecek dosyanın yolu
+            verbose (bool): İlerleme bilgisini yazdır
+            file_format (str): "csv", "parquet", "feather" veya "npz" (None ise csv_path uzantısından, o da yoksa csv)
+            run_length (bool): Hareket, doluluk ve cihaz sütunlarını değişim noktalarıyla sakla
+            multi_rate (bool): Her kanalı sensör simülatörünün sampling_rates hızında sakla (MultiRateFrame)
+            checkpoint_path (str): Kontrol noktası dosyası. Dosya varsa üretim kaldığı adımdan sürdürülür,
+                üretim tamamlanınca silinir (None ise kontrol noktası yazılmaz)
+            checkpoint_every (int): Kontrol noktaları arasındaki adım sayısı. Çıktı bu değerden bağımsızdır;
+                sürdürülen üretim kesintisiz üretimle aynıdır
             
         Returns:
-            pandas.DataFrame: Üretilen veri seti
+            pandas.DataFrame | RunLengthFrame | MultiRateFrame: Üretilen veri seti
         """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every en az 1 olmalıdır")
+        
         # Başlangıç zamanını ayarla
-        self.current_time = self.start_time
+        self.current_minute = 0
         
         # Simülasyon için adım sayısını hesapla
         steps = int((days * 24 * 60) / self.time_step)
         
-        all_states = []
+        # Sütun dizilerini adım sayısına göre önceden ayır
+        recorder = ColumnarRecorder(self, steps)
         
-        print(f"{days} gün için veri üretiliyor ({steps} adım)...")
+        # Kontrol noktası varsa durumu ve kaydedilen satırları geri yükle
+        first = 0
+        params = self.checkpoint_params(steps)
+        checkpoint = load_checkpoint(checkpoint_path) if checkpoint_path else None
+        if checkpoint is not None:
+            mismatched = [name for name, value in params.items() if checkpoint["params"].get(name) != value]
+            if mismatched:
+                raise ValueError(f"Kontrol noktası bu üretimle uyumsuz ({', '.join(mismatched)}): {checkpoint_path}")
+            self.set_state(checkpoint["generator"])
+            recorder.set_state(checkpoint["recorder"])
+            first = checkpoint["step"]
+            if verbose:
+                print(f"Kontrol noktasından devam ediliyor: {first}/{steps} adım")
         
-        # Her adım için simülasyonu güncelle
-        for i in range(steps):
-            state = self.update_simulation()
-            all_states.append(state)
+        def save(step):
+            save_checkpoint(checkpoint_path, {"step": step, "params": params, "checkpoint_every": checkpoint_every,
+                                              "generator": self.get_state(), "recorder": recorder.get_state()})
+        
+        if self.event_driven:
+            if verbose:
+                print(f"{days} gün için olay güdümlü veri üretiliyor ({steps} adım)...")
+            # Motor sabit uzunlukta bloklar simüle ettiğinden çağrı boyutu çıktıyı değiştirmez
+            block = checkpoint_every if checkpoint_path else max(steps, 1)
+            for start in range(first, steps, block):
+                count = min(block, steps - start)
+                self.event_engine.run(count, recorder, horizon=steps - start)
+                if checkpoint_path and start + count < steps:
+                    save(start + count)
+        else:
+            if verbose:
+                print(f"{days} gün için veri üretiliyor ({steps} adım)...")
+            
+            # Kalan ufkun planlanan sakin konumlarını tek seferde hesapla
+            schedule = self._scheduled_timeline(steps - first)
             
-            # İlerleme göster
-            if (i + 1) % 100 == 0 or i == steps - 1:
-                print(f"İlerleme: {i + 1}/{steps} adım ({((i + 1) / steps * 100):.1f}%)")
+            # Her adım için simülasyonu güncelle
+            for i in range(first, steps):
+                self.advance(schedule[i - first])
+                recorder.record(self)
+                
+                if checkpoint_path and (i + 1) % checkpoint_every == 0 and i + 1 < steps:
+                    save(i + 1)
+                
+                # İlerleme göster
+                if verbose and ((i + 1) % 100 == 0 or i == steps - 1):
+                    print(f"İlerleme: {i + 1}/{steps} adım ({((i + 1) / steps * 100):.1f}%)")
         
         # DataFrame oluştur
-        df = pd.DataFrame(all_states)
+        df = recorder.to_frame()
+        if multi_rate:
+            df = MultiRateFrame.from_frame(df, self.sensor_simulator.sampling_rates, self.time_step, self.topology)
+        elif run_length:
+            df = RunLengthFrame.from_frame(df)
         
-        # CSV'ye kaydet
+        # Dosyaya kaydet (ikili biçimler sütun tiplerini korur)
         if save_to_csv:
             if csv_path is None:
-                # Varsayılan dosya yolu
-                directory = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "raw")
-                
-                # Dizin yoksa oluştur
-                if not os.path.exists(directory):
-                    os.makedirs(directory)
-                
-                csv_path = os.path.join(directory, f"home_data_{self.start_time.strftime('%Y%m%d_%H%M')}.csv")
+                csv_path = self._default_csv_path()
             
-            df.to_csv(csv_path, index=False)
-            print(f"Veri seti {csv_path} konumuna kaydedildi.")
+            csv_path = write_frame(df, csv_path, file_format)
+            if verbose:
+                print(f"Veri seti {csv_path} konumuna kaydedildi.")
+        
+        # Üretim tamamlandı, kontrol noktasına artık gerek yok
+        if checkpoint_path:
+            remove_checkpoint(checkpoint_path)
         
         return df
+    
+    def iter_dataset(self, days=1, chunk_size=10000):
+        """
+        Veri setini sabit boyutlu DataFrame parçaları halinde üretir.
+        Yalnızca mevcut parça bellekte tutulduğu için bellek kullanımı gün sayısından bağımsızdır.
+        
+        Args:
+            days (int): Simüle edilecek gün sayısı
+            chunk_size (int): Her parçadaki satır sayısı
+            
+        Yields:
+            pandas.DataFrame: generate_dataset ile aynı sütunlara sahip veri parçası
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size en az 1 olmalıdır")
+        
+        # Başlangıç zamanını ayarla
+        self.current_minute = 0
+        
+        # Simülasyon için adım sayısını hesapla
+        steps = int((days * 24 * 60) / self.time_step)
+        
+        # Parça dizileri bir kez ayrılır ve her parçadan sonra yeniden kullanılır
+        recorder = ColumnarRecorder(self, min(chunk_size, steps))
+        for first in range(0, steps, chunk_size):
+            count = min(chunk_size, steps - first)
+            if self.event_driven:
+                self.event_engine.run(count, recorder, horizon=steps - first)
+            else:
+                # Planlanan sakin konumları parça başına tek seferde hesaplanır
+                for scheduled in self._scheduled_timeline(count):
+                    self.advance(scheduled)
+                    recorder.record(self)
+            yield recorder.to_frame(copy=True)
+            recorder.reset()
+    
+    def stream_dataset(self, days=1, csv_path=None, chunk_size=10000, verbose=True):
+        """
+        Veri setini parça parça üretip doğrudan CSV dosyasına yazar
+        
+        Args:
+            days (int): Simüle edilecek gün sayısı
+            csv_path (str): Kaydedilecek CSV dosyasının yolu
+            chunk_size (int): Her parçadaki satır sayısı
+            verbose (bool): İlerleme bilgisini yazdır
+            
+        Returns:
+            str: Yazılan CSV dosyasının yolu
+        """
+        if csv_path is None:
+            csv_path = self._default_csv_path()
+        
+        steps = int((days * 24 * 60) / self.time_step)
+        if verbose:
+            print(f"{days} gün için veri akışı başlatılıyor ({steps} adım, parça boyutu: {chunk_size})...")
+        
+        with ChunkedCSVWriter(csv_path) as writer:
+            for chunk in self.iter_dataset(days=days, chunk_size=chunk_size):
+                writer.write(chunk)
+                if verbose:
+                    print(f"İlerleme: {writer.rows_written}/{steps} adım ({writer.rows_written / steps * 100:.1f}%)")
+        
+        if verbose:
+            print(f"Veri seti {csv_path} konumuna kaydedildi.")
+        
+        return csv_path
+    
+    def _default_csv_path(self):
+        """Varsayılan CSV dosya yolunu döndürür (data/raw dizini yoksa oluşturur)"""
+        directory = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "raw")
+        
+        # Dizin yoksa oluştur
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        return os.path.join(directory, f"home_data_{self.start_time.strftime('%Y%m%d_%H%M')}.csv")
 
 # Ana işlev
-def generate_sample_dataset(days=3, rooms=None, num_residents=3):
+def generate_sample_dataset(days=3, rooms=None, num_residents=3, seed=None, cache=None):
     """
     Örnek bir veri seti oluşturur ve CSV olarak kaydeder
     
@@ -225,6 +493,8 @@ def generate_sample_dataset(days=3, rooms=None, num_residents=3):
         days (int): Simüle edilecek gün sayısı
         rooms (list): Simüle edilecek odaların listesi
         num_residents (int): Simüle edilecek ev sakini sayısı
+        seed (int): Tekrarlanabilir üretim için tohum
+        cache (DatasetCache): Veri seti önbelleği (tohum verildiyse aynı veri yeniden üretilmez)
         
     Returns:
         pandas.DataFrame: Üretilen veri seti
@@ -233,18 +503,23 @@ def generate_sample_dataset(days=3, rooms=None, num_residents=3):
     if rooms is None:
         rooms = ["Salon", "Yatak Odası", "Çocuk Odası", "Mutfak", "Banyo"]
     
-    # Simülasyon başlangıç zamanını ayarla (bugün sabah 8:00)
-    start_time = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
-    
-    # Veri üreticiyi başlat
-    generator = HomeDataGenerator(
-        start_time=start_time,
-        rooms=rooms,
-        num_residents=num_residents
-    )
-    
-    # Veri setini üret
-    dataset = generator.generate_dataset(days=days)
+    if cache is not None and seed is not None:
+        # Önbellekli üretimde başlangıç zamanı sabittir, çıktı yalnızca parametrelere bağlıdır
+        dataset, _, _ = cache.load_or_generate(days=days, rooms=rooms, num_residents=num_residents, seed=seed)
+    else:
+        # Simülasyon başlangıç zamanını ayarla (bugün sabah 8:00)
+        start_time = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+        
+        # Veri üreticiyi başlat
+        generator = HomeDataGenerator(
+            start_time=start_time,
+            rooms=rooms,
+            num_residents=num_residents,
+            seed=seed
+        )
+        
+        # Veri setini üret
+        dataset = generator.generate_dataset(days=days)
     
     print(f"\nVeri seti boyutu: {dataset.shape}")
     print(f"Veri seti örneği (ilk 5 satır):")
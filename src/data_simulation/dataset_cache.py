@@ -0,0 +1,396 @@
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from src.config import config
+from src.data_simulation.data_generator import HomeDataGenerator, GENERATOR_VERSION
+
+# Tohum verildiğinde çıktının yalnızca parametrelere bağlı olması için sabit başlangıç zamanı (Pazartesi 08:00)
+DEFAULT_CACHE_START = datetime(2025, 1, 6, 8, 0)
+
+
+class FileCache:
+    """
+    Değerleri anahtarla adreslenen ikili dosyalarda saklayan disk önbelleği.
+    Girdiler index.json dosyasında izlenir ve sayı veya toplam boyut sınırı aşıldığında
+    en uzun süredir kullanılmayan girdiler silinir. Alt sınıflar anahtar üretimini ve
+    gerekirse _write/_read/_rows ile dosya biçimini belirler.
+    """
+
+    INDEX_FILE = "index.json"
+    EXTENSION = ".pkl"
+
+    def __init__(self, cache_dir, max_entries=20, max_bytes=512 * 2**20):
+        """
+        FileCache sınıfını başlatır
+
+        Args:
+            cache_dir (str): Önbellek dizini
+            max_entries (int): Saklanacak en fazla girdi sayısı
+            max_bytes (int): Önbelleğin toplam boyut sınırı (bayt)
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _path(self, key):
+        """Anahtarın veri dosyası yolunu döndürür"""
+        return os.path.join(self.cache_dir, key + self.EXTENSION)
+
+    def _load_index(self):
+        """index.json dosyasını okur, dosyası silinmiş girdileri atlar"""
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            print("Uyarı: Önbellek dizini okunamadı, boş dizinle devam ediliyor.")
+            return {}
+        return {key: entry for key, entry in index.items() if os.path.exists(self._path(key))}
+
+    def _save_index(self):
+        """index.json dosyasını atomik olarak yazar"""
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=4)
+        os.replace(temp_path, path)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    @staticmethod
+    def hash_params(params):
+        """
+        Parametre sözlüğünden kararlı bir önbellek anahtarı üretir. Değerler JSON ile ifade
+        edilebilir olmalıdır; nesnelerin str() çıktısı bellek adresi içerebildiğinden diğer
+        türler reddedilir.
+
+        Args:
+            params (dict): Çıktıyı belirleyen parametreler
+
+        Returns:
+            str: 64 karakterlik onaltılık anahtar
+        """
+        try:
+            payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        except (TypeError, ValueError) as error:
+            raise TypeError(f"Önbellek anahtarı parametreleri JSON ile ifade edilebilir olmalı: {error}") from error
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _write(self, value, path):
+        """Değeri dosyaya yazar"""
+        value.to_pickle(path, compression=None)
+
+    def _read(self, path):
+        """Değeri dosyadan okur"""
+        return pd.read_pickle(path)
+
+    def _rows(self, value):
+        """İndekste saklanacak satır sayısını döndürür"""
+        return len(value)
+
+    def get(self, key):
+        """
+        Anahtara karşılık gelen değeri okur
+
+        Args:
+            key (str): Önbellek anahtarı
+
+        Returns:
+            Saklanan değer (önbellekte yoksa None)
+        """
+        if key not in self.index:
+            self.misses += 1
+            return None
+
+        try:
+            value = self._read(self._path(key))
+        except Exception as e:
+            # Bozuk veya silinmiş dosya: girdiyi at, veri yeniden üretilsin
+            print(f"Uyarı: Önbellek girdisi okunamadı ({e}), yeniden üretilecek.")
+            self._remove(key)
+            self._save_index()
+            self.misses += 1
+            return None
+
+        self.index[key]["last_access"] = time.time()
+        self._save_index()
+        self.hits += 1
+        return value
+
+    def touch(self, key):
+        """
+        Girdiyi okumadan kullanıldı olarak işaretler: son erişim zamanı güncellenir ve isabet
+        sayılır. Değerin kendisine gerek olmayan çağıranlar (ör. dosyası zaten diskte olan veri
+        seti) içindir. Girdi yoksa ıska sayılmaz; ardından yapılacak get çağrısı sayar.
+
+        Args:
+            key (str): Önbellek anahtarı
+
+        Returns:
+            bool: Girdi önbellekte ve dosyası diskte ise True
+        """
+        if key not in self.index:
+            return False
+        if not os.path.exists(self._path(key)):
+            # Silinmiş dosya: girdiyi at, veri yeniden üretilsin
+            self._remove(key)
+            self._save_index()
+            return False
+
+        self.index[key]["last_access"] = time.time()
+        self._save_index()
+        self.hits += 1
+        return True
+
+    def put(self, key, value, params=None):
+        """
+        Değeri önbelleğe yazar ve gerekirse eski girdileri siler
+
+        Args:
+            key (str): Önbellek anahtarı
+            value: Saklanacak değer
+            params (dict): İndekste saklanacak parametreler
+
+        Returns:
+            str: Veri dosyasının yolu
+        """
+        path = self._path(key)
+        temp_path = path + ".tmp"
+        self._write(value, temp_path)
+        os.replace(temp_path, path)
+
+        now = time.time()
+        self.index[key] = {
+            "bytes": os.path.getsize(path),
+            "rows": self._rows(value),
+            "created": now,
+            "last_access": now,
+            "params": params or {},
+        }
+        self.evict(keep=key)
+        self._save_index()
+        return path
+
+    def _remove(self, key):
+        """Girdiyi ve veri dosyasını siler"""
+        self.index.pop(key, None)
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def evict(self, keep=None):
+        """
+        Sayı ve boyut sınırları sağlanana kadar en uzun süredir kullanılmayan girdileri siler
+
+        Args:
+            keep (str): Silinmeyecek anahtar (ör. yeni yazılan girdi)
+
+        Returns:
+            list: Silinen anahtarlar
+        """
+        removed = []
+        by_age = sorted(self.index, key=lambda key: self.index[key]["last_access"])
+        for key in by_age:
+            if len(self.index) <= self.max_entries and self.total_bytes() <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._remove(key)
+            removed.append(key)
+        return removed
+
+    def total_bytes(self):
+        """Önbellekteki veri dosyalarının toplam boyutunu döndürür"""
+        return sum(entry["bytes"] for entry in self.index.values())
+
+    def clear(self):
+        """Tüm girdileri siler"""
+        for key in list(self.index):
+            self._remove(key)
+        self._save_index()
+
+    def stats(self):
+        """
+        Önbellek ölçümlerini döndürür
+
+        Returns:
+            dict: İsabet, ıska, isabet oranı, girdi sayısı ve toplam boyut
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.index),
+            "bytes": self.total_bytes(),
+        }
+
+
+class DatasetCache(FileCache):
+    """
+    Üretilen veri setlerini üretim parametrelerinin özetiyle (SHA-256) adreslenen ikili
+    dosyalarda saklayan önbellek. Aynı parametrelerle yapılan tekrar çağrılar veriyi yeniden
+    üretmek yerine diskten okur; sütun tipleri (float32, bool, kategori) korunur.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=20, max_bytes=512 * 2**20):
+        """
+        DatasetCache sınıfını başlatır
+
+        Args:
+            cache_dir (str): Önbellek dizini (None ise data/cache)
+            max_entries (int): Saklanacak en fazla veri seti sayısı
+            max_bytes (int): Önbelleğin toplam boyut sınırı (bayt)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "cache")
+        super().__init__(cache_dir, max_entries=max_entries, max_bytes=max_bytes)
+
+    @staticmethod
+    def key_params(days, rooms, num_residents, time_step, seed, start_time=None, version=GENERATOR_VERSION,
+                   **options):
+        """
+        Önbellek anahtarına giren üretim parametrelerini döndürür
+
+        Args:
+            days (int): Simüle edilecek gün sayısı
+            rooms (list): Odalar (sıra önemlidir)
+            num_residents (int): Ev sakini sayısı
+            time_step (int): Adımlar arasındaki dakika farkı
+            seed (int): Üretim tohumu
+            start_time (datetime): Simülasyon başlangıç zamanı (None ise DEFAULT_CACHE_START)
+            version (str): Üreteç sürümü
+            **options: Çıktıyı etkileyen diğer üreteç seçenekleri (ör. event_driven); JSON ile
+                ifade edilebilir olmalıdır
+
+        Returns:
+            dict: Anahtar parametreleri
+        """
+        params = {
+            "days": days,
+            "rooms": list(rooms),
+            "num_residents": num_residents,
+            "time_step": time_step,
+            "seed": seed,
+            "start_time": (start_time or DEFAULT_CACHE_START).isoformat(),
+            "version": version,
+        }
+        params.update(options)
+        return params
+
+    @classmethod
+    def make_key(cls, days, rooms, num_residents, time_step, seed, start_time=None, version=GENERATOR_VERSION,
+                 **options):
+        """
+        Üretim parametrelerinden önbellek anahtarı üretir (argümanlar için bkz. key_params)
+
+        Returns:
+            str: 64 karakterlik onaltılık anahtar
+        """
+        return cls.hash_params(cls.key_params(days, rooms, num_residents, time_step, seed, start_time, version,
+                                              **options))
+
+    def key_for(self, days=1, rooms=None, num_residents=2, time_step=5, seed=None, start_time=None, **options):
+        """
+        load_or_generate'in aynı argümanlarla kullanacağı anahtarı döndürür
+
+        Args:
+            days (int): Simüle edilecek gün sayısı
+            rooms (list): Odalar (None ise config odaları)
+            num_residents (int): Ev sakini sayısı
+            time_step (int): Adımlar arasındaki dakika farkı
+            seed (int): Üretim tohumu
+            start_time (datetime): Başlangıç zamanı (None ise DEFAULT_CACHE_START)
+            **options: Çıktıyı etkileyen diğer üreteç seçenekleri (ör. event_driven)
+
+        Returns:
+            str: Önbellek anahtarı (tohum verilmemişse None)
+        """
+        if seed is None:
+            return None
+        return self.make_key(days, list(rooms or config["rooms"]), num_residents, time_step, seed, start_time,
+                             **options)
+
+    def load_or_generate(self, days=1, rooms=None, num_residents=2, time_step=5, seed=None, start_time=None,
+                         verbose=True, **options):
+        """
+        Veri setini önbellekten okur; yoksa HomeDataGenerator ile üretip önbelleğe yazar.
+        Tohum verilmezse çıktı tekrarlanabilir olmadığından önbellek kullanılmaz.
+
+        Args:
+            days (int): Simüle edilecek gün sayısı
+            rooms (list): Odalar (None ise config odaları)
+            num_residents (int): Ev sakini sayısı
+            time_step (int): Adımlar arasındaki dakika farkı
+            seed (int): Üretim tohumu
+            start_time (datetime): Başlangıç zamanı (None ise DEFAULT_CACHE_START)
+            verbose (bool): İlerleme bilgisini yazdır
+            **options: HomeDataGenerator'e aktarılacak diğer seçenekler (ör. event_driven)
+
+        Returns:
+            tuple: (veri seti, önbellek anahtarı veya None, önbellekten mi okundu)
+        """
+        def generate():
+            generator = HomeDataGenerator(start_time=start_time or DEFAULT_CACHE_START, rooms=rooms,
+                                          num_residents=num_residents, time_step=time_step, seed=seed, **options)
+            return generator.generate_dataset(days=days, save_to_csv=False, verbose=verbose)
+
+        if seed is None:
+            return generate(), None, False
+
+        params = self.key_params(days, list(rooms or config["rooms"]), num_residents, time_step, seed, start_time,
+                                 **options)
+        key = self.hash_params(params)
+        df = self.get(key)
+        if df is not None:
+            if verbose:
+                print(f"Veri seti önbellekten okundu ({key[:12]}, {len(df)} satır).")
+            return df, key, True
+
+        df = generate()
+        self.put(key, df, params)
+        if verbose:
+            print(f"Veri seti önbelleğe yazıldı ({key[:12]}, {self.index[key]['bytes'] / 2**20:.1f} MiB).")
+        return df, key, False
+
+
+# Test işlevi
+def test_dataset_cache():
+    """DatasetCache'i geçici bir dizinde test eder ve üretim ile okuma sürelerini karşılaştırır"""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DatasetCache(directory, max_entries=2)
+        timings = []
+        for seed in (1, 1, 2, 3):
+            began = time.perf_counter()
+            df, key, hit = cache.load_or_generate(days=7, seed=seed, verbose=False)
+            timings.append(time.perf_counter() - began)
+            print(f"tohum {seed}: {'önbellek' if hit else 'üretim':8s} | {timings[-1] * 1000:8.1f} ms | "
+                  f"{len(df)} satır | anahtar {key[:12]}")
+
+        # touch girdiyi okumadan kullanıldı sayar: tohum 2 en yeni olur, sonraki üretimde tohum 3 silinir
+        touched = cache.touch(cache.key_for(days=7, seed=2))
+        cache.load_or_generate(days=7, seed=4, verbose=False)
+        kept = cache.key_for(days=7, seed=2) in cache and cache.key_for(days=7, seed=3) not in cache
+        print(f"touch: {touched} | dokunulan girdi korundu: {kept}")
+
+        print(f"İsabet: {cache.hits}, ıska: {cache.misses}, girdi: {len(cache.index)}, "
+              f"toplam boyut: {cache.total_bytes() / 2**20:.1f} MiB")
+        return timings
+
+
+if __name__ == "__main__":
+    test_dataset_cache()
@@ -0,0 +1,54 @@
+import os
+
+
+class ChunkedCSVWriter:
+    """
+    DataFrame parçalarını tek bir CSV dosyasına artımlı olarak yazan sınıf.
+    Başlık yalnızca ilk parçada yazılır; böylece veri setinin tamamı bellekte tutulmadan diske aktarılır.
+    """
+
+    def __init__(self, path):
+        """
+        ChunkedCSVWriter sınıfını başlatır
+
+        Args:
+            path (str): Yazılacak CSV dosyasının yolu
+        """
+        self.path = path
+        self.rows_written = 0
+        self.columns = None
+        self._file = None
+        self._header_written = False
+
+    def write(self, chunk):
+        """
+        Bir DataFrame parçasını dosyaya ekler
+
+        Args:
+            chunk (pandas.DataFrame): Yazılacak parça (tüm parçalar aynı sütunlara sahip olmalı)
+        """
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._file = open(self.path, "w", encoding="utf-8", newline="")
+            self.columns = list(chunk.columns)
+        elif list(chunk.columns) != self.columns:
+            raise ValueError("Parçaların sütunları ilk parçayla aynı olmalıdır")
+
+        chunk.to_csv(self._file, header=not self._header_written, index=False)
+        self._header_written = True
+        self.rows_written += len(chunk)
+
+    def close(self):
+        """Dosyayı kapatır"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
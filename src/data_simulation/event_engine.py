@@ -0,0 +1,619 @@
+import heapq
+import math
+import time
+from datetime import datetime
+
+import numpy as np
+
+from src.config import config
+from src.data_simulation.vectorized_engine import hour_motion_offset, hour_temp_drift, hour_light_range
+
+# Saat bazlı kuralların 24 saatlik arama tabloları (SensorSimulator kurallarıyla aynı)
+MOTION_OFFSET = np.array([hour_motion_offset(hour) for hour in range(24)])
+TEMP_DRIFT = np.array([hour_temp_drift(hour) for hour in range(24)])
+LIGHT_LOW = np.array([hour_light_range(hour)[0] for hour in range(24)])
+LIGHT_HIGH = np.array([hour_light_range(hour)[1] for hour in range(24)])
+
+# Klima olay türleri
+_MANUAL, _AUTO_OFF = 0, 1
+
+# Motorun tek seferde simüle ettiği en uzun blok (adım). Bloklar üretim ufkunun başından
+# itibaren bu uzunlukta kesilir; run çağrılarının boyutu blok sınırlarını değiştirmez
+BLOCK_STEPS = 4096
+
+
+def clamped_walk(x0, steps, lower, upper, scale=1.0):
+    """
+    x_t = min(upper_t, max(lower_t, scale * x_{t-1} + steps_t)) özyinelemesini tam olarak hesaplar.
+    Her adım bir "ölçekle, kaydır ve sınırla" fonksiyonudur ve (scale > 0 olduğunda) bu
+    fonksiyonların bileşimi yine aynı biçimdedir. Zaman ekseni yaklaşık sqrt(n) uzunluğunda bloklara bölünür; blok içi bileşimler
+    tüm bloklar için birlikte, blok başlangıç değerleri ise bloklar üzerinde sırayla hesaplanır.
+
+    Args:
+        x0 (numpy.ndarray): (oda,) başlangıç değerleri
+        steps (numpy.ndarray): (n, oda) adım başına değişimler
+        lower (float | numpy.ndarray): Alt sınır (skaler veya (n, oda))
+        upper (float | numpy.ndarray): Üst sınır (skaler veya (n, oda))
+        scale (float): Bir önceki değerin çarpanı (0 < scale <= 1)
+
+    Returns:
+        numpy.ndarray: (n, oda) değerler
+    """
+    n, width = steps.shape
+    block = max(1, int(math.sqrt(n)))
+    blocks = -(-n // block)
+    padded = blocks * block
+
+    # Dolgu adımları kaydırmasız ve sınırsızdır; yalnızca son bloğun sonunda yer aldıkları
+    # için ölçekleri sonuçları etkilemez
+    def arrange(values, fill):
+        full = np.full((padded, width), fill, dtype=np.float64)
+        full[:n] = values
+        return np.ascontiguousarray(full.reshape(blocks, block, width).transpose(1, 0, 2))
+
+    shift = arrange(steps, 0.0)
+    low = arrange(lower, -np.inf)
+    high = arrange(upper, np.inf)
+
+    # Blok içi önek bileşimleri: f_j <- f_j o f_(j-1), j. bileşimin ölçeği scale^(j+1)
+    for j in range(1, block):
+        new_low = np.minimum(np.maximum(scale * low[j - 1] + shift[j], low[j]), high[j])
+        np.minimum(np.maximum(scale * high[j - 1] + shift[j], low[j]), high[j], out=high[j])
+        low[j] = new_low
+        shift[j] += scale * shift[j - 1]
+    powers = (scale ** np.arange(1, block + 1))[:, None, None]
+
+    # Blok başlangıç değerleri
+    starts = np.empty((blocks, width))
+    current = np.asarray(x0, dtype=np.float64)
+    for b in range(blocks):
+        starts[b] = current
+        current = np.minimum(np.maximum(powers[-1, 0] * current + shift[-1, b], low[-1, b]), high[-1, b])
+
+    values = np.minimum(np.maximum(powers * starts + shift, low), high)
+    return values.transpose(1, 0, 2).reshape(padded, width)[:n]
+
+
+def _hold(events, values, initial):
+    """Olay anlarındaki değerleri bir sonraki olaya kadar ileri taşır (olay yoksa başlangıç değeri)"""
+    last = np.maximum.accumulate(np.where(events, np.arange(len(events)), -1))
+    return np.where(last >= 0, values[np.maximum(last, 0)], initial)
+
+
+class EventDrivenEngine:
+    """
+    HomeDataGenerator için olay güdümlü (next-event) simülasyon motoru.
+    Adım adım ilerlemek yerine bir zaman aralığının tamamını tek seferde üretir:
+    sakin hareketleri yenileme süreçlerinden toplu örneklenir, cihaz olayları (elle kullanım,
+    boş odada otomatik kapanma) olay dizileri olarak çizilir ve sürekli sensörler olaylar
+    arasında vektörize olarak entegre edilir. Sıcaklığa geri besleme yapan klima olayları
+    bir öncelik kuyruğunda zaman sırasıyla işlenir.
+
+    Üretilen veri, adım modeliyle aynı kuralları izler ve istatistiksel olarak eşdeğerdir,
+    ancak rastgele sayı akışı farklı olduğu için satır satır aynı değildir. Tek fark: boş
+    odada CO2 500 ppm tabanında (başlangıç değeri daha düşükse o değerde) kesin olarak durur.
+
+    Motor her zaman BLOCK_STEPS uzunluğunda (ufkun sonunda kısaltılmış) bloklar simüle eder
+    ve run çağrılarına bu bloktan satır verir; kullanılmamış satırlar sonraki çağrıya saklanır.
+    Böylece çıktı run çağrılarının (kontrol noktası aralığı, parça boyutu) bölünmesinden bağımsızdır.
+    """
+
+    def __init__(self, generator, seed=None):
+        """
+        EventDrivenEngine sınıfını başlatır
+
+        Args:
+            generator (HomeDataGenerator): Durumu okunacak ve güncellenecek veri üreteci
+            seed (int): numpy.random.Generator tohumu
+        """
+        self.generator = generator
+        self.rng = np.random.default_rng(seed)
+
+        simulator = generator.sensor_simulator
+        self.rooms = list(simulator.rooms)
+        self.device_columns = [(room, device) for room in self.rooms for device in simulator.devices[room]]
+        self._device_rooms = [self.rooms.index(room) for room, _ in self.device_columns]
+
+        self.thresholds = config["automation_thresholds"]
+        self.manual_operation_prob = config["manual_operation_prob"]
+        self.events_processed = 0
+        # Simüle edilmiş ancak henüz kaydediciye verilmemiş satırları olan blok
+        self.pending = None
+
+    def get_state(self):
+        """
+        Motorun RNG durumunu, işlenen olay sayısını ve bekleyen bloğu döndürür
+
+        Returns:
+            dict: set_state ile geri yüklenebilecek durum
+        """
+        pending = None
+        if self.pending is not None:
+            pending = {key: value.copy() if isinstance(value, np.ndarray) else value
+                       for key, value in self.pending.items()}
+        return {"rng": self.rng.bit_generator.state, "events_processed": self.events_processed, "pending": pending}
+
+    def set_state(self, state):
+        """
+        get_state ile alınmış durumu geri yükler
+
+        Args:
+            state (dict): get_state çıktısı
+        """
+        self.rng.bit_generator.state = state["rng"]
+        self.events_processed = state["events_processed"]
+        self.pending = state["pending"]
+
+    def run(self, count, recorder, horizon=None):
+        """
+        Simülasyonu count adım ilerletir ve adımları kaydediciye yazar. Adımlar bekleyen bloktan
+        alınır; blok bitince yenisi simüle edilir. Yeni bloğun başlangıç durumu üretecin
+        simülatörlerinden okunur, her çağrının sonunda son verilen satırın durumu simülatörlere yazılır.
+
+        Args:
+            count (int): Simüle edilecek adım sayısı
+            recorder (ColumnarRecorder): Adımların yazılacağı kaydedici
+            horizon (int): Bu çağrının başından üretimin sonuna kadar kalan adım sayısı; yeni bloklar
+                bu ufkun sonunda kesilir (None ise count)
+        """
+        if count <= 0:
+            return
+
+        generator = self.generator
+        horizon = max(count, horizon or count)
+        pending = self.pending
+        # Üreteç başka bir noktaya alınmışsa (ör. yeni üretim) bekleyen blok geçersizdir
+        if pending is not None:
+            next_minute = int(pending["minutes"][pending["position"]])
+            if next_minute != generator.current_minute + generator.time_step:
+                pending = None
+
+        while count > 0:
+            if pending is None:
+                pending = self._simulate_block(min(BLOCK_STEPS, horizon), recorder)
+            start = pending["position"]
+            stop = min(start + count, len(pending["minutes"]))
+            rows = slice(start, stop)
+            recorder.record_block(pending["minutes"][rows], pending["sensors"][rows], pending["motion"][rows],
+                                  pending["occupancy"][rows], pending["devices"][rows], pending["locations"][rows],
+                                  outdoor=None if pending["outdoor"] is None else pending["outdoor"][rows])
+            pending["position"] = stop
+            self._write_back(pending, stop - 1, recorder)
+            count -= stop - start
+            horizon -= stop - start
+            if stop == len(pending["minutes"]):
+                pending = None
+        self.pending = pending
+
+    def _write_back(self, block, row, recorder):
+        """
+        Bloğun bir satırındaki durumu üretece ve simülatörlerine yazar
+
+        Args:
+            block (dict): _simulate_block çıktısı
+            row (int): Satır indeksi
+            recorder (ColumnarRecorder): Konum adlarını sağlayan kaydedici
+        """
+        generator = self.generator
+        simulator = generator.sensor_simulator
+        users = generator.user_simulator
+        minute = int(block["minutes"][row])
+        generator.current_minute = minute
+        # Sensör simülatörü üreteçten bir adım ileride çalışır (adım modeliyle aynı)
+        simulator.current_minute = minute + generator.time_step
+        for r, room in enumerate(self.rooms):
+            room_status = simulator.room_status[room]
+            temp, humidity, light, co2 = block["sensors"][row, r].tolist()
+            room_status["Sıcaklık"] = temp
+            room_status["Nem"] = humidity
+            room_status["Işık"] = light
+            room_status["CO2"] = co2
+            room_status["Hareket"] = bool(block["motion"][row, r])
+            room_status["Doluluk"] = bool(block["occupancy"][row, r])
+            room_status["Son_Hareket"] = int(block["last_motion"][row, r])
+        for d, (room, device) in enumerate(self.device_columns):
+            simulator.devices[room][device] = bool(block["devices"][row, d])
+        for k, resident in enumerate(users.resident_locations):
+            code = block["locations"][row, k]
+            users.resident_locations[resident] = recorder.location_names[code] if code >= 0 else None
+            users.last_random_move[resident] = int(block["last_move"][row, k])
+
+    def _simulate_block(self, count, recorder):
+        """
+        Üretecin mevcut durumundan başlayarak count adımlık bir bloğu simüle eder
+
+        Args:
+            count (int): Bloğun adım sayısı
+            recorder (ColumnarRecorder): Konum kodlarını sağlayan kaydedici
+
+        Returns:
+            dict: Bloğun kaydediciye yazılacak dizileri, satır başına son hareket zamanları ve
+                verilen satır sayısı (position)
+        """
+        generator = self.generator
+        simulator = generator.sensor_simulator
+        time_step = generator.time_step
+        rng = self.rng
+        n, room_count = count, len(self.rooms)
+
+        minutes = generator.current_minute + time_step * np.arange(1, n + 1)
+        # Sensör simülatörü üreteçten bir adım ileride çalışır (adım modeliyle aynı)
+        sensor_minutes = minutes + time_step
+        hours = generator.clock.hour(minutes)
+        sensor_hours = generator.clock.hour(sensor_minutes)
+
+        status = [simulator.room_status[room] for room in self.rooms]
+        initial = {key: np.array([s[key] for s in status], dtype=np.float64)
+                   for key in ("Sıcaklık", "Nem", "CO2", "Son_Hareket")}
+        initial_occupancy = np.array([s["Doluluk"] for s in status], dtype=bool)
+
+        # Sakin konumları ve oda dolulukları
+        locations, last_move = self._simulate_residents(minutes, recorder)
+        occupancy = np.zeros((n, room_count), dtype=bool)
+        rows = np.arange(n)
+        for k in range(locations.shape[1]):
+            codes = locations[:, k]
+            inside = (codes >= 0) & (codes < room_count)
+            occupancy[rows[inside], codes[inside]] = True
+
+        # Hareket sensörü ve son hareket zamanları
+        motion, last_motion, motion_through = self._simulate_motion(sensor_minutes, sensor_hours,
+                                                                    initial["Son_Hareket"])
+
+        # Sensörün algıladığı doluluk: önceki adımın doluluğu hareketle güncellenir
+        previous_occupancy = np.vstack([initial_occupancy[None, :], occupancy[:-1]])
+        draws = rng.random((2, n, room_count))
+        sensed = np.where(motion, previous_occupancy | (draws[0] < 0.8), previous_occupancy & ~(draws[1] < 0.3))
+
+        # Cihazlardan bağımsız sürekli sensörler
+        humidity = clamped_walk(initial["Nem"], rng.uniform(-2, 2, (n, room_count)), 20, 80)
+        light = np.round(rng.uniform(LIGHT_LOW[sensor_hours][:, None], LIGHT_HIGH[sensor_hours][:, None],
+                                     (n, room_count)), 1)
+        co2_steps = np.where(sensed, rng.uniform(10, 30, (n, room_count)), -rng.uniform(5, 15, (n, room_count)))
+        co2_floor = np.where(sensed, 400.0, np.minimum(500.0, initial["CO2"]))
+        co2 = clamped_walk(initial["CO2"], co2_steps, co2_floor, 2000)
+
+        # Cihaz olayları
+        device_gap = minutes[:, None] - last_motion
+        previous_co2 = np.vstack([initial["CO2"][None, :], co2[:-1]])
+        devices = np.empty((n, len(self.device_columns)), dtype=bool)
+        climate = []
+        for d, (room, device) in enumerate(self.device_columns):
+            r = self._device_rooms[d]
+            start_state = bool(simulator.devices[room][device])
+            if device == "Klima":
+                climate.append((d, r, start_state))
+                continue
+            devices[:, d] = self._device_timeline(device, hours, occupancy[:, r], device_gap[:, r],
+                                                  previous_co2[:, r], start_state)
+
+        # Sıcaklık: klimasız odalar doğrudan, klimalı odalar olay kuyruğuyla entegre edilir
+        temp_steps = rng.random((n, room_count)) - 0.5 + TEMP_DRIFT[sensor_hours][:, None] + np.where(sensed, 0.1, 0.0)
+        # Dış hava etkisi: x_t = (1 - k) * x_(t-1) + k * dış_t + adım_t
+        outdoor, scale = None, 1.0
+        if simulator.weather is not None:
+            weather = simulator.weather
+            outdoor = weather.temperature[weather.index(simulator._weather_offset + sensor_minutes)]
+            temp_steps += simulator.weather_coupling * outdoor[:, None]
+            scale = 1.0 - simulator.weather_coupling
+        temp = np.empty((n, room_count))
+        climate_rooms = [r for _, r, _ in climate]
+        free_rooms = [r for r in range(room_count) if r not in climate_rooms]
+        if free_rooms:
+            temp[:, free_rooms] = clamped_walk(initial["Sıcaklık"][free_rooms], temp_steps[:, free_rooms], 15, 35,
+                                               scale=scale)
+        if climate:
+            self._run_climate_events(climate, temp, temp_steps, initial["Sıcaklık"], occupancy, device_gap, devices,
+                                     scale=scale)
+
+        sensors = np.stack([temp, humidity, light, co2], axis=2)
+        return {"minutes": minutes, "sensors": sensors, "motion": motion, "occupancy": occupancy,
+                "devices": devices, "locations": locations, "outdoor": outdoor,
+                "last_motion": motion_through, "last_move": last_move, "position": 0}
+
+    def _simulate_residents(self, minutes, recorder):
+        """
+        Sakin konumlarını planlanan zaman çizelgesi ve toplu örneklenen rastgele hareketlerle üretir
+
+        Args:
+            minutes (numpy.ndarray): Adımların üreteç dakikaları
+            recorder (ColumnarRecorder): Konum kodlarını sağlayan kaydedici
+
+        Returns:
+            tuple: (n, sakin) kaydedici konum kodları (-1 = ev dışında) ve her adımdaki son
+                rastgele hareket dakikaları
+        """
+        users = self.generator.user_simulator
+        time_step = self.generator.time_step
+        scheduled = users.scheduled_timeline(minutes, as_codes=True)
+        code_map = np.array([recorder.location_code(name) for name in users.schedule_locations], dtype=np.int16)
+        room_codes = np.array([recorder.location_code(room) for room in users.rooms], dtype=np.int16)
+        locations = code_map[scheduled]
+
+        # Sürekli evde kalındığında iki rastgele hareket arasındaki adım sayısının dağılımı:
+        # k. adımda hareket olasılığı min(1, k * time_step / 30)
+        horizon = max(1, math.ceil(30 / time_step))
+        hazard = np.minimum(1.0, np.arange(1, horizon + 1) * time_step / 30)
+        survival = np.concatenate([[1.0], np.cumprod(1 - hazard)[:-1]])
+        gap_pmf = survival * hazard
+        gap_pmf /= gap_pmf.sum()
+
+        last_move = np.empty(locations.shape, dtype=np.int64)
+        for k, resident in enumerate(users.resident_locations):
+            moves = self._random_move_ticks(scheduled[:, k] != 0, minutes, users.last_random_move[resident], gap_pmf)
+            if len(moves):
+                locations[moves, k] = room_codes[self.rng.integers(0, len(room_codes), len(moves))]
+            moved = np.zeros(len(minutes), dtype=bool)
+            moved[moves] = True
+            last_move[:, k] = _hold(moved, minutes, users.last_random_move[resident])
+
+        return locations, last_move
+
+    def _random_move_ticks(self, home, minutes, last_move, gap_pmf):
+        """
+        Bir sakinin rastgele hareket ettiği adımları evde geçirilen her aralık için toplu örnekler
+
+        Args:
+            home (numpy.ndarray): Sakinin evde olduğu adımlar
+            minutes (numpy.ndarray): Adımların üreteç dakikaları
+            last_move (int): Son rastgele hareketin dakikası
+            gap_pmf (numpy.ndarray): Ardışık hareketler arasındaki adım sayısının olasılıkları
+
+        Returns:
+            numpy.ndarray: Hareket adımlarının indeksleri
+        """
+        rng = self.rng
+        mean_gap = float(np.dot(np.arange(1, len(gap_pmf) + 1), gap_pmf))
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], home.astype(np.int8), [0]])))
+        moves = []
+        for start, end in zip(edges[::2], edges[1::2]):
+            # Aralığın ilk hareketi, ev dışında geçen süre dahil son hareketten bu yana geçen süreye bağlıdır
+            tick = start
+            while tick < end and rng.random() >= min(1.0, (minutes[tick] - last_move) / 30):
+                tick += 1
+            if tick >= end:
+                continue
+
+            # Sonraki hareketler arasındaki adım sayıları bağımsız ve aynı dağılımlıdır
+            interval = [np.array([tick])]
+            while True:
+                gaps = rng.choice(len(gap_pmf), size=int((end - tick) / mean_gap) + 8, p=gap_pmf) + 1
+                positions = tick + np.cumsum(gaps)
+                interval.append(positions[positions < end])
+                if positions[-1] >= end:
+                    break
+                tick = positions[-1]
+            interval = np.concatenate(interval)
+            last_move = minutes[interval[-1]]
+            moves.append(interval)
+
+        return np.concatenate(moves) if moves else np.empty(0, dtype=int)
+
+    def _simulate_motion(self, sensor_minutes, sensor_hours, last_motion):
+        """
+        Hareket sensörünü tüm adımlar için üretir. Uzun süre hareketsiz kalan odada olasılık 0.2
+        arttığı için, bu ek olasılıkla oluşan hareketler aday adımlar üzerinde sırayla seçilir.
+
+        Args:
+            sensor_minutes (numpy.ndarray): Adımların sensör dakikaları
+            sensor_hours (numpy.ndarray): Adımların sensör saatleri
+            last_motion (numpy.ndarray): (oda,) başlangıçtaki son hareket dakikaları
+
+        Returns:
+            tuple: (hareket dizisi, her adımdan önceki son hareket dakikası, adım dahil son hareket dakikası)
+        """
+        n, room_count = len(sensor_minutes), len(last_motion)
+        draws = self.rng.random((n, room_count))
+        base = (0.2 + MOTION_OFFSET[sensor_hours])[:, None]
+        motion = draws < base
+        ticks = np.arange(n)[:, None]
+
+        def last_before(motion):
+            last_index = np.maximum.accumulate(np.where(motion, ticks, -1), axis=0)
+            before = np.vstack([np.full((1, room_count), -1), last_index[:-1]])
+            return last_index, np.where(before >= 0, sensor_minutes[before], last_motion)
+
+        # Ek olasılıkla oluşabilecek adaylar: yalnızca temel hareketlere göre 30 dakikadan uzun
+        # hareketsiz kalınan adımlar (gerçek hareketler temel hareketlerin üst kümesidir)
+        _, base_last = last_before(motion)
+        candidates = ~motion & (draws < base + 0.2) & (sensor_minutes[:, None] - base_last > 30)
+
+        # Bir aday ek hareket ürettiğinde sonraki 30 dakikadaki adaylar geçersiz olur
+        rooms, positions = np.nonzero(candidates.T)
+        selected = np.zeros(len(positions), dtype=bool)
+        previous_room, bonus_last = -1, -math.inf
+        for i, (r, minute, last) in enumerate(zip(rooms.tolist(), sensor_minutes[positions].tolist(),
+                                                  base_last[positions, rooms].tolist())):
+            if r != previous_room:
+                previous_room, bonus_last = r, -math.inf
+            if minute - max(last, bonus_last) > 30:
+                selected[i] = True
+                bonus_last = minute
+        motion[positions[selected], rooms[selected]] = True
+
+        last_index, last_motion_before = last_before(motion)
+        through = np.where(last_index >= 0, sensor_minutes[np.maximum(last_index, 0)], last_motion)
+        return motion, last_motion_before, through
+
+    def _device_timeline(self, device, hours, occupied, gap, previous_co2, start_state):
+        """
+        Sıcaklığa bağlı olmayan bir cihazın durumunu elle kullanım ve otomatik kapanma olaylarından üretir
+
+        Args:
+            device (str): Cihaz türü
+            hours (numpy.ndarray): Adımların saatleri
+            occupied (numpy.ndarray): Odanın dolu olduğu adımlar
+            gap (numpy.ndarray): Son hareketten bu yana geçen dakika
+            previous_co2 (numpy.ndarray): Bir önceki adımın CO2 değerleri
+            start_state (bool): Başlangıç durumu
+
+        Returns:
+            numpy.ndarray: Cihaz durumları
+        """
+        draws = self.rng.random((3, len(hours)))
+        manual = occupied & (draws[0] < self.manual_operation_prob.get(device, 0.5))
+        auto_off = np.zeros_like(manual)
+
+        if device == "Lamba":
+            on_prob = np.where((hours >= 18) | (hours <= 6), 0.9, 0.3)
+            auto_off = ~occupied & (gap > self.thresholds["empty_room_device_off_delay_min"]) & (draws[2] < 0.9)
+        elif device == "Perde":
+            on_prob = np.where((hours >= 7) & (hours <= 10), 0.9, np.where((hours >= 19) & (hours <= 23), 0.2, 0.5))
+        elif device == "Havalandırma":
+            on_prob = np.where(previous_co2 > self.thresholds["high_co2_threshold"], 0.7, 0.3)
+            auto_off = ~occupied & (gap > self.thresholds["empty_room_ac_off_delay_min"]) & (draws[2] < 0.8)
+        else:
+            # Adım modelinde kuralı olmayan cihazlar değişmez
+            return np.full(len(hours), start_state)
+
+        return _hold(manual | auto_off, manual & (draws[1] < on_prob), start_state)
+
+    def _run_climate_events(self, climate, temp, temp_steps, initial_temp, occupancy, gap, devices, scale=1.0):
+        """
+        Klimalı odaların sıcaklığını ve klima durumunu olay kuyruğuyla üretir. Elle kullanım
+        kararı o anki sıcaklığa bağlı olduğundan olaylar zaman sırasıyla işlenir; iki olay
+        arasında klima durumu sabittir ve sıcaklık bu durumla entegre edilir.
+
+        Args:
+            climate (list): (cihaz sütunu, oda indeksi, başlangıç durumu) üçlüleri
+            temp (numpy.ndarray): (n, oda) doldurulacak sıcaklık dizisi
+            temp_steps (numpy.ndarray): (n, oda) klima hariç sıcaklık değişimleri
+            initial_temp (numpy.ndarray): (oda,) başlangıç sıcaklıkları
+            occupancy (numpy.ndarray): (n, oda) doluluk durumları
+            gap (numpy.ndarray): (n, oda) son hareketten bu yana geçen dakika
+            devices (numpy.ndarray): (n, cihaz sütunu) doldurulacak cihaz durumları
+            scale (float): Bir önceki sıcaklığın çarpanı (dış hava etkisi yoksa 1)
+        """
+        n = len(temp)
+        manual_prob = self.manual_operation_prob.get("Klima", 0.5)
+        off_delay = self.thresholds["empty_room_ac_off_delay_min"]
+        high_temp = self.thresholds["high_temp_threshold"]
+
+        rooms, queue = {}, []
+        for d, r, start_state in climate:
+            draws = self.rng.random((4, n))
+            manual = occupancy[:, r] & (draws[0] < manual_prob)
+            auto_off = ~occupancy[:, r] & (gap[:, r] > off_delay) & (draws[1] < 0.7)
+            ticks = np.flatnonzero(manual | auto_off)
+            rooms[d] = {
+                "room": r,
+                "ticks": ticks.tolist(),
+                "kinds": np.where(manual[ticks], _MANUAL, _AUTO_OFF).tolist(),
+                "decisions": draws[2].tolist(),
+                "pulls": (0.5 + 0.5 * draws[3]).tolist(),
+                "steps": temp_steps[:, r].tolist(),
+                "scale": scale,
+                "on": start_state,
+                "temp": float(initial_temp[r]),
+                "done": 0,
+                "changes": [(0, start_state)],
+            }
+            if ticks.size:
+                heapq.heappush(queue, (int(ticks[0]), d, 0))
+
+        while queue:
+            tick, d, position = heapq.heappop(queue)
+            state = rooms[d]
+            if state["kinds"][position] == _MANUAL:
+                self._integrate_temperature(state, temp, tick)
+                current = state["temp"]
+                on_prob = 0.8 if current > high_temp else (0.2 if current < 20 else 0.4)
+                new_state = state["decisions"][tick] < on_prob
+            else:
+                # Kapalı klimayı kapatma olayı bir şey değiştirmez, entegrasyon ertelenir
+                if state["on"]:
+                    self._integrate_temperature(state, temp, tick)
+                new_state = False
+
+            if new_state != state["on"]:
+                state["on"] = new_state
+                state["changes"].append((tick, new_state))
+            self.events_processed += 1
+
+            if position + 1 < len(state["ticks"]):
+                heapq.heappush(queue, (state["ticks"][position + 1], d, position + 1))
+
+        for d, state in rooms.items():
+            self._integrate_temperature(state, temp, n)
+            change_ticks = np.array([tick for tick, _ in state["changes"]])
+            change_values = np.array([value for _, value in state["changes"]])
+            devices[:, d] = change_values[np.searchsorted(change_ticks, np.arange(n), side="right") - 1]
+
+    @staticmethod
+    def _integrate_temperature(state, temp, stop):
+        """
+        Klimalı bir odanın sıcaklığını son entegre edilen adımdan stop adımına kadar
+        (stop hariç) mevcut klima durumuyla ilerletir
+
+        Args:
+            state (dict): Odanın olay durumu
+            temp (numpy.ndarray): (n, oda) doldurulacak sıcaklık dizisi
+            stop (int): Entegrasyonun biteceği adım (hariç)
+        """
+        start = state["done"]
+        if stop <= start:
+            return
+
+        steps, pulls, current, scale = state["steps"], state["pulls"], state["temp"], state["scale"]
+        values = []
+        if state["on"]:
+            # Klima hedef sıcaklığa (23°C) doğru soğutur/ısıtır
+            for i in range(start, stop):
+                pull = -pulls[i] if current > 23.0 else pulls[i]
+                current = scale * current + (steps[i] + pull)
+                current = 15.0 if current < 15.0 else (35.0 if current > 35.0 else current)
+                values.append(current)
+        else:
+            for i in range(start, stop):
+                current = scale * current + steps[i]
+                current = 15.0 if current < 15.0 else (35.0 if current > 35.0 else current)
+                values.append(current)
+
+        temp[start:stop, state["room"]] = values
+        state["temp"] = current
+        state["done"] = stop
+
+
+def benchmark_event_mode(days_list=(30, 90, 180), time_step=5):
+    """
+    Adım modeli ile olay güdümlü modu üretim süresi ve temel istatistikler açısından karşılaştırır
+
+    Args:
+        days_list (tuple): Denenecek gün sayıları
+        time_step (int): Simülasyon adımları arasındaki dakika farkı
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    start_time = datetime(2025, 1, 6, 8, 0)
+    results = []
+    for days in days_list:
+        for event_driven in (False, True):
+            generator = HomeDataGenerator(start_time=start_time, time_step=time_step, seed=42,
+                                          event_driven=event_driven)
+            began = time.perf_counter()
+            df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+            elapsed = time.perf_counter() - began
+
+            result = {
+                "days": days,
+                "mode": "event" if event_driven else "tick",
+                "seconds": elapsed,
+                "rows_per_sec": len(df) / elapsed,
+                "mean_temp": float(df.filter(like="_Sıcaklık").to_numpy().mean()),
+                "mean_co2": float(df.filter(like="_CO2").to_numpy().mean()),
+                "occupancy_ratio": float(df.filter(like="_Doluluk").to_numpy().mean()),
+                "ac_ratio": float(df.filter(like="_Klima").to_numpy().mean()),
+            }
+            results.append(result)
+            print(f"{days:3d} gün | {result['mode']:5s} | {result['seconds']:6.2f} sn | "
+                  f"{result['rows_per_sec']:9.0f} satır/sn | ort. sıcaklık: {result['mean_temp']:.2f} | "
+                  f"ort. CO2: {result['mean_co2']:.0f} | doluluk: {result['occupancy_ratio']:.3f} | "
+                  f"klima: {result['ac_ratio']:.3f}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_event_mode()
@@ -0,0 +1,205 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from src.config import config
+from src.data_simulation.data_generator import HomeDataGenerator
+from src.data_simulation.weather_simulator import weather_timeline, share_weather_timeline
+
+# Ana tohum tek başına çıktıyı belirlesin diye varsayılan başlangıç sabittir (Pazartesi 08:00)
+DEFAULT_FLEET_START = datetime(2025, 1, 6, 8, 0)
+
+
+def _generate_home_shard(spec):
+    """
+    Tek bir evin veri setini üretip shard dosyasına yazar (işçi süreçte çalışır)
+
+    Args:
+        spec (dict): Ev tanımı (rooms, num_residents, seed, shard_path, ...)
+
+    Returns:
+        dict: Ev kimliği, satır sayısı ve üretim süresi
+    """
+    began = time.perf_counter()
+    start_time = datetime.fromisoformat(spec["start_time"])
+    # Hava zaman serisi süreç içinde önbellekten okunur (ana süreçte bir kez üretilir)
+    weather = None
+    if spec["weather_seed"] is not None:
+        weather = weather_timeline(start_time, spec["days"] + 1, seed=spec["weather_seed"])
+    generator = HomeDataGenerator(
+        start_time=start_time,
+        rooms=spec["rooms"],
+        num_residents=spec["num_residents"],
+        time_step=spec["time_step"],
+        vectorized=spec["vectorized"],
+        seed=spec["seed"],
+        event_driven=spec["event_driven"],
+        weather=weather,
+        thermal_model=spec["thermal_model"]
+    )
+    dataset = generator.generate_dataset(days=spec["days"], save_to_csv=False, verbose=False)
+    dataset.to_csv(spec["shard_path"], index=False)
+    return {
+        "home_id": spec["home_id"],
+        "rows": len(dataset),
+        "seconds": time.perf_counter() - began
+    }
+
+
+class FleetDataGenerator:
+    """
+    Çok sayıda ev için veri setini süreç havuzunda paralel olarak üreten sınıf.
+    Her ev kendi odalarına, sakin sayısına ve tohumuna sahiptir; tüm ev tanımları ana
+    tohumdan türetildiği için çıktı işçi sayısından bağımsız olarak tekrarlanabilirdir.
+    """
+
+    def __init__(self, num_homes, master_seed=42, days=1, time_step=5, start_time=None,
+                 room_pool=None, min_rooms=3, residents_range=(1, 3), output_dir=None,
+                 workers=None, vectorized=False, event_driven=False, weather_seed=None, thermal_model=False):
+        """
+        FleetDataGenerator sınıfını başlatır
+
+        Args:
+            num_homes (int): Üretilecek ev sayısı
+            master_seed (int): Tüm evlerin tohumlarının türetildiği ana tohum
+            days (int): Her ev için simüle edilecek gün sayısı
+            time_step (int): Simülasyon adımları arasındaki dakika farkı
+            start_time (datetime): Simülasyon başlangıç zamanı (None ise DEFAULT_FLEET_START)
+            room_pool (list): Evlere dağıtılacak oda adları (None ise config odaları)
+            min_rooms (int): Bir evdeki en az oda sayısı
+            residents_range (tuple): Sakin sayısının alt ve üst sınırı (dahil)
+            output_dir (str): Shard ve manifest dizini
+            workers (int): İşçi süreç sayısı (None ise CPU sayısı, 1 ise aynı süreçte çalışır)
+            vectorized (bool): Sensör simülatöründe vektörize oda motorunu kullan
+            event_driven (bool): Evleri olay güdümlü motorla üret
+            weather_seed (int): Tüm evlerin paylaştığı dış hava zaman serisinin tohumu (None ise dış hava yok)
+            thermal_model (bool): Oda sıcaklıklarını her evde RC ısıl ağla hesapla
+        """
+        self.num_homes = num_homes
+        self.master_seed = master_seed
+        self.days = days
+        self.time_step = time_step
+        self.start_time = start_time or DEFAULT_FLEET_START
+        self.room_pool = room_pool or config["rooms"]
+        self.min_rooms = min(min_rooms, len(self.room_pool))
+        self.residents_range = residents_range
+        self.workers = workers
+        self.vectorized = vectorized
+        self.event_driven = event_driven
+        self.weather_seed = weather_seed
+        self.thermal_model = thermal_model
+
+        if output_dir is None:
+            output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+                                      "data", "fleet", f"fleet_seed{master_seed}")
+        self.output_dir = output_dir
+
+    def build_home_specs(self):
+        """
+        Ana tohumdan her ev için oda, sakin ve tohum bilgilerini türetir
+
+        Returns:
+            list: Ev tanımı sözlükleri
+        """
+        specs = []
+        children = np.random.SeedSequence(self.master_seed).spawn(self.num_homes)
+        for home_id, child in enumerate(children):
+            rng = np.random.default_rng(child)
+            room_count = int(rng.integers(self.min_rooms, len(self.room_pool) + 1))
+            chosen = np.sort(rng.choice(len(self.room_pool), size=room_count, replace=False))
+            specs.append({
+                "home_id": home_id,
+                "seed": int(rng.integers(0, 2**32)),
+                "rooms": [self.room_pool[i] for i in chosen],
+                "num_residents": int(rng.integers(self.residents_range[0], self.residents_range[1] + 1)),
+                "days": self.days,
+                "time_step": self.time_step,
+                "start_time": self.start_time.isoformat(),
+                "vectorized": self.vectorized,
+                "event_driven": self.event_driven,
+                "weather_seed": self.weather_seed,
+                "thermal_model": self.thermal_model,
+                "shard_path": os.path.join(self.output_dir, f"home_{home_id:05d}.csv")
+            })
+        return specs
+
+    def generate(self):
+        """
+        Tüm evleri üretir, her ev için bir shard ve bir manifest dosyası yazar
+
+        Returns:
+            dict: Manifest içeriği (ev tanımları, satır sayıları ve toplam hız)
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        specs = self.build_home_specs()
+
+        print(f"{self.num_homes} ev için veri üretiliyor ({self.days} gün, işçi: {self.workers or os.cpu_count()})...")
+        began = time.perf_counter()
+        # Dış hava zaman serisi bir kez üretilir ve işçi süreçlerin önbelleğine aktarılır
+        initargs = ()
+        if self.weather_seed is not None:
+            initargs = (weather_timeline(self.start_time, self.days + 1, seed=self.weather_seed),)
+        if self.workers == 1:
+            results = [_generate_home_shard(spec) for spec in specs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=share_weather_timeline if initargs else None,
+                                     initargs=initargs) as executor:
+                results = list(executor.map(_generate_home_shard, specs, chunksize=1))
+        elapsed = time.perf_counter() - began
+
+        total_rows = sum(result["rows"] for result in results)
+        homes = []
+        for spec, result in zip(specs, results):
+            homes.append({
+                "home_id": spec["home_id"],
+                "seed": spec["seed"],
+                "rooms": spec["rooms"],
+                "num_residents": spec["num_residents"],
+                "shard": os.path.basename(spec["shard_path"]),
+                "rows": result["rows"]
+            })
+
+        manifest = {
+            "master_seed": self.master_seed,
+            "num_homes": self.num_homes,
+            "days": self.days,
+            "time_step": self.time_step,
+            "start_time": self.start_time.isoformat(),
+            "weather_seed": self.weather_seed,
+            "thermal_model": self.thermal_model,
+            "total_rows": total_rows,
+            "homes": homes,
+            "stats": {
+                "workers": self.workers or os.cpu_count(),
+                "elapsed_seconds": elapsed,
+                "rows_per_sec": total_rows / elapsed if elapsed > 0 else None
+            }
+        }
+
+        manifest_path = os.path.join(self.output_dir, "manifest.json")
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=4)
+
+        print(f"{total_rows} satır {elapsed:.1f} sn içinde üretildi ({manifest['stats']['rows_per_sec']:.0f} satır/sn)")
+        print(f"Manifest {manifest_path} konumuna kaydedildi.")
+        return manifest
+
+
+# Test işlevi
+def test_fleet_generator():
+    """FleetDataGenerator'ü küçük bir filo ile test eder"""
+    fleet = FleetDataGenerator(num_homes=4, master_seed=7, days=1, workers=2)
+    manifest = fleet.generate()
+
+    for home in manifest["homes"]:
+        print(f"Ev {home['home_id']}: {len(home['rooms'])} oda, {home['num_residents']} sakin, {home['rows']} satır")
+
+    return manifest
+
+
+if __name__ == "__main__":
+    test_fleet_generator()
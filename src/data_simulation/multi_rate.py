@@ -0,0 +1,211 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.config import config
+from src.topology import default_topology
+
+# Olay olarak saklanan kanallar için örnekleme hızı değeri
+EVENT = "event"
+
+
+def channel_of(column, topology=None):
+    """
+    Sütunun örnekleme hızı tablosundaki kanal adını döndürür
+
+    Args:
+        column (str): Sütun adı
+        topology (HomeTopology): Sütunları çözmek için topoloji
+
+    Returns:
+        str: Kanal adı (ör. "Sıcaklık", "Konum", "Dış_Hava_Sıcaklığı"); çözülemezse sütun adı
+    """
+    if str(column).endswith("_Konum"):
+        return "Konum"
+    pair = (topology or default_topology()).parse_column(column)
+    return pair[1] if pair is not None else column
+
+
+class MultiRateFrame:
+    """
+    Her kanalın kendi hızında saklandığı seyrek veri seti. Yavaş değişen ölçümler
+    (ör. sıcaklık 15 dakikada bir) yalnızca örnekleme anlarında, hareket/doluluk/cihaz ve
+    konum gibi kanallar ise yalnızca değer değiştiğinde (olay olarak) tutulur. Satırlar
+    başlangıç zamanı ve adım süresiyle tanımlanan düzenli bir zaman ızgarasındadır;
+    to_frame her kanalı bu ızgaraya as-of join (pandas.merge_asof) ile geri yerleştirir.
+    """
+
+    def __init__(self, start, time_step, length, columns, sampled, events):
+        """
+        MultiRateFrame sınıfını başlatır
+
+        Args:
+            start (numpy.datetime64): İlk satırın zamanı
+            time_step (int): Izgara adımı (dakika)
+            length (int): Izgaradaki satır sayısı
+            columns (list): Özgün sütun sırası ("timestamp" dahil)
+            sampled (dict): Sütun -> (adım aralığı, değerler); değerler her aralıkta bir satır içindir
+            events (dict): Sütun -> (değişim satırları, değerler)
+        """
+        self.start = np.datetime64(start, "ns")
+        self.time_step = int(time_step)
+        self.length = int(length)
+        self.columns = list(columns)
+        self.sampled = dict(sampled)
+        self.events = dict(events)
+
+    @classmethod
+    def from_frame(cls, df, rates=None, time_step=5, topology=None):
+        """
+        Düzenli aralıklı yoğun bir veri çerçevesini kanal hızlarına göre seyreltir
+
+        Args:
+            df (pandas.DataFrame): timestamp sütunu olan yoğun veri çerçevesi
+            rates (dict): Kanal -> dakika veya EVENT (None ise config'deki sampling_rates)
+            time_step (int): Veri çerçevesinin adım süresi (dakika)
+            topology (HomeTopology): Sütunları çözmek için topoloji
+
+        Returns:
+            MultiRateFrame: Seyrek veri seti
+        """
+        rates = config["data_simulation"]["sampling_rates"] if rates is None else rates
+        topology = topology or default_topology()
+        sampled, events = {}, {}
+        for column in df.columns:
+            if column == "timestamp":
+                continue
+            rate = rates.get(channel_of(column, topology), time_step)
+            values = df[column]
+            if rate == EVENT:
+                array = values.to_numpy()
+                rows = np.concatenate(([0], np.flatnonzero(array[1:] != array[:-1]) + 1)) if len(array) else \
+                    np.empty(0, dtype=np.int64)
+                events[column] = (rows.astype(np.int32), values.iloc[rows].reset_index(drop=True))
+            else:
+                # Hız ızgara adımının katına yuvarlanır
+                stride = max(1, int(round(rate / time_step)))
+                sampled[column] = (stride, values.iloc[::stride].reset_index(drop=True))
+        start = df["timestamp"].iloc[0] if len(df) else np.datetime64("1970-01-01")
+        return cls(start, time_step, len(df), df.columns, sampled, events)
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def shape(self):
+        """Yoğun karşılığın (satır, sütun) boyutu"""
+        return self.length, len(self.columns)
+
+    @property
+    def stored_values(self):
+        """Saklanan hücre sayısı (olay satırları ve örnekler)"""
+        return sum(len(values) for _, values in self.sampled.values()) + \
+            sum(len(values) for _, values in self.events.values())
+
+    @property
+    def nbytes(self):
+        """Seyrek veri setinin bellek boyutu (bayt)"""
+        total = 0
+        for _, values in self.sampled.values():
+            total += values.memory_usage(index=False)
+        for rows, values in self.events.values():
+            total += rows.nbytes + values.memory_usage(index=False)
+        return int(total)
+
+    def timestamps(self, freq_minutes=None):
+        """
+        Izgara zaman damgalarını döndürür
+
+        Args:
+            freq_minutes (int): Izgara aralığı (None ise time_step)
+
+        Returns:
+            numpy.ndarray: datetime64[ns] dizisi
+        """
+        freq_minutes = freq_minutes or self.time_step
+        offsets = np.arange(0, self.length * self.time_step, freq_minutes).astype("timedelta64[m]")
+        return self.start + offsets
+
+    def to_frame(self, freq_minutes=None):
+        """
+        Tüm kanalları düzenli ızgaraya as-of join ile yerleştirir: her satır, kanalın o
+        zamandan önceki (veya o zamandaki) son örneğini ya da son olayını alır.
+
+        Args:
+            freq_minutes (int): Çıktı ızgarasının aralığı (None ise time_step; ör. 15 verilirse
+                satır sayısı üçte birine iner)
+
+        Returns:
+            pandas.DataFrame: Özgün sütun sırasıyla yoğun veri çerçevesi
+        """
+        grid = pd.DataFrame({"timestamp": self.timestamps(freq_minutes)})
+        sample_times = self.timestamps()
+        result = {"timestamp": grid["timestamp"]}
+
+        # Aynı aralıkla örneklenen sütunlar tek bir as-of join ile yerleştirilir
+        by_stride = {}
+        for column, (stride, values) in self.sampled.items():
+            by_stride.setdefault(stride, {})[column] = values
+        for stride, columns in by_stride.items():
+            right = pd.DataFrame({"timestamp": sample_times[::stride], **columns})
+            merged = pd.merge_asof(grid, right, on="timestamp", direction="backward")
+            for column in columns:
+                result[column] = merged[column]
+
+        for column, (rows, values) in self.events.items():
+            right = pd.DataFrame({"timestamp": sample_times[rows], column: values})
+            merged = pd.merge_asof(grid, right, on="timestamp", direction="backward")
+            result[column] = merged[column]
+
+        return pd.DataFrame({column: result[column] for column in self.columns}, copy=False)
+
+
+def benchmark_multi_rate(days_list=(30, 365), seed=7):
+    """
+    Tek hızlı yoğun saklama ile çok hızlı seyrek saklamayı saklanan hücre sayısı,
+    bellek ve as-of join ile yeniden birleştirme süresi açısından karşılaştırır
+
+    Args:
+        days_list (tuple): Denenecek gün sayıları
+        seed (int): Üretim tohumu
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    results = []
+    for days in days_list:
+        generator = HomeDataGenerator(seed=seed, event_driven=True)
+        df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+
+        began = time.perf_counter()
+        sparse = MultiRateFrame.from_frame(df, time_step=generator.time_step, topology=generator.topology)
+        sparsify_seconds = time.perf_counter() - began
+
+        began = time.perf_counter()
+        dense = sparse.to_frame()
+        assemble_seconds = time.perf_counter() - began
+
+        event_columns = list(sparse.events)
+        result = {
+            "days": days,
+            "dense_cells": df.shape[0] * (df.shape[1] - 1),
+            "stored_cells": sparse.stored_values,
+            "dense_mb": df.drop(columns="timestamp").memory_usage(index=False).sum() / 2**20,
+            "sparse_mb": sparse.nbytes / 2**20,
+            "sparsify_ms": sparsify_seconds * 1000,
+            "assemble_ms": assemble_seconds * 1000,
+            "events_exact": bool(dense[event_columns].equals(df[event_columns])),
+        }
+        results.append(result)
+        print(f"{days:4d} gün | hücre: {result['dense_cells']:9d} -> {result['stored_cells']:9d} | "
+              f"bellek: {result['dense_mb']:6.2f} -> {result['sparse_mb']:6.2f} MiB | "
+              f"seyreltme: {result['sparsify_ms']:6.1f} ms | as-of birleştirme: {result['assemble_ms']:6.1f} ms | "
+              f"olay kanalları aynı: {result['events_exact']}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_multi_rate()
@@ -0,0 +1,283 @@
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.data_simulation.vectorized_engine import SENSOR_CHANNELS
+
+
+class ColumnarRecorder:
+    """
+    HomeDataGenerator (veya tek başına SensorSimulator) durumlarını adım başına sözlük
+    üretmeden, önceden ayrılmış tipli sütun dizilerine kaydeden sınıf. Sensörler float32,
+    hareket/doluluk ve cihazlar bool, sakin konumları kategori kodları, zaman ise tamsayı
+    dakika olarak tutulur; zaman damgaları yalnızca to_frame'de tek seferde üretilir.
+    """
+
+    def __init__(self, source, capacity):
+        """
+        ColumnarRecorder sınıfını başlatır
+
+        Args:
+            source (HomeDataGenerator | SensorSimulator): Kaydedilecek veri kaynağı
+            capacity (int): Ayrılacak satır sayısı
+        """
+        simulator = self._sensor_simulator(source)
+        self.clock = source.clock
+        self.rooms = list(simulator.rooms)
+        self.device_columns = [(room, device) for room in self.rooms for device in simulator.devices[room]]
+        user_simulator = getattr(source, "user_simulator", None)
+        self.residents = list(user_simulator.resident_locations) if user_simulator is not None else []
+
+        # Konum kategorileri: odalar + rutinlerde geçen diğer konumlar (ilk görüldüğünde eklenir)
+        self.location_names = list(self.rooms)
+        self._location_codes = {room: code for code, room in enumerate(self.location_names)}
+        self._location_codes[None] = -1
+
+        if simulator.vectorized:
+            engine = simulator.engine
+            self._device_cells = np.array(
+                [self.rooms.index(room) * len(engine.device_types) + engine.device_types.index(device)
+                 for room, device in self.device_columns], dtype=int)
+
+        self.capacity = capacity
+        self.size = 0
+        self.minutes = np.empty(capacity, dtype=np.int64)
+        self.sensors = np.empty((capacity, len(self.rooms), len(SENSOR_CHANNELS)), dtype=np.float32)
+        self.motion = np.empty((capacity, len(self.rooms)), dtype=bool)
+        self.occupancy = np.empty((capacity, len(self.rooms)), dtype=bool)
+        self.devices = np.empty((capacity, len(self.device_columns)), dtype=bool)
+        self.locations = np.empty((capacity, len(self.residents)), dtype=np.int16)
+        # Dış sıcaklık yalnızca hava zaman serisi bağlıysa kaydedilir
+        self.outdoor = np.empty(capacity, dtype=np.float32) if simulator.weather is not None else None
+
+    @staticmethod
+    def _sensor_simulator(source):
+        """Kaynak bir veri üreteci ise içindeki sensör simülatörünü, değilse kendisini döndürür"""
+        return getattr(source, "sensor_simulator", source)
+
+    def record(self, source):
+        """
+        Kaynağın mevcut durumunu bir sonraki satıra yazar
+
+        Args:
+            source (HomeDataGenerator | SensorSimulator): Kaydedilecek veri kaynağı
+        """
+        if self.size >= self.capacity:
+            raise IndexError("Kaydedici kapasitesi doldu")
+
+        i = self.size
+        simulator = self._sensor_simulator(source)
+        self.minutes[i] = source.current_minute
+        if self.outdoor is not None:
+            self.outdoor[i] = simulator.outdoor_temperature()
+
+        if simulator.vectorized:
+            engine = simulator.engine
+            self.sensors[i] = engine.values
+            self.motion[i] = engine.motion
+            self.occupancy[i] = engine.occupancy
+            self.devices[i] = engine.device_state.ravel()[self._device_cells]
+        else:
+            for r, room in enumerate(self.rooms):
+                status = simulator.room_status[room]
+                self.sensors[i, r] = (status["Sıcaklık"], status["Nem"], status["Işık"], status["CO2"])
+                self.motion[i, r] = status["Hareket"]
+                self.occupancy[i, r] = status["Doluluk"]
+            for d, (room, device) in enumerate(self.device_columns):
+                self.devices[i, d] = simulator.devices[room][device]
+
+        if not self.residents:
+            self.size += 1
+            return
+
+        locations = source.user_simulator.resident_locations
+        for k, resident in enumerate(self.residents):
+            self.locations[i, k] = self.location_code(locations[resident])
+
+        self.size += 1
+
+    def location_code(self, location):
+        """
+        Konum adının kategori kodunu döndürür (ilk kez görülen konumlar kategorilere eklenir)
+
+        Args:
+            location (str): Konum adı (None = ev dışında)
+
+        Returns:
+            int: Kategori kodu (None için -1)
+        """
+        code = self._location_codes.get(location)
+        if code is None:
+            code = len(self.location_names)
+            self.location_names.append(location)
+            self._location_codes[location] = code
+        return code
+
+    def record_block(self, minutes, sensors, motion, occupancy, devices, locations, outdoor=None):
+        """
+        Birden çok adımı tek seferde sonraki satırlara yazar
+
+        Args:
+            minutes (numpy.ndarray): (n,) başlangıçtan itibaren geçen dakikalar
+            sensors (numpy.ndarray): (n, oda, kanal) sensör değerleri
+            motion (numpy.ndarray): (n, oda) hareket durumları
+            occupancy (numpy.ndarray): (n, oda) doluluk durumları
+            devices (numpy.ndarray): (n, cihaz sütunu) cihaz durumları
+            locations (numpy.ndarray): (n, sakin) location_code ile üretilmiş konum kodları
+            outdoor (numpy.ndarray): (n,) dış sıcaklıklar (hava zaman serisi bağlıysa)
+        """
+        n = len(minutes)
+        if self.size + n > self.capacity:
+            raise IndexError("Kaydedici kapasitesi doldu")
+
+        block = slice(self.size, self.size + n)
+        self.minutes[block] = minutes
+        self.sensors[block] = sensors
+        self.motion[block] = motion
+        self.occupancy[block] = occupancy
+        self.devices[block] = devices
+        self.locations[block] = locations
+        if self.outdoor is not None:
+            self.outdoor[block] = outdoor
+        self.size += n
+
+    def get_state(self):
+        """
+        Şimdiye kadar kaydedilen satırları ve konum kategorilerini kopya olarak döndürür
+
+        Returns:
+            dict: set_state ile geri yüklenebilecek durum
+        """
+        n = self.size
+        return {
+            "size": n,
+            "location_names": list(self.location_names),
+            "minutes": self.minutes[:n].copy(),
+            "sensors": self.sensors[:n].copy(),
+            "motion": self.motion[:n].copy(),
+            "occupancy": self.occupancy[:n].copy(),
+            "devices": self.devices[:n].copy(),
+            "locations": self.locations[:n].copy(),
+            "outdoor": self.outdoor[:n].copy() if self.outdoor is not None else None,
+        }
+
+    def set_state(self, state):
+        """
+        get_state ile alınmış satırları dizilerin başına geri yazar
+
+        Args:
+            state (dict): get_state çıktısı
+        """
+        n = state["size"]
+        if n > self.capacity:
+            raise IndexError("Kaydedici kapasitesi doldu")
+
+        self.location_names = list(state["location_names"])
+        self._location_codes = {name: code for code, name in enumerate(self.location_names)}
+        self._location_codes[None] = -1
+        self.minutes[:n] = state["minutes"]
+        self.sensors[:n] = state["sensors"]
+        self.motion[:n] = state["motion"]
+        self.occupancy[:n] = state["occupancy"]
+        self.devices[:n] = state["devices"]
+        self.locations[:n] = state["locations"]
+        if self.outdoor is not None:
+            self.outdoor[:n] = state["outdoor"]
+        self.size = n
+
+    def reset(self):
+        """Kaydediciyi boşaltır (diziler yeniden kullanılır)"""
+        self.size = 0
+
+    def to_frame(self, copy=False):
+        """
+        Kaydedilen satırlardan DataFrame oluşturur
+
+        Args:
+            copy (bool): Diziler yeniden kullanılacaksa verileri kopyala
+
+        Returns:
+            pandas.DataFrame: get_current_state ile aynı sütun sırasına sahip veri çerçevesi
+        """
+        n = self.size
+
+        def take(array):
+            return array[:n].copy() if copy else array[:n]
+
+        columns = {"timestamp": self.clock.timestamps(self.minutes[:n])}
+        if self.outdoor is not None:
+            columns["Dış_Hava_Sıcaklığı"] = take(self.outdoor)
+        devices_by_room = {}
+        for d, (room, device) in enumerate(self.device_columns):
+            devices_by_room.setdefault(room, []).append((device, d))
+
+        for r, room in enumerate(self.rooms):
+            for s, sensor in enumerate(SENSOR_CHANNELS):
+                columns[f"{room}_{sensor}"] = take(self.sensors[:, r, s])
+            columns[f"{room}_Hareket"] = take(self.motion[:, r])
+            columns[f"{room}_Doluluk"] = take(self.occupancy[:, r])
+            for device, d in devices_by_room.get(room, []):
+                columns[f"{room}_{device}"] = take(self.devices[:, d])
+
+        for k, resident in enumerate(self.residents):
+            columns[f"{resident}_Konum"] = pd.Categorical.from_codes(self.locations[:n, k], self.location_names)
+
+        return pd.DataFrame(columns, copy=False)
+
+
+def benchmark_recording(days_list=(7, 90), time_step=5):
+    """
+    Sözlük listesi + pd.DataFrame ile sütunsal kaydediciyi tepe bellek ve
+    DataFrame oluşturma süresi açısından karşılaştırır
+
+    Args:
+        days_list (tuple): Denenecek gün sayıları
+        time_step (int): Simülasyon adımları arasındaki dakika farkı
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    start_time = datetime(2025, 1, 6, 8, 0)
+    results = []
+    for days in days_list:
+        steps = int((days * 24 * 60) / time_step)
+        for method in ("dicts", "columnar"):
+            generator = HomeDataGenerator(start_time=start_time, time_step=time_step, seed=42)
+            generator.current_minute = 0
+            tracemalloc.start()
+            if method == "dicts":
+                states = [generator.update_simulation() for _ in range(steps)]
+                began = time.perf_counter()
+                df = pd.DataFrame(states)
+            else:
+                recorder = ColumnarRecorder(generator, steps)
+                for _ in range(steps):
+                    generator.advance()
+                    recorder.record(generator)
+                began = time.perf_counter()
+                df = recorder.to_frame()
+            build_seconds = time.perf_counter() - began
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            result = {
+                "days": days,
+                "method": method,
+                "peak_mib": peak / 2**20,
+                "frame_build_ms": build_seconds * 1000,
+                "frame_mib": df.memory_usage(deep=True).sum() / 2**20,
+            }
+            results.append(result)
+            print(f"{days:3d} gün | {method:8s} | tepe bellek: {result['peak_mib']:7.1f} MiB | "
+                  f"DataFrame oluşturma: {result['frame_build_ms']:8.1f} ms | "
+                  f"DataFrame boyutu: {result['frame_mib']:6.1f} MiB")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_recording()
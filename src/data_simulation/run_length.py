@@ -0,0 +1,400 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+
+class RunLengthColumn:
+    """
+    Seyrek değişen bir bool kanalını (doluluk, cihaz durumu) yalnızca değişim
+    noktalarıyla tutan sütun. Ardışık koşuların değerleri birbirinin tersi olduğundan
+    koşu başlangıçları ve ilk değer yeterlidir; sütun satır sayısı kadar yer yerine
+    değişim sayısı kadar yer kaplar ve açık kalma oranı gibi taramalar koşular
+    üzerinden yapılır.
+    """
+
+    def __init__(self, starts, first, length):
+        """
+        RunLengthColumn sınıfını başlatır
+
+        Args:
+            starts (numpy.ndarray): Koşuların başladığı satırlar (artan, ilki 0)
+            first (bool): İlk koşunun değeri
+            length (int): Toplam satır sayısı
+        """
+        self.length = int(length)
+        self.starts = np.asarray(starts, dtype=np.int32 if self.length < 2**31 else np.int64)
+        self.first = bool(first)
+
+    @classmethod
+    def from_dense(cls, array):
+        """
+        Yoğun bir diziyi değişim noktalarına dönüştürür
+
+        Args:
+            array (numpy.ndarray): Bool dizisi
+
+        Returns:
+            RunLengthColumn: Kodlanmış sütun
+        """
+        array = np.asarray(array, dtype=bool)
+        if len(array) == 0:
+            return cls(np.empty(0, dtype=np.int64), False, 0)
+        starts = np.concatenate(([0], np.flatnonzero(array[1:] != array[:-1]) + 1))
+        return cls(starts, array[0], len(array))
+
+    @property
+    def values(self):
+        """Koşuların değerleri (ilk değerden başlayarak dönüşümlü)"""
+        return (np.arange(len(self.starts)) % 2 == 1) != self.first
+
+    @property
+    def runs(self):
+        """Koşu sayısı"""
+        return len(self.starts)
+
+    @property
+    def transitions(self):
+        """Durum değişikliği sayısı"""
+        return max(len(self.starts) - 1, 0)
+
+    @property
+    def nbytes(self):
+        """Kodlanmış sütunun bellek boyutu (bayt)"""
+        return self.starts.nbytes
+
+    def run_lengths(self):
+        """Her koşunun satır sayısını döndürür"""
+        return np.diff(np.append(self.starts, self.length))
+
+    def to_dense(self):
+        """
+        Sütunu yoğun bool dizisine açar
+
+        Returns:
+            numpy.ndarray: Satır sayısı uzunluğunda bool dizisi
+        """
+        return np.repeat(self.values, self.run_lengths())
+
+    def on_count(self, start=0, stop=None):
+        """
+        Satır aralığında değerin True olduğu satır sayısını koşular üzerinden hesaplar
+
+        Args:
+            start (int): Aralık başlangıcı (dahil)
+            stop (int): Aralık sonu (hariç, None ise son satır)
+
+        Returns:
+            int: True satır sayısı
+        """
+        stop = self.length if stop is None else min(stop, self.length)
+        start = max(start, 0)
+        if stop <= start:
+            return 0
+        ends = np.append(self.starts[1:], self.length)
+        overlap = np.minimum(ends, stop) - np.maximum(self.starts, start)
+        return int(np.clip(overlap, 0, None)[self.values].sum())
+
+    def on_ratio(self, start=0, stop=None):
+        """
+        Satır aralığında değerin True olduğu satırların oranını döndürür
+
+        Args:
+            start (int): Aralık başlangıcı (dahil)
+            stop (int): Aralık sonu (hariç, None ise son satır)
+
+        Returns:
+            float: Açık kalma oranı (boş aralıkta 0)
+        """
+        stop = self.length if stop is None else min(stop, self.length)
+        rows = stop - max(start, 0)
+        return self.on_count(start, stop) / rows if rows > 0 else 0.0
+
+
+class RunLengthFrame:
+    """
+    Seyrek değişen bool kanalları RunLengthColumn olarak, diğer sütunları yoğun olarak
+    tutan veri seti. Uzun ufuklu veri setlerinde doluluk ve cihaz sütunları satır başına
+    bir bayt yerine değişim başına yer kaplar; sık değişen sütunlar (ör. adım adım
+    örneklenen hareket) kodlamadan kazanç sağlamadığı için yoğun kalır. to_frame ile
+    sütun sırası korunarak yoğun DataFrame'e açılır.
+    """
+
+    def __init__(self, dense, encoded, columns):
+        """
+        RunLengthFrame sınıfını başlatır
+
+        Args:
+            dense (pandas.DataFrame): Kodlanmamış sütunlar
+            encoded (dict): Sütun adı -> RunLengthColumn
+            columns (list): Özgün sütun sırası
+        """
+        self.dense = dense
+        self.encoded = dict(encoded)
+        self.columns = list(columns)
+
+    @classmethod
+    def from_frame(cls, df, columns=None, max_change_rate=0.2):
+        """
+        Veri çerçevesinin bool sütunlarını değişim noktalarıyla kodlar
+
+        Args:
+            df (pandas.DataFrame): Yoğun veri çerçevesi
+            columns (list): Kodlanacak sütunlar (None ise değişim oranı max_change_rate'in
+                altında kalan bool sütunlar)
+            max_change_rate (float): Satır başına değişim oranı sınırı (4 baytlık koşu
+                başlangıcı 1 baytlık yoğun satırdan ancak bu oranın altında kazançlıdır)
+
+        Returns:
+            RunLengthFrame: Kodlanmış veri seti
+        """
+        encoded = {}
+        for column in (df.columns if columns is None else columns):
+            if columns is None and df[column].dtype != bool:
+                continue
+            encoded_column = RunLengthColumn.from_dense(df[column].to_numpy())
+            if columns is None and encoded_column.runs > max_change_rate * len(df):
+                continue
+            encoded[column] = encoded_column
+        dense = df.drop(columns=list(encoded))
+        return cls(dense, encoded, df.columns)
+
+    def __len__(self):
+        return len(self.dense)
+
+    @property
+    def shape(self):
+        """Yoğun karşılığın (satır, sütun) boyutu"""
+        return len(self.dense), len(self.columns)
+
+    @property
+    def nbytes(self):
+        """Kodlanmış veri setinin bellek boyutu (bayt)"""
+        return int(self.dense.memory_usage(index=False, deep=False).sum()) + \
+            sum(column.nbytes for column in self.encoded.values())
+
+    @property
+    def dense_nbytes(self):
+        """Yoğun karşılığın bellek boyutu (bayt)"""
+        return int(self.dense.memory_usage(index=False, deep=False).sum()) + len(self.dense) * len(self.encoded)
+
+    def to_frame(self):
+        """
+        Veri setini özgün sütun sırasıyla yoğun DataFrame'e açar
+
+        Returns:
+            pandas.DataFrame: Yoğun veri çerçevesi
+        """
+        columns = {}
+        for column in self.columns:
+            if column in self.encoded:
+                columns[column] = self.encoded[column].to_dense()
+            else:
+                columns[column] = self.dense[column].array
+        df = pd.DataFrame(columns, copy=False)
+        df.index = self.dense.index
+        return df
+
+    def on_ratio(self, columns=None, start=0, stop=None):
+        """
+        Kodlanmış sütunların satır aralığındaki açık kalma oranlarını döndürür
+
+        Args:
+            columns (list): Sütunlar (None ise tüm kodlanmış sütunlar)
+            start (int): Aralık başlangıcı (dahil)
+            stop (int): Aralık sonu (hariç)
+
+        Returns:
+            pandas.Series: Sütun adı -> oran
+        """
+        columns = list(self.encoded) if columns is None else columns
+        return pd.Series({column: self.encoded[column].on_ratio(start, stop) for column in columns}, dtype=float)
+
+
+def dense_frame(data):
+    """
+    Seyrek saklanan veri setini (RunLengthFrame, MultiRateFrame) yoğun DataFrame'e açar,
+    DataFrame ise kendisini döndürür
+
+    Args:
+        data (pandas.DataFrame | RunLengthFrame | MultiRateFrame): Veri seti
+
+    Returns:
+        pandas.DataFrame: Yoğun veri çerçevesi
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+    return data.to_frame()
+
+
+class RunLengthHistory:
+    """
+    Simülasyon geçmişini adım sözlüğü listesi gibi kullanılabilen, bool kanalları ise
+    yalnızca değer değiştiğinde kaydeden yapı. append, len, [i] ve yineleme bir sözlük
+    listesi gibi davranır; to_frame geçmişi tek seferde DataFrame'e açar.
+    """
+
+    def __init__(self):
+        """RunLengthHistory sınıfını başlatır"""
+        self.length = 0
+        self.dense = {}      # sütun -> değer listesi
+        self.runs = {}       # sütun -> ([başlangıç satırları], [değerler])
+        self.columns = []
+
+    def append(self, record):
+        """
+        Bir adımın durum sözlüğünü ekler
+
+        Args:
+            record (dict): Sütun adı -> değer
+        """
+        for column, value in record.items():
+            if column not in self.dense and column not in self.runs:
+                self.columns.append(column)
+                if isinstance(value, (bool, np.bool_)):
+                    self.runs[column] = ([0] if self.length else [], [None] if self.length else [])
+                else:
+                    self.dense[column] = [None] * self.length
+            if column in self.runs:
+                starts, values = self.runs[column]
+                if not values or values[-1] != value:
+                    starts.append(self.length)
+                    values.append(value)
+            else:
+                self.dense[column].append(value)
+
+        # Bu adımda bulunmayan sütunlar
+        for column in self.columns:
+            if column in record:
+                continue
+            if column in self.runs:
+                starts, values = self.runs[column]
+                if values[-1] is not None:
+                    starts.append(self.length)
+                    values.append(None)
+            else:
+                self.dense[column].append(None)
+        self.length += 1
+
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Geçmiş dizini aralık dışında")
+        record = {}
+        for column in self.columns:
+            if column in self.runs:
+                starts, values = self.runs[column]
+                value = values[int(np.searchsorted(starts, index, side="right")) - 1]
+            else:
+                value = self.dense[column][index]
+            if value is not None:
+                record[column] = value
+        return record
+
+    def __iter__(self):
+        for index in range(self.length):
+            yield self[index]
+
+    def on_ratio(self, column):
+        """
+        Bool bir sütunun geçmiş boyunca True olduğu adımların oranını döndürür
+
+        Args:
+            column (str): Sütun adı
+
+        Returns:
+            float: Açık kalma oranı
+        """
+        starts, values = self.runs[column]
+        lengths = np.diff(np.append(starts, self.length))
+        on = np.array([value is True or value is np.True_ for value in values], dtype=bool)
+        return float(lengths[on].sum() / self.length) if self.length else 0.0
+
+    def to_frame(self):
+        """
+        Geçmişi DataFrame'e açar (bool sütunlar koşulardan tek seferde üretilir)
+
+        Returns:
+            pandas.DataFrame: Adım başına bir satır içeren veri çerçevesi
+        """
+        columns = {}
+        for column in self.columns:
+            if column in self.runs:
+                starts, values = self.runs[column]
+                lengths = np.diff(np.append(starts, self.length))
+                if all(isinstance(value, (bool, np.bool_)) for value in values):
+                    columns[column] = np.repeat(np.array(values, dtype=bool), lengths)
+                else:
+                    columns[column] = np.repeat(np.array(values, dtype=object), lengths)
+            else:
+                columns[column] = self.dense[column]
+        return pd.DataFrame(columns)
+
+
+def benchmark_run_length(days_list=(30, 365), seed=7):
+    """
+    Yoğun ve değişim noktalı saklamayı bellek boyutu, açık kalma oranı taraması ve
+    yoğun çerçeveye açma süresi açısından karşılaştırır
+
+    Args:
+        days_list (tuple): Denenecek gün sayıları
+        seed (int): Üretim tohumu
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.data_generator import HomeDataGenerator
+
+    results = []
+    for days in days_list:
+        generator = HomeDataGenerator(seed=seed, event_driven=True)
+        df = generator.generate_dataset(days=days, save_to_csv=False, verbose=False)
+
+        began = time.perf_counter()
+        rle = RunLengthFrame.from_frame(df)
+        encode_seconds = time.perf_counter() - began
+
+        columns = list(rle.encoded)
+        began = time.perf_counter()
+        dense_ratio = df[columns].mean()
+        dense_scan_seconds = time.perf_counter() - began
+
+        began = time.perf_counter()
+        rle_ratio = rle.on_ratio()
+        rle_scan_seconds = time.perf_counter() - began
+
+        began = time.perf_counter()
+        decoded = rle.to_frame()
+        decode_seconds = time.perf_counter() - began
+
+        result = {
+            "days": days,
+            "rows": len(df),
+            "dense_mb": rle.dense_nbytes / 2**20,
+            "rle_mb": rle.nbytes / 2**20,
+            "bool_dense_kb": len(df) * len(columns) / 2**10,
+            "bool_rle_kb": sum(column.nbytes for column in rle.encoded.values()) / 2**10,
+            "encode_ms": encode_seconds * 1000,
+            "dense_scan_ms": dense_scan_seconds * 1000,
+            "rle_scan_ms": rle_scan_seconds * 1000,
+            "decode_ms": decode_seconds * 1000,
+            "same_ratio": bool(np.allclose(dense_ratio.to_numpy(), rle_ratio[columns].to_numpy())),
+            "same_frame": decoded.equals(df),
+        }
+        results.append(result)
+        print(f"{days:4d} gün | {len(df):7d} satır | bool sütunlar: {result['bool_dense_kb']:8.1f} KiB -> "
+              f"{result['bool_rle_kb']:7.1f} KiB | toplam: {result['dense_mb']:6.2f} -> {result['rle_mb']:6.2f} MiB | "
+              f"oran taraması: {result['dense_scan_ms']:6.2f} / {result['rle_scan_ms']:6.2f} ms | "
+              f"açma: {result['decode_ms']:6.1f} ms | aynı: {result['same_ratio'] and result['same_frame']}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_run_length()
@@ -1,17 +1,27 @@
 import numpy as np
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
 import os
 from src.config import config
+from src.topology import default_topology
+from src.data_simulation.vectorized_engine import VectorizedRoomEngine, SENSOR_CHANNELS, outdoor_coupling
+from src.data_simulation.clock import MinuteClock
+from src.data_simulation.thermal_model import ThermalNetwork
+from src.data_simulation.recorder import ColumnarRecorder
+from src.data_simulation.columnar_io import write_frame
+from src.data_simulation.run_length import RunLengthFrame
+from src.data_simulation.multi_rate import MultiRateFrame
 
 class SensorSimulator:
     """
     Akıllı ev için sensör verilerini simüle eden sınıf.
     Sıcaklık, nem, ışık seviyesi, CO2 ve kullanıcı hareketleri gibi verileri üretir.
+    Zaman, sıcak döngüde başlangıçtan itibaren geçen tamsayı dakika (current_minute) olarak tutulur;
+    room_status içindeki Son_Hareket de aynı dakika ölçeğindedir.
     """
     
-    def __init__(self, rooms=None, start_time=None, time_step=5):
+    def __init__(self, rooms=None, start_time=None, time_step=5, vectorized=False, seed=None, weather=None,
+                 topology=None, sampling_rates=None, thermal_model=None):
         """
         SensorSimulator sınıfı başlatma
         
@@ -19,21 +29,64 @@ class SensorSimulator:
             rooms (list): Simüle edilecek odaların listesi
             start_time (datetime): Simülasyonun başlangıç zamanı
             time_step (int): Simülasyon adımları arasındaki dakika farkı
+            vectorized (bool): Oda durumlarını NumPy dizilerinde tutan vektörize motoru kullan
+            seed (int): Rastgele sayı üreteci tohumu (None ise global random modülü kullanılır)
+            weather (WeatherTimeline): Dış hava zaman serisi (None ise dış hava etkisi yoktur)
+            topology (HomeTopology): Oda/cihaz topolojisi (None ise odalar için config'den oluşturulan ortak topoloji)
+            sampling_rates (dict): Çok hızlı saklamada kanal -> dakika veya "event" (config'deki değerlerin üzerine yazılır)
+            thermal_model (bool | ThermalNetwork): Oda sıcaklıklarını birbirine ve dış havaya bağlı RC ısıl ağla
+                hesapla (True ise odalar liste sırasıyla komşu kabul edilir; None ise bağımsız rastgele yürüyüş)
         """
-        self.rooms = rooms or config["rooms"]
+        self.topology = topology or default_topology(rooms)
+        self.sampling_rates = {**config["data_simulation"]["sampling_rates"], **(sampling_rates or {})}
+        self.rooms = rooms or self.topology.rooms
         self.start_time = start_time or datetime.now()
         self.time_step = time_step
-        self.current_time = self.start_time
+        self.clock = MinuteClock(self.start_time)
+        self.current_minute = 0
+        self.vectorized = vectorized
+        self.engine = None
+        self.random = random.Random(seed) if seed is not None else random
         
-        # Devices setup using config
-        self.devices = {}
-        for room in self.rooms:
-            self.devices[room] = {}
-            for device in config["devices_per_room"]:
-                # Only add devices that make sense for the room
-                if (room in ["Salon", "Yatak Odası", "Çocuk Odası"] and device in ["Klima", "Lamba", "Perde"]) or \
-                   (room in ["Mutfak", "Banyo"] and device in ["Lamba", "Havalandırma"]):
-                    self.devices[room][device] = False
+        # Dış hava: zaman serisindeki konum bir kez hesaplanır, her adımda O(1) okunur
+        self.weather = weather
+        self.weather_coupling = outdoor_coupling(time_step) if weather is not None else 0.0
+        self._weather_offset = round((self.start_time - weather.start_time).total_seconds() / 60) \
+            if weather is not None else 0
+        
+        # Isıl ağ: tüm odaların sıcaklığı adım başına tek matris-vektör çarpımıyla güncellenir
+        if thermal_model is True:
+            thermal_model = ThermalNetwork(self.rooms, time_step)
+        self.thermal = thermal_model or None
+        
+        # Cihazlar oda türüne göre topolojiden atanır
+        self.devices = {room: {device: False for device in self.topology.room_devices[room]} for room in self.rooms}
+        
+        if self.vectorized:
+            # Durumlar dizilerde tutulur, sözlükler yalnızca dizilere bağlı görünümlerdir
+            self.engine = VectorizedRoomEngine(self.rooms, self.devices, self.start_time, seed=seed,
+                                               thermal=self.thermal)
+            self.devices = {room: self.engine.device_view(i) for i, room in enumerate(self.rooms)}
+            self.room_status = {room: self.engine.room_status_view(i) for i, room in enumerate(self.rooms)}
+            # get_current_state için anahtarlar ve düz değer dizisindeki konumları bir kez hesaplanır
+            keys, sensor_pos, motion_pos, occupancy_pos, device_pos, device_cells = [], [], [], [], [], []
+            for i, room in enumerate(self.rooms):
+                sensor_pos.extend(range(len(keys), len(keys) + len(SENSOR_CHANNELS)))
+                keys.extend(f"{room}_{sensor}" for sensor in SENSOR_CHANNELS)
+                motion_pos.append(len(keys))
+                keys.append(f"{room}_Hareket")
+                occupancy_pos.append(len(keys))
+                keys.append(f"{room}_Doluluk")
+                for k, device in enumerate(self.engine.device_types):
+                    if self.engine.device_mask[i, k]:
+                        device_pos.append(len(keys))
+                        device_cells.append(i * len(self.engine.device_types) + k)
+                        keys.append(f"{room}_{device}")
+            self._state_keys = keys
+            self._state_positions = (np.array(sensor_pos), np.array(motion_pos), np.array(occupancy_pos),
+                                     np.array(device_pos, dtype=int), np.array(device_cells, dtype=int))
+            self._state_buffer = np.empty(len(keys), dtype=object)
+            return
         
         # Room status setup using config
         self.room_status = {}
@@ -45,45 +98,74 @@ class SensorSimulator:
                 "CO2": self._random_co2(),
                 "Hareket": False,
                 "Doluluk": False,
-                "Son_Hareket": self.start_time - timedelta(minutes=random.randint(5, 120))
+                "Son_Hareket": -self.random.randint(5, 120)
             }
     
+    @property
+    def current_time(self):
+        """Mevcut simülasyon zamanı (datetime olarak)"""
+        return self.clock.to_datetime(self.current_minute)
+    
+    @current_time.setter
+    def current_time(self, value):
+        self.current_minute = round(self.clock.to_minute(value))
+    
+    def outdoor_temperature(self, minute=None):
+        """
+        Dış sıcaklığı hava zaman serisinden okur
+        
+        Args:
+            minute (int): Başlangıçtan itibaren geçen dakika (None ise mevcut dakika)
+            
+        Returns:
+            float: Dış sıcaklık (°C), hava zaman serisi yoksa None
+        """
+        if self.weather is None:
+            return None
+        if minute is None:
+            minute = self.current_minute
+        return self.weather.temperature_at(self._weather_offset + minute)
+    
     def _random_temp(self):
         """Rastgele sıcaklık değeri üretir (°C)"""
-        return round(random.uniform(18.0, 30.0), 1)
+        return round(self.random.uniform(18.0, 30.0), 1)
     
     def _random_humidity(self):
         """Rastgele nem değeri üretir (%)"""
-        return round(random.uniform(30.0, 70.0), 1)
+        return round(self.random.uniform(30.0, 70.0), 1)
     
     def _random_light(self):
         """Rastgele ışık seviyesi üretir (lux)"""
         # Gün içindeki saate göre ışık seviyesini ayarla
-        hour = self.current_time.hour
+        hour = self.clock.hour(self.current_minute)
         if 8 <= hour <= 18:  # Gündüz
-            return round(random.uniform(200, 1000), 1)
+            return round(self.random.uniform(200, 1000), 1)
         elif 6 <= hour < 8 or 18 < hour <= 20:  # Şafak/alacakaranlık
-            return round(random.uniform(50, 200), 1)
+            return round(self.random.uniform(50, 200), 1)
         else:  # Gece
-            return round(random.uniform(0, 50), 1)
+            return round(self.random.uniform(0, 50), 1)
     
     def _random_co2(self):
         """Rastgele CO2 seviyesi üretir (ppm)"""
-        return round(random.uniform(400, 1200), 1)
+        return round(self.random.uniform(400, 1200), 1)
     
     def _simulate_user_movement(self):
         """Kullanıcı hareketlerini simüle eder"""
+        if self.vectorized:
+            self.engine.simulate_user_movement(self.clock.hour(self.current_minute), self.current_minute)
+            return
+        
+        hour = self.clock.hour(self.current_minute)
         for room in self.rooms:
             # Hareket olasılığı - odada hareket olma ihtimali
             movement_prob = 0.2
             
             # Eğer son hareketten bu yana çok zaman geçtiyse, hareket olasılığı artar
-            time_since_last_movement = (self.current_time - self.room_status[room]["Son_Hareket"]).total_seconds() / 60
+            time_since_last_movement = self.current_minute - self.room_status[room]["Son_Hareket"]
             if time_since_last_movement > 30:
                 movement_prob += 0.2
             
             # Gün içindeki saate göre hareket olasılığını ayarla
-            hour = self.current_time.hour
             if 7 <= hour <= 9:  # Sabah
                 movement_prob += 0.3
             elif 17 <= hour <= 22:  # Akşam
@@ -92,59 +174,93 @@ class SensorSimulator:
                 movement_prob -= 0.1
             
             # Hareket simülasyonu
-            if random.random() < movement_prob:
+            if self.random.random() < movement_prob:
                 self.room_status[room]["Hareket"] = True
-                self.room_status[room]["Son_Hareket"] = self.current_time
+                self.room_status[room]["Son_Hareket"] = self.current_minute
                 
                 # Hareket varsa odanın dolu olma ihtimali
-                if random.random() < 0.8:
+                if self.random.random() < 0.8:
                     self.room_status[room]["Doluluk"] = True
             else:
                 self.room_status[room]["Hareket"] = False
                 
                 # Hareket yoksa, belirli bir süre sonra oda boşalabilir
-                if self.room_status[room]["Doluluk"] and random.random() < 0.3:
+                if self.room_status[room]["Doluluk"] and self.random.random() < 0.3:
                     self.room_status[room]["Doluluk"] = False
     
     def _update_environmental_data(self):
         """Çevresel verileri (sıcaklık, nem vb.) günceller"""
+        if self.vectorized:
+            self.engine.update_environmental_data(self.clock.hour(self.current_minute),
+                                                  self.outdoor_temperature(), self.weather_coupling)
+            return
+        
+        hour = self.clock.hour(self.current_minute)
+        outdoor = self.outdoor_temperature()
+        if self.thermal is not None:
+            self._update_thermal_temperatures(hour, outdoor)
         for room in self.rooms:
             # Cihazların durumuna ve diğer faktörlere göre sensör verilerini güncelle
             
-            # Sıcaklık değişimi
-            temp_change = random.uniform(-0.5, 0.5)  # Doğal dalgalanma
-            
-            # Klima açıksa sıcaklığı ayarla
-            if "Klima" in self.devices[room] and self.devices[room]["Klima"]:
-                desired_temp = 23.0  # Hedef sıcaklık
-                current_temp = self.room_status[room]["Sıcaklık"]
-                if current_temp > desired_temp:
-                    temp_change -= random.uniform(0.5, 1.0)  # Soğutma
-                else:
-                    temp_change += random.uniform(0.5, 1.0)  # Isıtma
-            
-            # Saat bazlı sıcaklık değişimi (gündüz daha sıcak, gece daha serin)
-            hour = self.current_time.hour
-            if 10 <= hour <= 16:  # Gün ortası
-                temp_change += 0.2
-            elif 0 <= hour <= 5:  # Gece
-                temp_change -= 0.2
+            # Sıcaklık değişimi (ısıl ağ kullanılıyorsa sıcaklıklar yukarıda güncellendi)
+            temp_change = 0.0
+            if self.thermal is None:
+                temp_change = self.random.uniform(-0.5, 0.5)  # Doğal dalgalanma
+                
+                # Klima açıksa sıcaklığı ayarla
+                if "Klima" in self.devices[room] and self.devices[room]["Klima"]:
+                    desired_temp = 23.0  # Hedef sıcaklık
+                    current_temp = self.room_status[room]["Sıcaklık"]
+                    if current_temp > desired_temp:
+                        temp_change -= self.random.uniform(0.5, 1.0)  # Soğutma
+                    else:
+                        temp_change += self.random.uniform(0.5, 1.0)  # Isıtma
+                
+                # Saat bazlı sıcaklık değişimi (gündüz daha sıcak, gece daha serin)
+                if 10 <= hour <= 16:  # Gün ortası
+                    temp_change += 0.2
+                elif 0 <= hour <= 5:  # Gece
+                    temp_change -= 0.2
+                
+                # Dış hava varsa oda sıcaklığı dış sıcaklığa doğru yavaşça yaklaşır
+                if outdoor is not None:
+                    temp_change += self.weather_coupling * (outdoor - self.room_status[room]["Sıcaklık"])
             
-            # Odada insan varsa sıcaklık ve CO2 biraz artar
+            # Odada insan varsa sıcaklık ve CO2 biraz artar (ısıl ağda sakin ısısı kaynak olarak eklenir)
             if self.room_status[room]["Doluluk"]:
-                temp_change += 0.1
-                self.room_status[room]["CO2"] += random.uniform(10, 30)
+                if self.thermal is None:
+                    temp_change += 0.1
+                self.room_status[room]["CO2"] += self.random.uniform(10, 30)
             else:
                 # Odada kimse yoksa CO2 yavaşça düşer
                 if self.room_status[room]["CO2"] > 500:
-                    self.room_status[room]["CO2"] -= random.uniform(5, 15)
+                    self.room_status[room]["CO2"] -= self.random.uniform(5, 15)
             
             # Değerleri güncelle ve sınırlar içinde tut
             self.room_status[room]["Sıcaklık"] = max(15, min(35, self.room_status[room]["Sıcaklık"] + temp_change))
-            self.room_status[room]["Nem"] = max(20, min(80, self.room_status[room]["Nem"] + random.uniform(-2, 2)))
+            self.room_status[room]["Nem"] = max(20, min(80, self.room_status[room]["Nem"] + self.random.uniform(-2, 2)))
             self.room_status[room]["Işık"] = self._random_light()  # Işık seviyesi saat bazlı güncellenir
             self.room_status[room]["CO2"] = max(400, min(2000, self.room_status[room]["CO2"]))
     
+    def _update_thermal_temperatures(self, hour, outdoor):
+        """
+        Tüm odaların sıcaklığını ısıl ağla tek adımda günceller
+        
+        Args:
+            hour (int): Günün saati
+            outdoor (float): Dış sıcaklık (None ise ısıl ağın varsayılan dış sıcaklığı)
+        """
+        status = [self.room_status[room] for room in self.rooms]
+        temperature = np.array([s["Sıcaklık"] for s in status])
+        ac_on = np.array([self.devices[room].get("Klima", False) for room in self.rooms], dtype=bool)
+        occupied = np.array([s["Doluluk"] for s in status], dtype=bool)
+        spread = self.thermal.params["noise"]
+        noise = np.array([self.random.uniform(-spread, spread) for _ in self.rooms])
+        
+        temperature = self.thermal.step(temperature, ac_on, occupied, hour, outdoor, noise)
+        for s, value in zip(status, temperature.tolist()):
+            s["Sıcaklık"] = value
+    
     def update_simulation(self, time_step=None):
         """
         Simülasyon durumunu günceller, sensör verilerini ve kullanıcı hareketlerini simüle eder
@@ -155,15 +271,59 @@ class SensorSimulator:
         Returns:
             dict: Güncellenen simülasyon durumu
         """
-        self.current_time += timedelta(minutes=time_step or self.time_step)
+        self.advance(time_step)
+        
+        return self.get_current_state()
+    
+    def advance(self, time_step=None):
+        """
+        Simülasyonu durum sözlüğü oluşturmadan bir adım ilerletir
+        
+        Args:
+            time_step (int): İlerletilecek dakika sayısı (None ise varsayılan kullanılır)
+        """
+        self.current_minute += time_step or self.time_step
         
         # Kullanıcı hareketlerini simüle et
         self._simulate_user_movement()
         
         # Çevresel verileri güncelle
         self._update_environmental_data()
+    
+    def get_state(self):
+        """
+        Simülatörün değişken durumunu (RNG durumu dahil) kontrol noktasına yazılabilecek
+        bir kopya olarak döndürür
         
-        return self.get_current_state()
+        Returns:
+            dict: set_state ile geri yüklenebilecek durum
+        """
+        state = {
+            "current_minute": self.current_minute,
+            "random": self.random.getstate(),
+        }
+        if self.vectorized:
+            state["engine"] = self.engine.get_state()
+        else:
+            state["room_status"] = {room: dict(status) for room, status in self.room_status.items()}
+            state["devices"] = {room: dict(devices) for room, devices in self.devices.items()}
+        return state
+    
+    def set_state(self, state):
+        """
+        get_state ile alınmış durumu geri yükler (tohumsuz simülatörde global random durumu da değişir)
+        
+        Args:
+            state (dict): get_state çıktısı
+        """
+        self.current_minute = state["current_minute"]
+        self.random.setstate(state["random"])
+        if self.vectorized:
+            self.engine.set_state(state["engine"])
+            return
+        for room in self.rooms:
+            self.room_status[room].update(state["room_status"][room])
+            self.devices[room].update(state["devices"][room])
     
     def get_current_state(self):
         """
@@ -175,6 +335,19 @@ class SensorSimulator:
         state = {
             "timestamp": self.current_time
         }
+        if self.weather is not None:
+            state["Dış_Hava_Sıcaklığı"] = self.outdoor_temperature()
+        
+        if self.vectorized:
+            # Dizileri tek bir nesne dizisine yerleştirip tek seferde sözlüğe çevir
+            sensor_pos, motion_pos, occupancy_pos, device_pos, device_cells = self._state_positions
+            buffer = self._state_buffer
+            buffer[sensor_pos] = self.engine.values.ravel().tolist()
+            buffer[motion_pos] = self.engine.motion.tolist()
+            buffer[occupancy_pos] = self.engine.occupancy.tolist()
+            buffer[device_pos] = self.engine.device_state.ravel()[device_cells].tolist()
+            state.update(zip(self._state_keys, buffer.tolist()))
+            return state
         
         # Her oda için durum bilgilerini ekle
         for room in self.rooms:
@@ -188,35 +361,42 @@ class SensorSimulator:
         
         return state
     
-    def generate_sensor_data(self, days=1, save_to_csv=True, csv_path=None):
+    def generate_sensor_data(self, days=1, save_to_csv=True, csv_path=None, file_format=None, run_length=False,
+                             multi_rate=False):
         """
-        Belirli bir süre için sensör verilerini simüle ederek bir DataFrame ve opsiyonel olarak CSV dosyası üretir
+        Belirli bir süre için sensör verilerini simüle ederek bir DataFrame ve opsiyonel olarak CSV (veya ikili) dosya üretir
         
         Args:
             days (int): Simüle edilecek gün sayısı
-            save_to_csv (bool): Verileri CSV'ye kaydetme durumu
-            csv_path (str): Kaydedilecek CSV dosyasının yolu
+            save_to_csv (bool): Verileri dosyaya kaydetme durumu
+            csv_path (str): Kaydedilecek dosyanın yolu
+            file_format (str): "csv", "parquet", "feather" veya "npz" (None ise csv_path uzantısından, o da yoksa csv)
+            run_length (bool): Hareket, doluluk ve cihaz sütunlarını değişim noktalarıyla sakla
+            multi_rate (bool): Her kanalı sampling_rates'teki hızında sakla (MultiRateFrame)
             
         Returns:
-            pandas.DataFrame: Simüle edilen sensör verileri
+            pandas.DataFrame | RunLengthFrame | MultiRateFrame: Simüle edilen sensör verileri
         """
         # Başlangıç zamanını ayarla
-        self.current_time = self.start_time
+        self.current_minute = 0
         
         # Simülasyon için adım sayısını hesapla
         steps = int((days * 24 * 60) / self.time_step)
         
-        all_states = []
-        
-        # Her adım için simülasyonu güncelle
+        # Sütun dizilerini önceden ayır ve her adımı doğrudan kaydet
+        recorder = ColumnarRecorder(self, steps)
         for _ in range(steps):
-            state = self.update_simulation()
-            all_states.append(state)
+            self.advance()
+            recorder.record(self)
         
-        # DataFrame oluştur
-        df = pd.DataFrame(all_states)
+        # DataFrame oluştur (zaman damgaları tek seferde üretilir)
+        df = recorder.to_frame()
+        if multi_rate:
+            df = MultiRateFrame.from_frame(df, self.sampling_rates, self.time_step, self.topology)
+        elif run_length:
+            df = RunLengthFrame.from_frame(df)
         
-        # CSV'ye kaydet
+        # Dosyaya kaydet (ikili biçimler sütun tiplerini korur)
         if save_to_csv:
             if csv_path is None:
                 # Varsayılan dosya yolu
@@ -228,7 +408,7 @@ class SensorSimulator:
                 
                 csv_path = os.path.join(directory, f"sensor_data_{self.start_time.strftime('%Y%m%d_%H%M')}.csv")
             
-            df.to_csv(csv_path, index=False)
+            csv_path = write_frame(df, csv_path, file_format)
             print(f"Sensör verileri {csv_path} konumuna kaydedildi.")
         
         return df
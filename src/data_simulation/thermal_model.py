@@ -0,0 +1,172 @@
+import time
+
+import numpy as np
+
+from src.config import config
+
+
+class ThermalNetwork:
+    """
+    Oda sıcaklıkları için RC ısıl ağ modeli.
+    Her oda bir ısıl kapasitedir; komşu odalar duvar iletkenliğiyle birbirine, her oda
+    dış iletkenlikle dış havaya bağlıdır. Klimalar, sakinler ve gündüz güneş kazancı
+    ısı kaynağıdır. Adım boyunca girdiler sabit kabul edilerek sistem tam olarak
+    ayrıklaştırılır (matris üsteli), böylece model her time_step için kararlıdır.
+
+    Bir adım, [sıcaklıklar, ısı kaynakları, dış sıcaklık] vektörünün önceden hesaplanan
+    (oda, 2 * oda + 1) geçiş matrisiyle tek bir çarpımıdır; oda başına Python döngüsü yoktur.
+    """
+
+    def __init__(self, rooms, time_step=5, adjacency=None, params=None):
+        """
+        ThermalNetwork sınıfını başlatır
+
+        Args:
+            rooms (list): Oda adları
+            time_step (int): Adımlar arasındaki dakika farkı
+            adjacency (list | dict | numpy.ndarray): Komşu oda çiftleri listesi, (oda, oda) -> W/K
+                sözlüğü veya (oda, oda) iletkenlik matrisi (None ise odalar liste sırasıyla komşudur)
+            params (dict): config["thermal_model"] değerlerinin üzerine yazılacak parametreler
+        """
+        self.rooms = list(rooms)
+        self.time_step = time_step
+        self.params = {**config["thermal_model"], **(params or {})}
+        n = len(self.rooms)
+
+        self.conductance = self._conductance_matrix(adjacency)
+        capacitance = np.full(n, float(self.params["capacitance"]))
+        outdoor = np.full(n, float(self.params["outdoor_conductance"]))
+        if np.any(outdoor <= 0):
+            raise ValueError("outdoor_conductance pozitif olmalıdır")
+
+        # dT/dt = C^-1 (-K T + g_dış * T_dış + Q),  K = L + diag(g_dış)
+        laplacian = np.diag(self.conductance.sum(axis=1)) - self.conductance
+        stiffness = laplacian + np.diag(outdoor)
+
+        # C^-1 K, C^-1/2 K C^-1/2 simetrik matrisine benzerdir; üstel özayrışımla hesaplanır
+        scale = 1.0 / np.sqrt(capacitance)
+        eigenvalues, vectors = np.linalg.eigh(scale[:, None] * stiffness * scale[None, :])
+        seconds = time_step * 60.0
+        decay = (scale[:, None] * vectors) @ np.diag(np.exp(-seconds * eigenvalues)) @ (vectors.T / scale[None, :])
+
+        # Sabit girdilerle tam çözüm: T' = A T + (I - A) K^-1 (g_dış * T_dış + Q)
+        forcing = (np.eye(n) - decay) @ np.linalg.inv(stiffness)
+        self.transition = np.hstack([decay, forcing, (forcing @ outdoor)[:, None]])
+        self._inputs = np.empty(2 * n + 1)
+
+    def _conductance_matrix(self, adjacency):
+        """Komşuluk tanımından simetrik (oda, oda) duvar iletkenliği matrisini oluşturur"""
+        n = len(self.rooms)
+        wall = float(self.params["wall_conductance"])
+        if adjacency is None:
+            adjacency = list(zip(self.rooms[:-1], self.rooms[1:]))
+
+        if isinstance(adjacency, np.ndarray):
+            matrix = np.array(adjacency, dtype=np.float64)
+            if matrix.shape != (n, n):
+                raise ValueError(f"İletkenlik matrisi ({n}, {n}) boyutunda olmalıdır")
+        else:
+            pairs = adjacency.items() if isinstance(adjacency, dict) else ((pair, wall) for pair in adjacency)
+            index = {room: i for i, room in enumerate(self.rooms)}
+            matrix = np.zeros((n, n))
+            for (first, second), value in pairs:
+                i, j = index[first], index[second]
+                matrix[i, j] = matrix[j, i] = value
+
+        matrix = (matrix + matrix.T) / 2
+        np.fill_diagonal(matrix, 0.0)
+        return matrix
+
+    def heat_sources(self, temperature, ac_on, occupied, hour):
+        """
+        Odalardaki ısı kaynaklarını (W) döndürür
+
+        Args:
+            temperature (numpy.ndarray): (oda,) mevcut sıcaklıklar
+            ac_on (numpy.ndarray): (oda,) klima açık mı
+            occupied (numpy.ndarray): (oda,) oda dolu mu
+            hour (int): Günün saati
+
+        Returns:
+            numpy.ndarray: (oda,) ısı gücü
+        """
+        params = self.params
+        # Klima hedef sıcaklığın üstünde soğutur, altında ısıtır
+        ac_heat = np.where(temperature > params["setpoint"], -params["ac_power"], params["ac_power"])
+        heat = np.where(ac_on, ac_heat, 0.0)
+        heat += np.where(occupied, params["occupant_heat"], 0.0)
+        if 10 <= hour <= 16:
+            heat += params["solar_gain"]
+        return heat
+
+    def step(self, temperature, ac_on, occupied, hour, outdoor=None, noise=None):
+        """
+        Tüm odaların sıcaklığını bir adım ilerletir
+
+        Args:
+            temperature (numpy.ndarray): (oda,) mevcut sıcaklıklar
+            ac_on (numpy.ndarray): (oda,) klima açık mı
+            occupied (numpy.ndarray): (oda,) oda dolu mu
+            hour (int): Günün saati
+            outdoor (float): Dış sıcaklık (None ise config'deki sabit dış sıcaklık)
+            noise (numpy.ndarray): Sonuca eklenecek (oda,) dalgalanma
+
+        Returns:
+            numpy.ndarray: (oda,) yeni sıcaklıklar (15-35 °C arasında sınırlanır)
+        """
+        n = len(self.rooms)
+        temperature = np.asarray(temperature, dtype=np.float64)
+        inputs = self._inputs
+        inputs[:n] = temperature
+        inputs[n:2 * n] = self.heat_sources(temperature, ac_on, occupied, hour)
+        inputs[-1] = self.params["outdoor_temp"] if outdoor is None else outdoor
+
+        result = self.transition @ inputs
+        if noise is not None:
+            result += noise
+        return np.clip(result, 15, 35)
+
+
+def benchmark_thermal_model(room_counts=(5, 100, 1000), steps=2000, time_step=5):
+    """
+    Isıl ağ adımının oda sayısına göre süresini ölçer
+
+    Args:
+        room_counts (tuple): Denenecek oda sayıları
+        steps (int): Her ölçüm için adım sayısı
+        time_step (int): Adımlar arasındaki dakika farkı
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    from src.data_simulation.vectorized_engine import _benchmark_rooms
+
+    results = []
+    rng = np.random.default_rng(0)
+    for count in room_counts:
+        began = time.perf_counter()
+        network = ThermalNetwork(_benchmark_rooms(count), time_step=time_step)
+        build_seconds = time.perf_counter() - began
+
+        temperature = rng.uniform(18, 30, count)
+        ac_on = rng.random(count) < 0.3
+        occupied = rng.random(count) < 0.5
+        began = time.perf_counter()
+        for i in range(steps):
+            temperature = network.step(temperature, ac_on, occupied, (i * time_step // 60) % 24, outdoor=10.0)
+        elapsed = time.perf_counter() - began
+
+        result = {
+            "rooms": count,
+            "build_ms": build_seconds * 1000,
+            "us_per_step": elapsed / steps * 1e6,
+            "mean_temp": float(temperature.mean()),
+        }
+        results.append(result)
+        print(f"{count:5d} oda | kurulum: {result['build_ms']:8.1f} ms | adım: {result['us_per_step']:8.1f} µs | "
+              f"ort. sıcaklık: {result['mean_temp']:.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_thermal_model()
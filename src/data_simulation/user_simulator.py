@@ -1,28 +1,39 @@
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import numpy as np
+
+from src.data_simulation.clock import MinuteClock
+
+# Derlenmiş rutin tablosundaki rutin tiplerinin sırası (indeks = hafta sonu mu)
+ROUTINE_TYPES = ("Weekday", "Weekend")
 
 class UserSimulator:
     """
     Ev sakinlerinin davranışlarını simüle eden sınıf.
     Günlük rutinler, ev içi hareketler ve cihaz kullanımlarını simüle eder.
+    Sıcak döngüde (advance_to) zaman, başlangıçtan itibaren geçen tamsayı dakika olarak işlenir.
     """
     
-    def __init__(self, num_residents=2, rooms=None):
+    def __init__(self, num_residents=2, rooms=None, seed=None, start_time=None):
         """
         UserSimulator sınıfını başlatır
         
         Args:
             num_residents (int): Ev sakinlerinin sayısı
             rooms (list): Simüle edilecek odaların listesi
+            seed (int): Rastgele sayı üreteci tohumu (None ise global random modülü kullanılır)
+            start_time (datetime): Simülasyonun başlangıç zamanı (None ise şu an)
         """
         self.num_residents = num_residents
+        self.random = random.Random(seed) if seed is not None else random
         self.rooms = rooms or ["Salon", "Yatak Odası", "Çocuk Odası", "Mutfak", "Banyo"]
         
         # Ev sakinlerinin şu andaki konumları
         self.resident_locations = {}
         for i in range(num_residents):
             # Başlangıçta herkesi rastgele bir odaya yerleştir
-            self.resident_locations[f"Kişi_{i+1}"] = random.choice(self.rooms)
+            self.resident_locations[f"Kişi_{i+1}"] = self.random.choice(self.rooms)
         
         # Günlük rutinler (saat:dakika formatında)
         self.daily_routines = {
@@ -77,8 +88,12 @@ class UserSimulator:
             }
         }
         
-        # Rastgele hareketler için son hareket zamanları
-        self.last_random_move = {resident: datetime.now() for resident in self.resident_locations}
+        # Rastgele hareketler için son hareket zamanları (başlangıçtan itibaren dakika)
+        self.clock = MinuteClock(start_time or datetime.now())
+        self.last_random_move = {resident: 0 for resident in self.resident_locations}
+        
+        # Rutinleri dakika bazlı arama tablolarına derle
+        self.compile_routines()
     
     def _is_weekend(self, date):
         """Verilen tarihin hafta sonu olup olmadığını kontrol eder"""
@@ -88,6 +103,35 @@ class UserSimulator:
         """Tarih için rutin tipini döndürür (Weekday/Weekend)"""
         return "Weekend" if self._is_weekend(date) else "Weekday"
     
+    def compile_routines(self):
+        """
+        daily_routines sözlüğünü her sakin için gün içi dakika (0-1439) bazlı konum
+        tablolarına derler. daily_routines değiştirilirse yeniden çağrılmalıdır.
+        """
+        residents = list(self.resident_locations)
+        
+        # Konum kodları: 0 = None (ev dışında / rutin yok), diğerleri ilk görüldükleri sırayla
+        self.schedule_locations = [None]
+        codes = {None: 0}
+        
+        self._routine_table = np.zeros((len(ROUTINE_TYPES), len(residents), 1440), dtype=np.int16)
+        for t, routine_type in enumerate(ROUTINE_TYPES):
+            for k, resident in enumerate(residents):
+                routine = self.daily_routines.get(routine_type, {}).get(resident, {})
+                # Saatler sıralı işlendiği için her kayıt bir sonrakine kadar geçerli olur
+                for time_str in sorted(routine):
+                    location = routine[time_str]
+                    if location not in codes:
+                        codes[location] = len(self.schedule_locations)
+                        self.schedule_locations.append(location)
+                    hour, minute = map(int, time_str.split(":"))
+                    self._routine_table[t, k, hour * 60 + minute:] = codes[location]
+        
+        # Adım bazlı erişim için (rutin tipi, gün içi dakika) -> sakinlerin konum listesi
+        self._location_names = np.array(self.schedule_locations, dtype=object)
+        self._routine_rows = [self._location_names[self._routine_table[t].T].tolist()
+                              for t in range(len(ROUTINE_TYPES))]
+    
     def _get_scheduled_location(self, resident, current_time):
         """
         Belirli bir zaman için kullanıcının planlanan konumunu döndürür
@@ -99,26 +143,30 @@ class UserSimulator:
         Returns:
             str: Planlanan konum (oda adı) veya None (ev dışında)
         """
-        routine_type = self._get_routine_type(current_time)
-        
-        # Kullanıcı için rutin yoksa None döndür
-        if resident not in self.daily_routines[routine_type]:
+        if resident not in self.resident_locations:
             return None
-            
-        routine = self.daily_routines[routine_type][resident]
-        current_time_str = current_time.strftime("%H:%M")
         
-        # Planlanan saatleri kontrol et ve şu anki zamandan önceki en son planlanan konumu bul
-        scheduled_times = sorted(routine.keys())
-        scheduled_location = None
+        t = ROUTINE_TYPES.index(self._get_routine_type(current_time))
+        k = list(self.resident_locations).index(resident)
+        return self.schedule_locations[self._routine_table[t, k, current_time.hour * 60 + current_time.minute]]
+    
+    def scheduled_timeline(self, minutes, as_codes=False):
+        """
+        Verilen dakikalar için tüm sakinlerin planlanan konumlarını tek vektörize işlemle döndürür
         
-        for time_str in scheduled_times:
-            if time_str <= current_time_str:
-                scheduled_location = routine[time_str]
-            else:
-                break
-                
-        return scheduled_location
+        Args:
+            minutes (numpy.ndarray): Başlangıçtan itibaren geçen dakikalar
+            as_codes (bool): True ise konum adları yerine schedule_locations indeksleri döndürülür (0 = None)
+            
+        Returns:
+            numpy.ndarray: (len(minutes), sakin sayısı) boyutunda konum dizisi (object, None = ev dışında)
+        """
+        minutes = np.asarray(minutes, dtype=np.int64)
+        weekend = self.clock.is_weekend(minutes).astype(np.intp)
+        minute_of_day = self.clock.minute_of_day(minutes)
+        residents = np.arange(self._routine_table.shape[1])
+        codes = self._routine_table[weekend[:, None], residents[None, :], minute_of_day[:, None]]
+        return codes if as_codes else self._location_names[codes]
     
     def _should_make_random_move(self, resident, current_time):
         """
@@ -128,16 +176,29 @@ class UserSimulator:
             resident (str): Kullanıcı adı
             current_time (datetime): Mevcut zaman
             
+        Returns:
+            bool: Rastgele hareket yapılması gerekiyorsa True
+        """
+        return self._random_move_due(resident, self.clock.to_minute(current_time))
+    
+    def _random_move_due(self, resident, minute):
+        """
+        Dakika cinsinden zaman için rastgele hareket kararını verir
+        
+        Args:
+            resident (str): Kullanıcı adı
+            minute (int): Başlangıçtan itibaren geçen dakika
+            
         Returns:
             bool: Rastgele hareket yapılması gerekiyorsa True
         """
         # Son rastgele hareketten bu yana geçen süre (dakika)
-        time_since_last_move = (current_time - self.last_random_move[resident]).total_seconds() / 60
+        time_since_last_move = minute - self.last_random_move[resident]
         
         # Ortalama olarak her 30 dakikada bir rastgele hareket etme olasılığı
         probability = min(1.0, time_since_last_move / 30)
         
-        return random.random() < probability
+        return self.random.random() < probability
     
     def update_locations(self, current_time):
         """
@@ -149,26 +210,79 @@ class UserSimulator:
         Returns:
             dict: Kullanıcı konumları (kullanıcı adı -> oda adı)
         """
-        for resident in self.resident_locations:
-            # Planlanan konumu al
-            scheduled_location = self._get_scheduled_location(resident, current_time)
+        t = ROUTINE_TYPES.index(self._get_routine_type(current_time))
+        scheduled = self._routine_rows[t][current_time.hour * 60 + current_time.minute]
+        return self._update(scheduled, self.clock.to_minute(current_time))
+    
+    def advance_to(self, minute, scheduled=None):
+        """
+        Başlangıçtan itibaren geçen dakikaya göre kullanıcı konumlarını günceller
+        
+        Args:
+            minute (int): Başlangıçtan itibaren geçen dakika
+            scheduled (list): scheduled_timeline ile önceden hesaplanmış planlanan konumlar
+                (None ise derlenmiş rutin tablosundan okunur)
+            
+        Returns:
+            dict: Kullanıcı konumları (kullanıcı adı -> oda adı)
+        """
+        if scheduled is None:
+            scheduled = self._routine_rows[self.clock.is_weekend(minute)][self.clock.minute_of_day(minute)]
+        return self._update(scheduled, minute)
+    
+    def _update(self, scheduled, minute):
+        """
+        Kullanıcı konumlarını planlanan konumlara ve dakikaya göre günceller
+        
+        Args:
+            scheduled (list): Sakin sırasına göre planlanan konumlar
+            minute (int): Başlangıçtan itibaren geçen dakika
             
+        Returns:
+            dict: Kullanıcı konumları (kullanıcı adı -> oda adı)
+        """
+        for resident, scheduled_location in zip(self.resident_locations, scheduled):
             # Kullanıcı evde değilse (None), konumunu güncelle
             if scheduled_location is None:
                 self.resident_locations[resident] = None
                 continue
                 
             # Kullanıcı planlanan bir aktivitede mi yoksa rastgele hareket mi etmeli?
-            if self._should_make_random_move(resident, current_time):
+            if self._random_move_due(resident, minute):
                 # Rastgele hareket - evdeki bir odaya git
-                self.resident_locations[resident] = random.choice(self.rooms)
-                self.last_random_move[resident] = current_time
+                self.resident_locations[resident] = self.random.choice(self.rooms)
+                self.last_random_move[resident] = minute
             else:
                 # Planlanan lokasyona git
                 self.resident_locations[resident] = scheduled_location
         
         return self.resident_locations
     
+    def get_state(self):
+        """
+        Sakin konumlarını, rastgele hareket zamanlarını ve RNG durumunu kopya olarak döndürür
+        (derlenmiş rutin tabloları sabit olduğu için dahil edilmez)
+        
+        Returns:
+            dict: set_state ile geri yüklenebilecek durum
+        """
+        return {
+            "random": self.random.getstate(),
+            "resident_locations": dict(self.resident_locations),
+            "last_random_move": dict(self.last_random_move),
+        }
+    
+    def set_state(self, state):
+        """
+        get_state ile alınmış durumu geri yükler
+        
+        Args:
+            state (dict): get_state çıktısı
+        """
+        self.random.setstate(state["random"])
+        self.resident_locations.update(state["resident_locations"])
+        self.last_random_move.update(state["last_random_move"])
+    
     def get_room_occupancy(self):
         """
         Her odanın doluluk durumunu hesaplar
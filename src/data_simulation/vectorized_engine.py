@@ -0,0 +1,324 @@
+import math
+import time
+from collections.abc import MutableMapping
+from datetime import datetime
+
+import numpy as np
+
+from src.config import config
+
+# Dizi sütunlarının sırası, SensorSimulator.room_status anahtar sırasıyla aynıdır
+SENSOR_CHANNELS = ["Sıcaklık", "Nem", "Işık", "CO2"]
+STATUS_KEYS = SENSOR_CHANNELS + ["Hareket", "Doluluk", "Son_Hareket"]
+
+
+def hour_motion_offset(hour):
+    """Saate göre hareket olasılığına eklenecek değeri döndürür"""
+    if 7 <= hour <= 9:  # Sabah
+        return 0.3
+    elif 17 <= hour <= 22:  # Akşam
+        return 0.4
+    elif 0 <= hour <= 6:  # Gece
+        return -0.1
+    return 0.0
+
+
+def hour_temp_drift(hour):
+    """Saate göre sıcaklık değişimine eklenecek değeri döndürür"""
+    if 10 <= hour <= 16:  # Gün ortası
+        return 0.2
+    elif 0 <= hour <= 5:  # Gece
+        return -0.2
+    return 0.0
+
+
+def hour_light_range(hour):
+    """Saate göre ışık seviyesinin (lux) alt ve üst sınırını döndürür"""
+    if 8 <= hour <= 18:  # Gündüz
+        return 200.0, 1000.0
+    elif 6 <= hour < 8 or 18 < hour <= 20:  # Şafak/alacakaranlık
+        return 50.0, 200.0
+    return 0.0, 50.0  # Gece
+
+
+def outdoor_coupling(time_step, time_constant=360):
+    """
+    Dış sıcaklığın bir adımda oda sıcaklığına yansıyan oranını döndürür
+    (birinci dereceden ısı kaybı, time_constant dakikalık zaman sabiti)
+    """
+    return 1.0 - math.exp(-time_step / time_constant)
+
+
+class VectorizedRoomEngine:
+    """
+    Tüm odaların sensör ve cihaz durumlarını NumPy dizilerinde tutan simülasyon motoru.
+    SensorSimulator'ün oda bazlı döngüleriyle istatistiksel olarak aynı kuralları
+    her adımda tüm odalar için tek seferde uygular.
+    """
+
+    def __init__(self, rooms, room_devices, start_time, current_time=None, seed=None, thermal=None):
+        """
+        VectorizedRoomEngine sınıfını başlatır
+
+        Args:
+            rooms (list): Oda adları
+            room_devices (dict): Oda adı -> odadaki cihaz türleri listesi
+            start_time (datetime): Simülasyonun başlangıç zamanı (dakika 0)
+            current_time (datetime): Başlangıç ışık seviyesi için kullanılacak zaman
+            seed (int): numpy.random.Generator tohumu
+            thermal (ThermalNetwork): Sıcaklıkları hesaplayacak ısıl ağ (None ise bağımsız rastgele yürüyüş)
+        """
+        self.rooms = list(rooms)
+        self.rng = np.random.default_rng(seed)
+        self.thermal = thermal
+        n = len(self.rooms)
+
+        # Cihaz maskesi: odalar x cihaz türleri
+        self.device_types = list(config["devices_per_room"])
+        self.device_mask = np.zeros((n, len(self.device_types)), dtype=bool)
+        for i, room in enumerate(self.rooms):
+            for device in room_devices.get(room, []):
+                self.device_mask[i, self.device_types.index(device)] = True
+        self.device_state = np.zeros_like(self.device_mask)
+        self.ac_index = self.device_types.index("Klima") if "Klima" in self.device_types else None
+
+        # Sensör değerleri: odalar x [Sıcaklık, Nem, Işık, CO2]
+        hour = (current_time or start_time).hour
+        low, high = hour_light_range(hour)
+        self.values = np.empty((n, len(SENSOR_CHANNELS)), dtype=np.float64)
+        self.values[:, 0] = np.round(self.rng.uniform(18.0, 30.0, n), 1)
+        self.values[:, 1] = np.round(self.rng.uniform(30.0, 70.0, n), 1)
+        self.values[:, 2] = np.round(self.rng.uniform(low, high, n), 1)
+        self.values[:, 3] = np.round(self.rng.uniform(400, 1200, n), 1)
+
+        self.motion = np.zeros(n, dtype=bool)
+        self.occupancy = np.zeros(n, dtype=bool)
+        # Son hareket zamanı, başlangıçtan itibaren dakika cinsinden
+        self.last_motion = -self.rng.integers(5, 121, n)
+
+    def simulate_user_movement(self, hour, now):
+        """
+        Tüm odalar için hareket ve doluluk durumlarını tek adımda günceller
+
+        Args:
+            hour (int): Günün saati
+            now (int): Başlangıçtan itibaren geçen dakika
+        """
+        n = len(self.rooms)
+        prob = np.full(n, 0.2 + hour_motion_offset(hour))
+        prob += np.where(now - self.last_motion > 30, 0.2, 0.0)
+
+        draws = self.rng.random((3, n))
+        moved = draws[0] < prob
+        self.motion = moved
+        self.last_motion[moved] = now
+
+        # Hareket varsa oda %80 olasılıkla dolu, yoksa dolu oda %30 olasılıkla boşalır
+        self.occupancy |= moved & (draws[1] < 0.8)
+        self.occupancy &= ~(~moved & (draws[2] < 0.3))
+
+    def update_environmental_data(self, hour, outdoor=None, coupling=0.0):
+        """
+        Tüm odalar için sıcaklık, nem, ışık ve CO2 değerlerini tek adımda günceller
+
+        Args:
+            hour (int): Günün saati
+            outdoor (float): Dış sıcaklık (None ise dış hava etkisi uygulanmaz)
+            coupling (float): Dış sıcaklığın adım başına oda sıcaklığına yansıma oranı
+        """
+        n = len(self.rooms)
+        temp = self.values[:, 0]
+        co2 = self.values[:, 3]
+        draws = self.rng.random((5, n))
+
+        occupied = self.occupancy
+        if self.thermal is not None:
+            # Isıl ağ: tüm odalar tek matris-vektör çarpımıyla, dalgalanma ilk çekilişlerden
+            ac_on = self.device_state[:, self.ac_index] if self.ac_index is not None else np.zeros(n, dtype=bool)
+            noise = (2 * draws[0] - 1) * self.thermal.params["noise"]
+            self.values[:, 0] = self.thermal.step(temp, ac_on, occupied, hour, outdoor, noise)
+        else:
+            # Doğal dalgalanma + saat bazlı değişim
+            temp_change = draws[0] - 0.5 + hour_temp_drift(hour)
+
+            # Dış hava varsa oda sıcaklığı dış sıcaklığa doğru yavaşça yaklaşır
+            if outdoor is not None:
+                temp_change += coupling * (outdoor - temp)
+
+            # Klima açıksa hedef sıcaklığa (23°C) doğru soğut/ısıt
+            if self.ac_index is not None:
+                ac_on = self.device_state[:, self.ac_index]
+                pull = 0.5 + 0.5 * draws[1]
+                temp_change += np.where(ac_on, np.where(temp > 23.0, -pull, pull), 0.0)
+
+            # Dolu odada sıcaklık artar
+            temp_change += np.where(occupied, 0.1, 0.0)
+            self.values[:, 0] = np.clip(temp + temp_change, 15, 35)
+
+        # Dolu odada CO2 artar, boş odada CO2 yavaşça düşer
+        co2_change = np.where(occupied, 10 + 20 * draws[2], np.where(co2 > 500, -(5 + 10 * draws[3]), 0.0))
+
+        low, high = hour_light_range(hour)
+        self.values[:, 1] = np.clip(self.values[:, 1] + 4 * draws[4] - 2, 20, 80)
+        self.values[:, 2] = np.round(self.rng.uniform(low, high, n), 1)
+        self.values[:, 3] = np.clip(co2 + co2_change, 400, 2000)
+
+    def get_state(self):
+        """
+        Motorun değişken durumunu (RNG durumu dahil) seri hale getirilebilir kopya olarak döndürür
+
+        Returns:
+            dict: set_state ile geri yüklenebilecek durum
+        """
+        return {
+            "rng": self.rng.bit_generator.state,
+            "values": self.values.copy(),
+            "motion": self.motion.copy(),
+            "occupancy": self.occupancy.copy(),
+            "last_motion": self.last_motion.copy(),
+            "device_state": self.device_state.copy(),
+        }
+
+    def set_state(self, state):
+        """
+        get_state ile alınmış durumu geri yükler. Diziler yerinde güncellenir, böylece
+        room_status_view ve device_view görünümleri geçerli kalır.
+
+        Args:
+            state (dict): get_state çıktısı
+        """
+        self.rng.bit_generator.state = state["rng"]
+        self.values[...] = state["values"]
+        self.motion = np.array(state["motion"], dtype=bool)
+        self.occupancy = np.array(state["occupancy"], dtype=bool)
+        self.last_motion[...] = state["last_motion"]
+        self.device_state[...] = state["device_state"]
+
+    def room_status_view(self, index):
+        """Belirtilen oda için dizilere bağlı bir durum sözlüğü döndürür"""
+        return _RoomStatusView(self, index)
+
+    def device_view(self, index):
+        """Belirtilen oda için dizilere bağlı bir cihaz sözlüğü döndürür"""
+        return _RoomDeviceView(self, index)
+
+
+class _RoomStatusView(MutableMapping):
+    """room_status[oda] erişimini motorun dizilerine yönlendiren sözlük görünümü"""
+
+    def __init__(self, engine, index):
+        self._engine = engine
+        self._index = index
+
+    def __getitem__(self, key):
+        engine, i = self._engine, self._index
+        if key in SENSOR_CHANNELS:
+            return float(engine.values[i, SENSOR_CHANNELS.index(key)])
+        if key == "Hareket":
+            return bool(engine.motion[i])
+        if key == "Doluluk":
+            return bool(engine.occupancy[i])
+        if key == "Son_Hareket":
+            return int(engine.last_motion[i])
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        engine, i = self._engine, self._index
+        if key in SENSOR_CHANNELS:
+            engine.values[i, SENSOR_CHANNELS.index(key)] = value
+        elif key == "Hareket":
+            engine.motion[i] = value
+        elif key == "Doluluk":
+            engine.occupancy[i] = value
+        elif key == "Son_Hareket":
+            engine.last_motion[i] = value
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key):
+        raise TypeError("Vektörize oda durumundan anahtar silinemez")
+
+    def __iter__(self):
+        return iter(STATUS_KEYS)
+
+    def __len__(self):
+        return len(STATUS_KEYS)
+
+
+class _RoomDeviceView(MutableMapping):
+    """devices[oda] erişimini motorun cihaz dizisine yönlendiren sözlük görünümü"""
+
+    def __init__(self, engine, index):
+        self._engine = engine
+        self._index = index
+        self._columns = {
+            device: k for k, device in enumerate(engine.device_types) if engine.device_mask[index, k]
+        }
+
+    def __getitem__(self, device):
+        return bool(self._engine.device_state[self._index, self._columns[device]])
+
+    def __setitem__(self, device, state):
+        self._engine.device_state[self._index, self._columns[device]] = bool(state)
+
+    def __delitem__(self, device):
+        raise TypeError("Vektörize cihaz durumundan cihaz silinemez")
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+
+def _benchmark_rooms(count):
+    """Benchmark için config odalarını numaralandırarak istenen sayıda oda adı üretir"""
+    base_rooms = config["rooms"]
+    rooms = []
+    for i in range(count):
+        base = base_rooms[i % len(base_rooms)]
+        rooms.append(base if i < len(base_rooms) else f"{base} {i // len(base_rooms) + 1}")
+    return rooms
+
+
+def benchmark_engines(room_counts=(5, 50, 500), steps=2000, time_step=1):
+    """
+    Skaler ve vektörize motorların saniyedeki adım sayısını karşılaştırır
+
+    Args:
+        room_counts (tuple): Denenecek oda sayıları
+        steps (int): Her ölçüm için simülasyon adımı sayısı
+        time_step (int): Adımlar arasındaki dakika farkı
+
+    Returns:
+        list: Her oda sayısı ve motor için ölçüm sözlükleri
+    """
+    from src.data_simulation.sensor_simulator import SensorSimulator
+
+    start_time = datetime(2025, 1, 6, 0, 0)
+    results = []
+    for count in room_counts:
+        rooms = _benchmark_rooms(count)
+        for vectorized in (False, True):
+            simulator = SensorSimulator(rooms=rooms, start_time=start_time, time_step=time_step,
+                                        vectorized=vectorized, seed=42)
+            began = time.perf_counter()
+            temps = []
+            for _ in range(steps):
+                state = simulator.update_simulation()
+                temps.append(state[f"{rooms[0]}_Sıcaklık"])
+            elapsed = time.perf_counter() - began
+            result = {
+                "rooms": count,
+                "engine": "vectorized" if vectorized else "scalar",
+                "steps_per_sec": steps / elapsed,
+                "mean_temp_room0": float(np.mean(temps)),
+            }
+            results.append(result)
+            print(f"{count:4d} oda | {result['engine']:10s} | {result['steps_per_sec']:10.1f} adım/sn | "
+                  f"ort. sıcaklık: {result['mean_temp_room0']:.2f}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_engines()
@@ -1,39 +1,210 @@
 # Weather Simulator for Smart Home Automation
 
 import random
+import time
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+# Weather conditions in code order (WeatherTimeline.condition holds indices into this list)
+CONDITIONS = ['Sunny', 'Cloudy', 'Rainy', 'Stormy', 'Snowy']
+
+# Memoized timelines, keyed by (start_time, days, seed, resolution_minutes)
+_TIMELINE_CACHE = OrderedDict()
+_TIMELINE_CACHE_SIZE = 16
+
+
+class WeatherTimeline:
+    """
+    Outdoor weather series sampled at a fixed resolution (hourly by default).
+    Temperature follows a seasonal curve, a persistent day-to-day anomaly and a diurnal
+    cycle peaking in the afternoon; humidity moves against the diurnal cycle and rises
+    on rainy days. All series are generated in one vectorized pass and are read-only,
+    so a single instance can be shared by any number of simulators.
+    """
+
+    def __init__(self, start_time, days, seed=None, resolution_minutes=60):
+        """
+        Generates the weather series.
+
+        Parameters:
+        start_time (datetime): Time of the first sample.
+        days (int): Number of days covered.
+        seed (int): Seed for the random generator (None for a non-reproducible series).
+        resolution_minutes (int): Minutes between two samples.
+        """
+        self.start_time = start_time
+        self.days = days
+        self.seed = seed
+        self.resolution_minutes = resolution_minutes
+
+        rng = np.random.default_rng(seed)
+        samples = days * 24 * 60 // resolution_minutes + 1
+        minutes = np.arange(samples) * resolution_minutes
+        start_day_minute = start_time.hour * 60 + start_time.minute
+        day_index = (start_day_minute + minutes) // 1440
+        hour_of_day = ((start_day_minute + minutes) % 1440) / 60
+
+        # Daily values: seasonal mean + AR(1) anomaly + cloud index
+        day_count = int(day_index[-1]) + 1
+        day_of_year = (start_time.timetuple().tm_yday + np.arange(day_count)) % 365
+        seasonal = 13.0 - 11.0 * np.cos(2 * np.pi * (day_of_year - 15) / 365)
+        shocks = rng.normal(0.0, 1.5, day_count)
+        anomaly = np.empty(day_count)
+        anomaly[0] = shocks[0] * 2.0
+        # One iteration per day (not per sample), so this loop stays negligible
+        for day in range(1, day_count):
+            anomaly[day] = 0.8 * anomaly[day - 1] + shocks[day]
+        cloud = rng.random(day_count)
+
+        condition = np.where(cloud < 0.45, 0, np.where(cloud < 0.75, 1, 2))
+        condition = np.where((condition == 2) & (rng.random(day_count) < 0.15), 3, condition)
+        condition = np.where((condition >= 2) & (seasonal + anomaly < 2.0), 4, condition)
+
+        # Diurnal cycle: cloudy days have a smaller swing
+        amplitude = np.where(condition == 0, 6.0, np.where(condition == 1, 4.0, 2.5))[day_index]
+        diurnal = np.cos(2 * np.pi * (hour_of_day - 15) / 24)
+        temperature = seasonal[day_index] + anomaly[day_index] + amplitude * diurnal
+        temperature += rng.normal(0.0, 0.4, samples)
+
+        humidity = 60.0 - 8.0 * diurnal + np.where(condition >= 2, 20.0, 0.0)[day_index]
+        humidity += rng.normal(0.0, 3.0, samples)
+
+        self.temperature = np.round(temperature, 2)
+        self.humidity = np.round(np.clip(humidity, 15.0, 100.0), 2)
+        self.condition = condition[day_index].astype(np.int8)
+        for array in (self.temperature, self.humidity, self.condition):
+            array.setflags(write=False)
+
+    @property
+    def key(self):
+        """Memoization key of the timeline."""
+        return (self.start_time, self.days, self.seed, self.resolution_minutes)
+
+    def index(self, minute):
+        """
+        Returns the sample index for a number of minutes after start_time. Times outside
+        the covered range are pinned to the nearest end.
+
+        Parameters:
+        minute (int | numpy.ndarray): Minutes after start_time.
+
+        Returns:
+        int | numpy.ndarray: Sample index.
+        """
+        return np.clip(np.asarray(minute) // self.resolution_minutes, 0, len(self.temperature) - 1)
+
+    def temperature_at(self, minute):
+        """
+        Returns the outdoor temperature for a number of minutes after start_time in O(1).
+
+        Parameters:
+        minute (int): Minutes after start_time.
+
+        Returns:
+        float: Outdoor temperature in degrees Celsius.
+        """
+        index = minute // self.resolution_minutes
+        if index < 0:
+            index = 0
+        elif index >= len(self.temperature):
+            index = len(self.temperature) - 1
+        return float(self.temperature[index])
+
+    def to_frame(self):
+        """
+        Returns the timeline as a DataFrame.
+
+        Returns:
+        pandas.DataFrame: timestamp, temperature, humidity and condition columns.
+        """
+        timestamps = np.datetime64(self.start_time, 'ns') + \
+            (np.arange(len(self.temperature)) * self.resolution_minutes).astype('timedelta64[m]')
+        return pd.DataFrame({
+            'timestamp': timestamps,
+            'temperature': self.temperature,
+            'humidity': self.humidity,
+            'condition': pd.Categorical.from_codes(self.condition, CONDITIONS)
+        })
+
+
+def weather_timeline(start_time, days, seed=None, resolution_minutes=60):
+    """
+    Returns the weather timeline for a date range, generating it only on the first call
+    for each (start_time, days, seed, resolution_minutes). Unseeded timelines are not cached.
+
+    Parameters:
+    start_time (datetime): Time of the first sample.
+    days (int): Number of days covered.
+    seed (int): Seed for the random generator.
+    resolution_minutes (int): Minutes between two samples.
+
+    Returns:
+    WeatherTimeline: The (possibly shared) timeline.
+    """
+    key = (start_time, days, seed, resolution_minutes)
+    if seed is not None and key in _TIMELINE_CACHE:
+        _TIMELINE_CACHE.move_to_end(key)
+        return _TIMELINE_CACHE[key]
+
+    timeline = WeatherTimeline(start_time, days, seed=seed, resolution_minutes=resolution_minutes)
+    if seed is not None:
+        share_weather_timeline(timeline)
+    return timeline
+
+
+def share_weather_timeline(timeline):
+    """
+    Registers an already generated timeline in the memoization cache, e.g. in a worker
+    process that received it from the parent, so that weather_timeline returns it
+    without recomputation.
+
+    Parameters:
+    timeline (WeatherTimeline): Timeline to register.
+    """
+    _TIMELINE_CACHE[timeline.key] = timeline
+    _TIMELINE_CACHE.move_to_end(timeline.key)
+    while len(_TIMELINE_CACHE) > _TIMELINE_CACHE_SIZE:
+        _TIMELINE_CACHE.popitem(last=False)
+
+
 class WeatherSimulator:
-    def __init__(self, start_date, end_date):
+    def __init__(self, start_date, end_date, seed=None):
         """
         Initializes the WeatherSimulator with a date range.
 
         Parameters:
         start_date (str): The start date for the simulation in 'YYYY-MM-DD' format.
         end_date (str): The end date for the simulation in 'YYYY-MM-DD' format.
+        seed (int): Seed for the underlying weather timeline (None for random weather).
         """
         self.start_date = datetime.strptime(start_date, '%Y-%m-%d')
         self.end_date = datetime.strptime(end_date, '%Y-%m-%d')
+        self.seed = seed
         self.weather_data = []
 
     def generate_weather_data(self):
         """
         Generates simulated weather data for each day in the specified date range.
-        The data includes temperature, humidity, and weather conditions.
-        """
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            temperature = self.simulate_temperature()
-            humidity = self.simulate_humidity()
-            condition = self.simulate_weather_condition()
-            self.weather_data.append({
-                'date': current_date.strftime('%Y-%m-%d'),
-                'temperature': temperature,
-                'humidity': humidity,
-                'condition': condition
-            })
-            current_date += timedelta(days=1)
+        The data includes temperature, humidity, and weather conditions, summarized
+        from an hourly WeatherTimeline in one vectorized pass.
+        """
+        days = (self.end_date - self.start_date).days + 1
+        timeline = weather_timeline(self.start_date, days, seed=self.seed)
+        daily = timeline.to_frame().iloc[:-1].groupby(np.arange(days * 24) // 24)
+        summary = daily.agg({'temperature': 'mean', 'humidity': 'mean'}).round(2)
+        conditions = daily['condition'].first()
+
+        self.weather_data = [
+            {
+                'date': (self.start_date + timedelta(days=day)).strftime('%Y-%m-%d'),
+                'temperature': float(summary['temperature'].iloc[day]),
+                'humidity': float(summary['humidity'].iloc[day]),
+                'condition': str(conditions.iloc[day])
+            }
+            for day in range(days)
+        ]
 
     def simulate_temperature(self):
         """
@@ -60,8 +231,7 @@ class WeatherSimulator:
         Returns:
         str: Simulated weather condition.
         """
-        conditions = ['Sunny', 'Cloudy', 'Rainy', 'Stormy', 'Snowy']
-        return random.choice(conditions)
+        return random.choice(CONDITIONS)
 
     def save_to_csv(self, filename):
         """
@@ -73,8 +243,37 @@ class WeatherSimulator:
         df = pd.DataFrame(self.weather_data)
         df.to_csv(filename, index=False)
 
+def test_weather_timeline(days=365, seed=7):
+    """
+    Generates a yearly hourly timeline, checks that repeated requests are served from
+    the memoization cache and prints monthly mean temperatures.
+
+    Parameters:
+    days (int): Number of days to generate.
+    seed (int): Seed for the timeline.
+
+    Returns:
+    WeatherTimeline: The generated timeline.
+    """
+    start = datetime(2025, 1, 1)
+    began = time.perf_counter()
+    timeline = weather_timeline(start, days, seed=seed)
+    generated = time.perf_counter() - began
+
+    began = time.perf_counter()
+    cached = weather_timeline(start, days, seed=seed)
+    lookup = time.perf_counter() - began
+
+    print(f"{len(timeline.temperature)} samples generated in {generated * 1000:.2f} ms, "
+          f"cached lookup in {lookup * 1e6:.1f} us (same object: {cached is timeline})")
+    frame = timeline.to_frame()
+    monthly = frame.groupby(frame['timestamp'].dt.month)['temperature'].mean()
+    print("Monthly mean temperatures:", ', '.join(f"{value:.1f}" for value in monthly))
+    return timeline
+
 # Example usage:
 if __name__ == "__main__":
+    test_weather_timeline()
     simulator = WeatherSimulator(start_date='2023-01-01', end_date='2023-01-10')
     simulator.generate_weather_data()
-    simulator.save_to_csv('../data/raw/simulated_weather_data.csv')  # Adjust path as necessary
\ No newline at end of file
+    simulator.save_to_csv('../data/raw/simulated_weather_data.csv')  # Adjust path as necessary
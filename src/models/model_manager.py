@@ -1,4 +1,5 @@
 import os
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -10,7 +11,8 @@ import warnings
 import logging
 
 from src.models.model_trainer import DeviceControlModel
-from src.data_processing.preprocessing import process_raw_data
+from src.data_simulation.data_generator import HomeDataGenerator
+from src.data_processing.preprocessing import SmartHomeDataProcessor
 
 class SmartHomeModelManager:
     """
@@ -18,37 +20,163 @@ class SmartHomeModelManager:
     Model eğitimi, değerlendirme ve tahmin işlemlerini koordine eder.
     """
     
-    def __init__(self):
-        """SmartHomeModelManager sınıfını başlatır"""
+    def __init__(self, feature_cache=None):
+        """
+        SmartHomeModelManager sınıfını başlatır
+        
+        Args:
+            feature_cache (FeatureCache): Verilirse değişmemiş veri için özellik çıkarımı ve dönüşüm atlanır
+        """
         self.models = {}  # device_name -> DeviceControlModel
+        self.feature_cache = feature_cache
+        self.dataset = None  # Son eğitimde kullanılan veri seti tutamacı
         self.preprocessor = None
         self.performance_summary = {}
         self.performance_data = []  # Initialize performance_data as an empty list
+        self.stage_timings = {}  # Son bellek içi eğitimin aşama süreleri
         self.logger = logging.getLogger(__name__)
     
-    def train_models_for_all_devices(self, csv_path, model_type='random_forest', optimize=False):
-        """Tüm cihazlar için ML modelleri eğitiyor"""
+    def train_models_for_all_devices(self, csv_path, model_type='random_forest', optimize=False,
+                                     save_processed=False):
+        """
+        Tüm cihazlar için ML modelleri eğitiyor. Ham veri bir kez okunur ve veri seti tutamacı
+        eğitimin sonuna kadar taşınır; işlenmiş veriler yalnızca save_processed ile yazılır.
+        
+        Args:
+            csv_path (str): Veri dosyasının yolu
+            model_type (str): Model türü
+            optimize (bool): Hiperparametre optimizasyonu yapılsın mı
+            save_processed (bool): İşlenmiş eğitim/test bölümleri data/processed dizinine yazılsın mı
+        """
         self.logger.info(f"Tüm cihazlar için {model_type} modelleri eğitiliyor...")
-        # Load the raw DataFrame
-        df_raw = pd.read_csv(csv_path)
-        # Get train/test splits and targets from process_raw_data
-        df_train, df_test, y_train_dict, y_test_dict, preprocessor = process_raw_data(
-            csv_path, save_processed=True
-        )
-        self.preprocessor = preprocessor
-        # Get the indices of the train/test splits
-        train_indices = df_train.index
-        test_indices = df_test.index
-        # Use these indices to select from the raw DataFrame
-        X_train_raw = df_raw.loc[train_indices]
-        X_test_raw = df_raw.loc[test_indices]
+        processor = SmartHomeDataProcessor()
+        dataset = processor.load_dataset(csv_path, feature_cache=self.feature_cache)
+        if save_processed:
+            dataset.save_processed()
+        self.train_on_dataset(dataset, model_type, optimize)
+    
+    def train_on_dataset(self, dataset, model_type='random_forest', optimize=False, save_models=True, timings=None):
+        """
+        Veri seti tutamacındaki ayrımla tüm cihaz modellerini eğitir ve değerlendirir
+        
+        Args:
+            dataset (SmartHomeDataset): Ham veri, hedefler ve eğitim/test indeksleri
+            model_type (str): Model türü
+            optimize (bool): Hiperparametre optimizasyonu yapılsın mı
+            save_models (bool): Modeller diske kaydedilsin mi
+            timings (dict): Verilirse "train" ve "evaluate" süreleri buraya eklenir
+        """
+        self.dataset = dataset
+        self.preprocessor = dataset.processor
+        self._train_device_models(dataset.X_train_raw, dataset.X_test_raw, dataset.y_train, dataset.y_test,
+                                  model_type, optimize, save_models=save_models, timings=timings)
+    
+    def train_models_in_memory(self, days=7, rooms=None, num_residents=2, seed=None, chunk_size=10000,
+                               model_type='random_forest', optimize=False, save_models=False, event_driven=False):
+        """
+        Veri üretimi, özellik çıkarımı ve model eğitimini diske yazmadan yapar; CSV yazma/okuma
+        ve işlenmiş veri dosyaları atlanır. Üretilen parçalara yalnızca satır bazlı zaman
+        özellikleri eklenir; temizleme (dolgu değerleri tüm veriye bağlıdır) ve pencere tabanlı
+        özel özellikler parçalar birleştirildikten sonra build_dataset içinde bir kez uygulanır.
+        Ham veri ayrıca biriktirilmez, birleştirilmiş çerçevenin ham sütunlarından alınır.
+        Her aşamanın süresi ölçülür.
+        
+        Args:
+            days (int): Üretilecek gün sayısı
+            rooms (list): Odalar (None ise config odaları)
+            num_residents (int): Ev sakini sayısı
+            seed (int): Üretim tohumu
+            chunk_size (int): Üretim parçası başına satır sayısı
+            model_type (str): Model türü
+            optimize (bool): Hiperparametre optimizasyonu yapılsın mı
+            save_models (bool): Eğitilen modeller diske kaydedilsin mi
+            event_driven (bool): Olay güdümlü üretim kipini kullan
+            
+        Returns:
+            dict: Aşama adı -> süre (saniye)
+        """
+        timings = {"generate": 0.0, "featurize": 0.0}
+        began = time.perf_counter()
+        generator = HomeDataGenerator(rooms=rooms, num_residents=num_residents, seed=seed,
+                                      event_driven=event_driven)
+        processor = SmartHomeDataProcessor(topology=generator.topology)
+        
+        # Üretim ve zaman özellikleri parça parça
+        raw_columns = None
+        feature_chunks = []
+        stage_began = time.perf_counter()
+        for chunk in generator.iter_dataset(days=days, chunk_size=chunk_size):
+            now = time.perf_counter()
+            timings["generate"] += now - stage_began
+            if raw_columns is None:
+                raw_columns = list(chunk.columns)
+            feature_chunks.append(processor.featurize_chunk(chunk))
+            stage_began = time.perf_counter()
+            timings["featurize"] += stage_began - now
+        
+        stage_began = time.perf_counter()
+        df_features = pd.concat(feature_chunks, ignore_index=True)
+        del feature_chunks
+        # Zaman özellikleri yalnızca sütun ekler; ham veri bu sütunların alt kümesidir
+        df_raw = df_features[raw_columns]
+        dataset = processor.build_dataset(df_features, featurized=True, feature_cache=self.feature_cache,
+                                          raw=df_raw)
+        timings["process"] = time.perf_counter() - stage_began
+        
+        self.train_on_dataset(dataset, model_type, optimize, save_models=save_models, timings=timings)
+        timings["total"] = time.perf_counter() - began
+        
+        self.stage_timings = timings
+        print(f"Bellek içi eğitim ({days} gün, {len(df_raw)} satır, {len(self.models)} model):")
+        for stage, seconds in timings.items():
+            print(f"  {stage:10s}: {seconds * 1000:10.1f} ms")
+        return timings
+    
+    def _train_device_models(self, X_train_raw, X_test_raw, y_train_dict, y_test_dict, model_type, optimize,
+                             save_models=True, timings=None):
+        """
+        Her cihaz için modeli ham eğitim bölümünde eğitir ve test bölümünde değerlendirir
+        
+        Args:
+            X_train_raw (pandas.DataFrame): Ham eğitim satırları
+            X_test_raw (pandas.DataFrame): Ham test satırları
+            y_train_dict (dict): Cihaz -> eğitim hedefi
+            y_test_dict (dict): Cihaz -> test hedefi
+            model_type (str): Model türü
+            optimize (bool): Hiperparametre optimizasyonu yapılsın mı
+            save_models (bool): Modeller diske kaydedilsin mi
+            timings (dict): Verilirse "train" ve "evaluate" süreleri buraya eklenir
+        """
+        timings = timings if timings is not None else {}
+        timings.setdefault("train", 0.0)
+        timings.setdefault("evaluate", 0.0)
+        
+        # Önişlemci tüm cihazlar için bir kez uydurulur; eğitim ve test bölümleri bir kez dönüştürülür
+        # (dönüşüm tüm cihaz sütunlarını attığı için çıktı her cihaz modelinde aynıdır)
+        began = time.perf_counter()
+        topology = getattr(self.preprocessor, 'topology', None)
+        if self.feature_cache is not None:
+            self.preprocessor, X_train, X_test, hit = self.feature_cache.fit_transform_splits(
+                X_train_raw, X_test_raw, topology=topology
+            )
+            if hit:
+                self.logger.info("Özellik matrisleri önbellekten okundu.")
+        else:
+            self.preprocessor = SmartHomeDataProcessor(topology=topology)
+            self.preprocessor.fit(X_train_raw)
+            X_train = self.preprocessor.transform(X_train_raw)
+            X_test = self.preprocessor.transform(X_test_raw)
+        timings["preprocess"] = time.perf_counter() - began
+        
         # Modelleri eğit ve değerlendir
         for device_name, y_train in y_train_dict.items():
             model = DeviceControlModel(device_name, model_type)
-            # Do NOT pass preprocessor=preprocessor; let the model fit its own on the raw train split
-            print("DEBUG: Columns passed to train:", X_train_raw.columns.tolist())
-            model.train(X_train_raw, y_train, optimize=optimize)
-            metrics = model.evaluate(X_test_raw, y_test_dict[device_name])
+            began = time.perf_counter()
+            model.train(X_train, y_train, preprocessor=self.preprocessor, optimize=optimize, transformed=True)
+            timings["train"] += time.perf_counter() - began
+            began = time.perf_counter()
+            metrics = model.evaluate(X_test, y_test_dict[device_name], transformed=True)
+            timings["evaluate"] += time.perf_counter() - began
             # Değerlendirme başarısız olsa bile devam et
             # metrics sözlüğünde 'accuracy' anahtarı varsa kullan
             if metrics and 'accuracy' in metrics:
@@ -80,19 +208,38 @@ class SmartHomeModelManager:
                     'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 }
                 self.performance_data.append(performance_data)            # Modeli kaydet
-            try:
-                model.save_model()
-            except Exception as e:
-                self.logger.error(f"Model kaydetme hatası: {e}")
+            if save_models:
+                try:
+                    model.save_model()
+                except Exception as e:
+                    self.logger.error(f"Model kaydetme hatası: {e}")
             # Add model to self.models before deleting the local variable
             self.models[device_name] = model
     
+    def _shared_preprocessor(self):
+        """Tüm modellerin paylaştığı uydurulmuş önişlemciyi döndürür (paylaşılmıyorsa None)"""
+        if self.preprocessor is None or not hasattr(self.preprocessor, 'column_transformer'):
+            return None
+        if all(model.preprocessor is self.preprocessor for model in self.models.values()):
+            return self.preprocessor
+        return None
+    
     def predict_device_states(self, X):
-        """Predict device states using the pipeline for all models."""
+        """Predict device states for all models; the shared preprocessor transforms X only once."""
         predictions = {}
+        features = None
+        shared = self._shared_preprocessor()
+        if shared is not None:
+            try:
+                features = shared.transform(X)
+            except Exception as e:
+                self.logger.error(f"Error transforming features: {str(e)}")
         for device_name, model in self.models.items():
             try:
-                pred = model.predict(X)
+                if features is not None:
+                    pred = model.predict(features, transformed=True)
+                else:
+                    pred = model.predict(X)
                 # Handle both 1D and 2D prediction arrays
                 if hasattr(pred, 'shape') and len(pred.shape) > 0:
                     prediction_value = pred[0] if pred.shape[0] > 0 else False
@@ -101,7 +248,10 @@ class SmartHomeModelManager:
                 
                 # Get prediction probabilities
                 if hasattr(model, 'predict_proba'):
-                    proba = model.predict_proba(X)
+                    if features is not None:
+                        proba = model.predict_proba(features, transformed=True)
+                    else:
+                        proba = model.predict_proba(X)
                     # Handle probability array shape
                     if hasattr(proba, 'shape') and len(proba.shape) == 2:
                         prob = proba[0, 1] if proba.shape[1] > 1 else proba[0, 0]
@@ -115,7 +265,7 @@ class SmartHomeModelManager:
                 predictions[device_name] = {
                     'state': bool(prediction_value),
                     'probability': float(prob),
-                    'source': 'pipeline'
+                    'source': 'shared_preprocessor' if features is not None else 'pipeline'
                 }
             except Exception as e:
                 self.logger.error(f"Error predicting for {device_name}: {str(e)}")
@@ -162,9 +312,16 @@ class SmartHomeModelManager:
                 'last_training_time': model.last_training_time.isoformat() if model.last_training_time else None
             }
         
+        # Paylaşılan önişlemci ayrıca bir kez kaydedilir, yüklemede tüm modellere yeniden bağlanır
+        preprocessor_path = None
+        if self._shared_preprocessor() is not None:
+            preprocessor_path = os.path.join(directory, "trained", f"preprocessor_{timestamp}.joblib")
+            joblib.dump(self.preprocessor, preprocessor_path)
+        
         # Yönetici bilgilerini kaydet
         manager_info = {
             'models': models_info,
+            'preprocessor_path': preprocessor_path,
             'performance_summary': self.performance_summary,
             'timestamp': datetime.now().isoformat()
         }
@@ -206,6 +363,14 @@ class SmartHomeModelManager:
             else:
                 manager.logger.warning(f"Uyarı: {model_path} konumunda model bulunamadı, {device_name} için model yüklenemedi.")
         
+        # Paylaşılan önişlemci varsa tüm modeller aynı nesneyi kullanır
+        preprocessor_path = manager_info.get('preprocessor_path')
+        if preprocessor_path and os.path.exists(preprocessor_path):
+            manager.preprocessor = joblib.load(preprocessor_path)
+            for model in manager.models.values():
+                model.preprocessor = manager.preprocessor
+                model.pipeline = model.build_pipeline(manager.preprocessor)
+        
         manager.logger.info(f"{manager_path} konumundan model yöneticisi yüklendi - {len(manager.models)} model içeriyor")
         
         return manager
@@ -398,12 +563,8 @@ def test_model_manager():
     # Model yöneticisini yükle ve test et
     loaded_manager = SmartHomeModelManager.load_manager(manager_path)
     
-    # Örneki tahmin testi
-    # Veri işleme
-    X_train, X_test, y_train_dict, y_test_dict, _ = process_raw_data(csv_path, save_processed=False)
-    
-    # İlk satırı tahmin için kullan
-    sample_features = X_test.iloc[[0]]
+    # Örneki tahmin testi: eğitimde kullanılan veri seti yeniden okunmaz
+    sample_features = manager.dataset.X_test_raw.iloc[[0]]
     predictions = loaded_manager.predict_device_states(sample_features)
     
     print("\nCihaz Durumu Tahminleri:")
@@ -412,5 +573,18 @@ def test_model_manager():
     
     return loaded_manager
 
+def test_in_memory_training(days=3, seed=42):
+    """
+    Modelleri diske yazmadan üretilen veriyle eğitir ve aşama sürelerini yazdırır
+    """
+    manager = SmartHomeModelManager()
+    timings = manager.train_models_in_memory(days=days, seed=seed, chunk_size=288)
+    
+    print("\nCihaz doğrulukları:")
+    for device, summary in manager.performance_summary.items():
+        print(f"{device}: {summary['accuracy']:.4f}")
+    
+    return timings
+
 if __name__ == "__main__":
     test_model_manager()
\ No newline at end of file
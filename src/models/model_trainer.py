@@ -173,7 +173,24 @@ class DeviceControlModel:
         
         return optimized_pipeline
     
-    def train(self, X_train, y_train, preprocessor=None, optimize=False):
+    def train(self, X_train, y_train, preprocessor=None, optimize=False, transformed=False):
+        """
+        Modeli eğitir
+        
+        Args:
+            X_train: Ham eğitim satırları (transformed=True ise önişlemciden geçmiş özellik matrisi)
+            y_train: Eğitim hedef değişkeni
+            preprocessor (SmartHomeDataProcessor): Önişlemci (None ise eğitim verisine yeni bir tane uydurulur)
+            optimize (bool): Hiperparametre optimizasyonu yapılsın mı
+            transformed (bool): X_train, verilen uydurulmuş önişlemcinin çıktısı ise True.
+                Önişlemci yeniden uydurulmaz, yalnızca sınıflandırıcı eğitilir.
+            
+        Returns:
+            float: Eğitim doğruluğu
+        """
+        if transformed:
+            return self._train_on_features(X_train, y_train, preprocessor, optimize)
+        
         print("\n==================== START TRAIN ====================\n")
         self.logger.info(f"{self.device_name} için model eğitiliyor...")        # Drop target column from features if present
         if self.device_name in X_train.columns:
@@ -219,9 +236,60 @@ class DeviceControlModel:
         self.logger.info(f"{self.device_name} modeli eğitildi, doğruluk: {score:.4f}")
         print("\n==================== END TRAIN ====================\n")
         return score
+    
+    def _train_on_features(self, X_features, y_train, preprocessor, optimize=False):
+        """
+        Sınıflandırıcıyı, paylaşılan önişlemcinin ürettiği özellik matrisi üzerinde eğitir
+        
+        Args:
+            X_features: Önişlemciden geçmiş eğitim matrisi
+            y_train: Eğitim hedef değişkeni
+            preprocessor (SmartHomeDataProcessor): X_features'ı üreten uydurulmuş önişlemci
+            optimize (bool): Hiperparametre optimizasyonu yapılsın mı
+            
+        Returns:
+            float: Eğitim doğruluğu
+        """
+        if preprocessor is None:
+            raise ValueError("Dönüştürülmüş veriyle eğitim için uydurulmuş önişlemci gereklidir")
+        
+        self.logger.info(f"{self.device_name} için model paylaşılan özellik matrisiyle eğitiliyor...")
+        self.preprocessor = preprocessor
+        if optimize:
+            # Izgara yalnızca sınıflandırıcı parametrelerini içerir; önişlemci her katlamada yeniden uydurulmaz
+            param_grid = {name.replace('classifier__', '', 1): values
+                          for name, values in self.get_default_param_grid().items()}
+            grid_search = GridSearchCV(self.model, param_grid, cv=3, n_jobs=2, verbose=0)
+            grid_search.fit(X_features, y_train)
+            self.model = grid_search.best_estimator_
+            self.best_params = {f"classifier__{name}": value for name, value in grid_search.best_params_.items()}
+            self.logger.info(f"En iyi parametreler: {self.best_params}")
+        else:
+            self.model.fit(X_features, y_train)
+        
+        # Tek başına tahmin için önişlemci ve sınıflandırıcı yine bir pipeline olarak tutulur
+        self.pipeline = Pipeline([
+            ('preprocessor', self.preprocessor),
+            ('classifier', self.model)
+        ])
+        self.classes = self.model.classes_ if hasattr(self.model, 'classes_') else None
+        self.is_trained = True
+        score = self.model.score(X_features, y_train)
+        self.logger.info(f"{self.device_name} modeli eğitildi, doğruluk: {score:.4f}")
+        return score
+        
+    def evaluate(self, X_test, y_test, transformed=False):
+        """
+        Test verisi üzerinde modeli değerlendirir
         
-    def evaluate(self, X_test, y_test):
-        """Test verisi üzerinde modeli değerlendirir"""
+        Args:
+            X_test: Ham test satırları (transformed=True ise önişlemciden geçmiş özellik matrisi)
+            y_test: Test hedef değişkeni
+            transformed (bool): X_test önişlemcinin çıktısı ise True
+            
+        Returns:
+            dict: Metrikler
+        """
         self.logger.info(f"{self.device_name} modeli değerlendiriliyor...")
     
         # Model eğitilmiş mi kontrol et
@@ -230,8 +298,12 @@ class DeviceControlModel:
             return {"error": "Model not trained"}
         
         try:
+            # Paylaşılan önişlemcinin çıktısı doğrudan sınıflandırıcıya verilir
+            if transformed:
+                estimator = self.pipeline.named_steps['classifier']
+                y_pred = estimator.predict(X_test)
             # X_test raw data ise, preprocessing pipeline'ından geçir
-            if hasattr(X_test, 'columns') and 'timestamp' in X_test.columns:
+            elif hasattr(X_test, 'columns') and 'timestamp' in X_test.columns:
                 self.logger.info(f"X_test: raw data detected, applying preprocessing pipeline")
                 # Drop target column from features if present
                 if self.device_name in X_test.columns:
@@ -260,7 +332,7 @@ class DeviceControlModel:
                 if self.classes is not None and len(self.classes) == 2:
                     # predict_proba metodunu güvenli bir şekilde çağır
                     if hasattr(self.pipeline.named_steps['classifier'], 'predict_proba'):
-                        y_proba = self.pipeline.predict_proba(X_test)[:, 1]
+                        y_proba = self.predict_proba(X_test, transformed=transformed)[:, 1]
                         metrics["auc"] = roc_auc_score(y_test, y_proba)
             except Exception as e:
                 self.logger.error(f"AUC hesaplama hatası: {e}")
@@ -283,16 +355,20 @@ class DeviceControlModel:
                 "f1": None
             }
     
-    def predict(self, X):
+    def predict(self, X, transformed=False):
         if not hasattr(self, 'pipeline') or self.pipeline is None:
             raise ValueError("Model pipeline henüz eğitilmemiş.")
+        if transformed:
+            return self.pipeline.named_steps['classifier'].predict(X)
         return self.pipeline.predict(X)
     
-    def predict_proba(self, X):
+    def predict_proba(self, X, transformed=False):
         if not hasattr(self, 'pipeline') or self.pipeline is None:
             raise ValueError("Model pipeline henüz eğitilmemiş.")
         classifier = self.pipeline.named_steps['classifier']
         if hasattr(classifier, 'predict_proba'):
+            if transformed:
+                return classifier.predict_proba(X)
             return self.pipeline.predict_proba(X)
         else:
             raise AttributeError(f"Model {self.model_type} predict_proba metodunu desteklemiyor.")
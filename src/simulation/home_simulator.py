@@ -11,10 +11,13 @@ import logging
 
 # İç modülleri içe aktarma
 from src.data_simulation.data_generator import HomeDataGenerator
+from src.data_simulation.columnar_io import write_frame, apply_dtypes
+from src.data_simulation.run_length import RunLengthHistory
 from src.automation.rules_engine import RulesEngine, create_default_rules
 from src.models.model_manager import SmartHomeModelManager
 from src.utils.visualization import SimulationVisualizer
 from src.data_processing.preprocessing import process_raw_data
+from src.data_processing.online_features import OnlineFeatureExtractor
 
 class SmartHomeSimulator:
     """
@@ -58,8 +61,11 @@ class SmartHomeSimulator:
             time_step=time_step
         )
         
+        # Canlı özellik durumu: eğitimdeki pencere özellikleri her adımda artımlı güncellenir
+        self.feature_extractor = OnlineFeatureExtractor(self.data_generator.topology)
+        
         # Kural motoru başlat
-        self.rules_engine = RulesEngine(use_ml_model=use_ml)
+        self.rules_engine = RulesEngine(use_ml_model=use_ml, topology=self.data_generator.topology)
         
         # ML modelini yükle veya başlat
         self.ml_model_manager = None
@@ -68,8 +74,8 @@ class SmartHomeSimulator:
                 self.ml_model_manager = SmartHomeModelManager.load_manager(ml_model_path)
             # Model yoksa, simülasyon başlangıcında veri üretip model eğitilecektir.
         
-        # Veri kayıtları
-        self.history = []
+        # Veri kayıtları (bool kanallar yalnızca değiştiklerinde saklanır)
+        self.history = RunLengthHistory()
         self.decision_history = []
         
         # Görselleştirme
@@ -128,6 +134,9 @@ class SmartHomeSimulator:
         # Simüle edilmiş veriyi güncelle
         current_state = self.data_generator.update_simulation()
         
+        # Pencere özelliklerini yeni adımla güncelle (ML kullanılmasa da geçmiş tutulur)
+        self.feature_extractor.update(current_state)
+        
         # Mevcut cihaz durumlarını al
         device_states = {}
         for room in self.rooms:
@@ -277,12 +286,18 @@ class SmartHomeSimulator:
     
         self.logger.info("Simülasyon durduruldu")
     
-    def save_history(self, output_dir=None):
+    def save_history(self, output_dir=None, file_format="csv", run_length=False):
         """
-        Simülasyon geçmişini CSV dosyasına kaydeder
+        Simülasyon geçmişini CSV (veya ikili) dosyasına kaydeder
         
         Args:
             output_dir (str): Çıktı dizini
+            file_format (str): "csv", "parquet", "feather" veya "npz"; ikili biçimlerde
+                sensörler float32, cihazlar bool, konumlar kategori olarak saklanır
+            run_length (bool): npz'de bool sütunları değişim noktalarıyla sakla
+            
+        Returns:
+            str: Simülasyon geçmişi dosyasının yolu
         """
         if not self.history:
             self.logger.warning("Kaydedilecek simülasyon verisi yok")
@@ -296,22 +311,23 @@ class SmartHomeSimulator:
             os.makedirs(output_dir)
         
         # DataFrame oluştur
-        history_df = pd.DataFrame(self.history)
+        history_df = self.history.to_frame()
+        if file_format != "csv":
+            history_df = apply_dtypes(history_df, self.data_generator.topology)
         
         # Dosya adı
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        csv_filename = f"simulation_history_{timestamp}.csv"
-        csv_path = os.path.join(output_dir, csv_filename)
+        csv_path = os.path.join(output_dir, f"simulation_history_{timestamp}.{file_format}")
         
-        # CSV'ye kaydet
-        history_df.to_csv(csv_path, index=False)
+        # Dosyaya kaydet
+        csv_path = write_frame(history_df, csv_path, file_format, run_length=run_length)
         self.logger.info(f"Simülasyon geçmişi {csv_path} konumuna kaydedildi")
         
         # Karar geçmişini de kaydet
         if self.decision_history:
             decision_df = pd.DataFrame(self.decision_history)
-            decision_path = os.path.join(output_dir, f"decision_history_{timestamp}.csv")
-            decision_df.to_csv(decision_path, index=False)
+            decision_path = os.path.join(output_dir, f"decision_history_{timestamp}.{file_format}")
+            decision_path = write_frame(decision_df, decision_path, file_format)
             self.logger.info(f"Karar geçmişi {decision_path} konumuna kaydedildi")
         
         return csv_path
@@ -434,75 +450,16 @@ class SmartHomeSimulator:
                 result_df['dayofweek'] = now.weekday()
                 result_df['is_weekend'] = int(now.weekday() >= 5)
             
-            # Set up tracking for device and room features
-            device_cols = []
-            occupied_room_count = 0
-            
-            # Generate room-specific features
-            for room in self.rooms:
-                occupancy_col = f"{room}_Doluluk"
-                
-                # Time-based occupancy features if room occupancy is available
-                if occupancy_col in df.columns:
-                    is_occupied = df[occupancy_col].iloc[0] if not df.empty else False
-                    occupied_room_count += int(is_occupied)
-                    
-                    # Generate time-of-day occupancy flags
-                    result_df[f"{room}_SabahDoluluk"] = int(
-                        (6 <= result_df['hour'].iloc[0] < 9) and is_occupied)
-                        
-                    result_df[f"{room}_GündüzDoluluk"] = int(
-                        (9 <= result_df['hour'].iloc[0] < 17) and is_occupied)
-                        
-                    result_df[f"{room}_AkşamDoluluk"] = int(
-                        (17 <= result_df['hour'].iloc[0] < 22) and is_occupied)
-                        
-                    result_df[f"{room}_GeceDoluluk"] = int(
-                        ((result_df['hour'].iloc[0] >= 22) or 
-                         (result_df['hour'].iloc[0] < 6)) 
-                        and is_occupied)
-                else:
-                    # Default values if occupancy not available
-                    result_df[f"{room}_SabahDoluluk"] = 0
-                    result_df[f"{room}_GündüzDoluluk"] = 0
-                    result_df[f"{room}_AkşamDoluluk"] = 0
-                    result_df[f"{room}_GeceDoluluk"] = 0
-                
-                # Generate sensor statistics
-                for sensor in ["Sıcaklık", "Nem", "CO2", "Işık"]:
-                    sensor_col = f"{room}_{sensor}"
-                    if sensor_col in df.columns:
-                        sensor_val = df[sensor_col].iloc[0] if not df.empty else 0
-                        
-                        # Without historical data, use current value for mean
-                        result_df[f"{room}_{sensor}_Ort1Saat"] = sensor_val
-                        
-                        # Set std and change to 0 (no historical data)
-                        result_df[f"{room}_{sensor}_Std1Saat"] = 0
-                        result_df[f"{room}_{sensor}_Değişim"] = 0
-                    else:
-                        # Default values if sensor not available
-                        result_df[f"{room}_{sensor}_Ort1Saat"] = 0
-                        result_df[f"{room}_{sensor}_Std1Saat"] = 0
-                        result_df[f"{room}_{sensor}_Değişim"] = 0
-                
-                # Track active devices
-                for device_type in ["Klima", "Lamba", "Perde", "Havalandırma"]:
-                    device_col = f"{room}_{device_type}"
-                    if device_col in df.columns:
-                        device_cols.append(device_col)
-            
-            # Generate home-wide statistics
-            result_df["Evdeki_Kişi_Sayısı"] = self.num_residents  # Default to all residents
-            result_df["Aktif_Oda_Sayısı"] = occupied_room_count
-            
-            # Calculate active device count
-            device_count = 0
-            for col in device_cols:
-                if col in df.columns:
-                    device_count += int(df[col].iloc[0]) if not df.empty else 0
-                    
-            result_df["Çalışan_Cihaz_Sayısı"] = device_count
+            # Pencere özellikleri çevrimiçi durumdan okunur (eğitimdeki extract_custom_features ile aynı);
+            # henüz adım işlenmediyse geçmişi olmayan bir durumla yalnızca bu satırdan hesaplanır
+            features = self.feature_extractor.latest
+            if features is None:
+                state = df.iloc[0].to_dict() if not df.empty else {}
+                if 'timestamp' not in state:
+                    state['timestamp'] = datetime.now()
+                features = OnlineFeatureExtractor(self.data_generator.topology).update(state)
+            for name, value in features.items():
+                result_df[name] = value
             
             return result_df
             
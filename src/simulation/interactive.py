@@ -3,7 +3,6 @@ import time
 import argparse
 import os
 import logging
-import pandas as pd
 from datetime import datetime
 import sys
 from src.models.model_manager import SmartHomeModelManager
@@ -184,7 +183,7 @@ class InteractiveSimulation:
                 elif command == "report":
                     if self.simulator.history:
                         # DataFrame'e dönüştür
-                        history_df = pd.DataFrame(self.simulator.history)
+                        history_df = self.simulator.history.to_frame()
                         
                         # Rapor oluştur
                         self.logger.info("Rapor oluşturuluyor...")
@@ -0,0 +1,410 @@
+import re
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from src.config import config
+
+# Oda başına sensör kanalları (sütun adı: "<oda>_<kanal>")
+ROOM_CHANNELS = ["Sıcaklık", "Nem", "Işık", "CO2", "Hareket", "Doluluk"]
+
+# "Salon 2" gibi numaralandırılmış odaların türü sondaki numara atılarak bulunur
+_NUMBERED_ROOM = re.compile(r"^(.*?)\s+\d+$")
+
+_DEFAULT_TOPOLOGIES = {}
+
+# Sütun türleri: oda sensörü, cihaz, sakin konumu, zaman damgası ve diğerleri (ör. türetilmiş özellikler)
+COLUMN_KINDS = ("sensor", "device", "person", "time", "other")
+
+# column_index'in şema başına sakladığı en fazla dizin sayısı
+_COLUMN_INDEX_LIMIT = 64
+_COLUMN_INDEXES = OrderedDict()
+
+
+class HomeTopology:
+    """
+    Evin oda ve cihaz yapısını tek yerde tutan sınıf.
+    Oda türleri ve türlere göre cihaz ataması config'den bir kez okunur; odalara, cihaz
+    türlerine ve (oda, cihaz) çiftlerine tamsayı kimlikler verilir, "<oda>_<kanal>" sütun
+    adları önceden üretilir. Simülatörler, ön işleme ve otomasyon aynı nesneyi paylaşır ve
+    sütun/oda/cihaz aramalarını alt dize taraması yerine sözlük aramasıyla (O(1)) yapar.
+    """
+
+    def __init__(self, rooms=None, room_types=None, device_types=None, room_devices=None):
+        """
+        HomeTopology sınıfını başlatır
+
+        Args:
+            rooms (list): Oda adları (None ise config odaları)
+            room_types (dict): Oda türü -> o türdeki odalara konulan cihaz türleri (None ise config)
+            device_types (list): Cihaz türleri (None ise config["devices_per_room"])
+            room_devices (dict): Oda -> cihaz listesi; verilirse oda türlerinden türetilen atamanın yerine geçer
+        """
+        self.rooms = list(rooms or config["rooms"])
+        self.device_types = list(device_types or config["devices_per_room"])
+        self.room_types = dict(room_types or config["room_types"])
+
+        self.room_ids = {room: i for i, room in enumerate(self.rooms)}
+        self.device_type_ids = {device: k for k, device in enumerate(self.device_types)}
+        self.channels = ROOM_CHANNELS + self.device_types
+        self._channel_set = set(self.channels)
+
+        # Oda başına cihazlar (her zaman device_types sırasıyla)
+        self.room_devices = {}
+        for room in self.rooms:
+            if room_devices is not None:
+                allowed = set(room_devices.get(room, ()))
+            else:
+                allowed = set(self.room_types.get(self.room_type(room), ()))
+            self.room_devices[room] = [device for device in self.device_types if device in allowed]
+
+        self.device_mask = np.zeros((len(self.rooms), len(self.device_types)), dtype=bool)
+        self.devices = []
+        for i, room in enumerate(self.rooms):
+            for device in self.room_devices[room]:
+                self.device_mask[i, self.device_type_ids[device]] = True
+                self.devices.append((room, device))
+        self.device_ids = {pair: d for d, pair in enumerate(self.devices)}
+
+        # Sütun adları ve ters dizin
+        self._columns = {(room, channel): f"{room}_{channel}" for room in self.rooms for channel in self.channels}
+        self.column_ids = {column: pair for pair, column in self._columns.items()}
+
+    @classmethod
+    def from_columns(cls, columns, room_types=None, device_types=None):
+        """
+        Veri çerçevesi sütunlarından topoloji oluşturur (odalar ilk görüldükleri sırayla,
+        cihazlar yalnızca sütunu bulunanlar)
+
+        Args:
+            columns (iterable): Sütun adları
+            room_types (dict): Oda türleri (None ise config)
+            device_types (list): Cihaz türleri (None ise config)
+
+        Returns:
+            HomeTopology: Sütunlardan türetilen topoloji
+        """
+        device_types = list(device_types or config["devices_per_room"])
+        known_devices = set(device_types)
+        channels = set(ROOM_CHANNELS) | known_devices
+        rooms, room_devices = [], {}
+        for column in columns:
+            room, _, channel = str(column).rpartition("_")
+            if not room or channel not in channels:
+                continue
+            if room not in room_devices:
+                rooms.append(room)
+                room_devices[room] = []
+            if channel in known_devices:
+                room_devices[room].append(channel)
+        return cls(rooms, room_types=room_types, device_types=device_types, room_devices=room_devices)
+
+    def room_type(self, room):
+        """
+        Odanın türünü döndürür ("Salon 2" -> "Salon")
+
+        Args:
+            room (str): Oda adı
+
+        Returns:
+            str: Oda türü (bilinmiyorsa None)
+        """
+        if room in self.room_types:
+            return room
+        match = _NUMBERED_ROOM.match(room)
+        if match and match.group(1) in self.room_types:
+            return match.group(1)
+        return None
+
+    def column(self, room, channel):
+        """Oda ve kanal için sütun adını döndürür"""
+        return self._columns[(room, channel)]
+
+    def parse_column(self, column):
+        """
+        Sütun adını oda ve kanala ayırır
+
+        Args:
+            column (str): Sütun adı
+
+        Returns:
+            tuple: (oda, kanal); oda/kanal sütunu değilse None
+        """
+        pair = self.column_ids.get(column)
+        if pair is not None:
+            return pair
+        room, _, channel = str(column).rpartition("_")
+        if room and channel in self._channel_set:
+            return room, channel
+        return None
+
+    def is_device_column(self, column):
+        """Sütunun bir cihaz durumu sütunu olup olmadığını döndürür"""
+        pair = self.parse_column(column)
+        return pair is not None and pair[1] in self.device_type_ids
+
+    def has_device(self, room, device):
+        """Odada belirtilen cihazın olup olmadığını döndürür"""
+        return (room, device) in self.device_ids
+
+    def rooms_with(self, device):
+        """Belirtilen cihaza sahip odaları döndürür"""
+        return [room for room in self.rooms if (room, device) in self.device_ids]
+
+    def device_columns(self):
+        """Tüm cihaz sütunlarını oda sırasıyla döndürür"""
+        return [self._columns[pair] for pair in self.devices]
+
+    def channel_columns(self, channel, columns=None):
+        """
+        Tüm odalar için bir kanalın sütunlarını döndürür
+
+        Args:
+            channel (str): Kanal (sensör veya cihaz türü)
+            columns (iterable): Verilirse yalnızca bu sütunlar arasında bulunanlar döndürülür
+
+        Returns:
+            list: Sütun adları (oda sırasıyla)
+        """
+        names = [self._columns[(room, channel)] for room in self.rooms]
+        if columns is None:
+            return names
+        present = set(columns)
+        return [name for name in names if name in present]
+
+
+class ColumnIndex:
+    """
+    Bir şemanın (sütun listesinin) ayrıştırılmış dizini. Her sütun bir kez (oda, tür, kanal)
+    olarak çözülür ve türe, kanala ve odaya göre gruplanır; tüketiciler cihaz/oda sütunlarını
+    alt dize taraması yerine sözlük aramasıyla bulur. Şema başına bir kez column_index ile
+    oluşturulur ve paylaşılır; gruplar sütunların şemadaki sırasını korur.
+    """
+
+    def __init__(self, columns, topology=None):
+        """
+        ColumnIndex sınıfını başlatır
+
+        Args:
+            columns (iterable): Sütun adları
+            topology (HomeTopology): Sütunları çözmek için topoloji (None ise sütunlardan türetilir)
+        """
+        self.columns = list(columns)
+        self.topology = topology or HomeTopology.from_columns(self.columns)
+        self.entries = {}
+        self.kinds = {kind: [] for kind in COLUMN_KINDS}
+        self.channels = {}
+        self.rooms = []
+        self.room_channels = {}
+        for column in self.columns:
+            pair = self.topology.parse_column(column)
+            if pair is not None:
+                room, channel = pair
+                kind = "device" if channel in self.topology.device_type_ids else "sensor"
+                self.channels.setdefault(channel, []).append(column)
+                if room not in self.room_channels:
+                    self.rooms.append(room)
+                    self.room_channels[room] = {}
+                self.room_channels[room][channel] = column
+            else:
+                room = channel = None
+                name = str(column)
+                if name == "timestamp":
+                    kind = "time"
+                elif name.startswith("Kişi_") and name.endswith("_Konum"):
+                    kind = "person"
+                else:
+                    kind = "other"
+            self.entries[column] = (room, kind, channel)
+            self.kinds[kind].append(column)
+
+    def parse(self, column):
+        """
+        Sütunun (oda, tür, kanal) bilgisini döndürür
+
+        Args:
+            column (str): Sütun adı
+
+        Returns:
+            tuple: (oda, tür, kanal); oda/kanal sütunu değilse oda ve kanal None (şemada yoksa None)
+        """
+        return self.entries.get(column)
+
+    @property
+    def device_columns(self):
+        """Cihaz sütunları (şema sırasıyla)"""
+        return self.kinds["device"]
+
+    @property
+    def sensor_columns(self):
+        """Oda sensörü sütunları (şema sırasıyla)"""
+        return self.kinds["sensor"]
+
+    @property
+    def person_columns(self):
+        """Sakin konumu sütunları (şema sırasıyla)"""
+        return self.kinds["person"]
+
+    def channel_columns(self, channel):
+        """Bir kanalın (sensör veya cihaz türü) şemada bulunan sütunları"""
+        return self.channels.get(channel, [])
+
+    def room_device_columns(self, room):
+        """Odanın şemada bulunan cihaz sütunları"""
+        return [column for channel, column in self.room_channels.get(room, {}).items()
+                if channel in self.topology.device_type_ids]
+
+
+def column_index(columns, topology=None):
+    """
+    Şemanın ayrıştırılmış sütun dizinini döndürür. Aynı sütun listesi ve topoloji için dizin
+    yalnızca bir kez oluşturulur; en son kullanılan _COLUMN_INDEX_LIMIT dizin saklanır.
+
+    Args:
+        columns (iterable): Sütun adları
+        topology (HomeTopology): Sütunları çözmek için topoloji (None ise sütunlardan türetilir)
+
+    Returns:
+        ColumnIndex: Paylaşılan dizin
+    """
+    key = (tuple(columns), topology)
+    index = _COLUMN_INDEXES.get(key)
+    if index is None:
+        index = _COLUMN_INDEXES[key] = ColumnIndex(key[0], topology)
+        if len(_COLUMN_INDEXES) > _COLUMN_INDEX_LIMIT:
+            _COLUMN_INDEXES.popitem(last=False)
+    else:
+        _COLUMN_INDEXES.move_to_end(key)
+    return index
+
+
+def default_topology(rooms=None):
+    """
+    Config'den oluşturulan topolojiyi döndürür (aynı oda listesi için tek bir nesne paylaşılır)
+
+    Args:
+        rooms (list): Oda adları (None ise config odaları)
+
+    Returns:
+        HomeTopology: Paylaşılan topoloji
+    """
+    key = tuple(rooms or config["rooms"])
+    topology = _DEFAULT_TOPOLOGIES.get(key)
+    if topology is None:
+        topology = _DEFAULT_TOPOLOGIES[key] = HomeTopology(list(key))
+    return topology
+
+
+def benchmark_topology(room_counts=(5, 100, 1000), lookups=100000):
+    """
+    Alt dize taramasıyla ve topoloji diziniyle cihaz sütunu bulmayı karşılaştırır
+
+    Args:
+        room_counts (tuple): Denenecek oda sayıları
+        lookups (int): Topoloji üzerinde yapılacak tekil sütun araması sayısı
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    results = []
+    base_rooms = config["rooms"]
+    for count in room_counts:
+        rooms = [base_rooms[i % len(base_rooms)] if i < len(base_rooms)
+                 else f"{base_rooms[i % len(base_rooms)]} {i // len(base_rooms) + 1}" for i in range(count)]
+        began = time.perf_counter()
+        topology = HomeTopology(rooms)
+        build_seconds = time.perf_counter() - began
+        columns = ["timestamp"] + [topology.column(room, channel) for room in rooms for channel in topology.channels
+                                   if channel in ROOM_CHANNELS or topology.has_device(room, channel)]
+
+        began = time.perf_counter()
+        scanned = [column for column in columns
+                   if any(device in column for device in topology.device_types)]
+        scan_seconds = time.perf_counter() - began
+
+        began = time.perf_counter()
+        indexed = [column for column in columns if topology.is_device_column(column)]
+        index_seconds = time.perf_counter() - began
+
+        probe = columns[len(columns) // 2]
+        began = time.perf_counter()
+        for _ in range(lookups):
+            topology.parse_column(probe)
+        lookup_ns = (time.perf_counter() - began) / lookups * 1e9
+
+        result = {
+            "rooms": count,
+            "devices": len(topology.devices),
+            "build_ms": build_seconds * 1000,
+            "scan_ms": scan_seconds * 1000,
+            "index_ms": index_seconds * 1000,
+            "lookup_ns": lookup_ns,
+            "same_columns": scanned == indexed,
+        }
+        results.append(result)
+        print(f"{count:5d} oda | {result['devices']:5d} cihaz | kurulum: {result['build_ms']:7.2f} ms | "
+              f"tarama: {result['scan_ms']:7.2f} ms | dizin: {result['index_ms']:7.2f} ms | "
+              f"tekil arama: {result['lookup_ns']:5.0f} ns | aynı sonuç: {result['same_columns']}")
+    return results
+
+
+def benchmark_column_index(room_counts=(5, 100, 1000), repeats=20):
+    """
+    Alt dize taramalarıyla ve önbelleğe alınmış sütun diziniyle cihaz, kanal ve oda
+    sütunlarını bulmayı karşılaştırır
+
+    Args:
+        room_counts (tuple): Denenecek oda sayıları
+        repeats (int): Her yöntemin tekrar sayısı (dizin ilk çağrıda oluşturulur)
+
+    Returns:
+        list: Ölçüm sözlükleri
+    """
+    results = []
+    base_rooms = config["rooms"]
+    for count in room_counts:
+        rooms = [base_rooms[i % len(base_rooms)] if i < len(base_rooms)
+                 else f"{base_rooms[i % len(base_rooms)]} {i // len(base_rooms) + 1}" for i in range(count)]
+        topology = HomeTopology(rooms)
+        columns = ["timestamp"] + [topology.column(room, channel) for room in rooms for channel in topology.channels
+                                   if channel in ROOM_CHANNELS or topology.has_device(room, channel)]
+        columns += [f"Kişi_{i}_Konum" for i in range(1, 4)]
+
+        def scan():
+            devices = [column for column in columns if any(device in column for device in topology.device_types)]
+            temperatures = [column for column in columns if "Sıcaklık" in column]
+            per_room = {room: [column for column in columns if column.startswith(room + "_")
+                               and any(device in column for device in topology.device_types)] for room in rooms}
+            return devices, temperatures, per_room
+
+        def indexed():
+            index = column_index(columns, topology)
+            return (index.device_columns, index.channel_columns("Sıcaklık"),
+                    {room: index.room_device_columns(room) for room in rooms})
+
+        _COLUMN_INDEXES.clear()
+        timings = {}
+        for name, method in (("scan", scan), ("index", indexed)):
+            began = time.perf_counter()
+            for _ in range(repeats):
+                found = method()
+            timings[name] = (time.perf_counter() - began) / repeats
+            timings[name + "_result"] = found
+
+        result = {
+            "rooms": count,
+            "columns": len(columns),
+            "scan_ms": timings["scan"] * 1000,
+            "index_ms": timings["index"] * 1000,
+            "same_columns": timings["scan_result"] == timings["index_result"],
+        }
+        results.append(result)
+        print(f"{count:5d} oda | {len(columns):6d} sütun | tarama: {result['scan_ms']:9.2f} ms | "
+              f"dizin: {result['index_ms']:7.2f} ms | aynı sonuç: {result['same_columns']}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_topology()
+    benchmark_column_index()